@@ -0,0 +1,133 @@
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Dict, Optional, Type
+
+from sqlalchemy import insert
+
+from backend.config import settings
+from backend.database import engine
+from backend.models.models import LoginHistory
+
+
+class BatchWriter:
+    """Buffer rows in memory and write them to `model`'s table in bulk.
+    
+    A background thread flushes whenever `batch_size` rows are waiting or
+    `flush_interval` seconds have passed. At most `max_queue` rows are held;
+    further rows are dropped rather than slowing down requests.
+    """
+    
+    def __init__(self, model: Type, name: str, batch_size: int, flush_interval: float, max_queue: int):
+        self.model = model
+        self.name = name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.queued = 0
+        self.flushed = 0
+        self.dropped = 0
+        self._pending: deque = deque()
+        self._inflight: list = []  # Batch being written, still visible to `snapshot`
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+    
+    def start(self):
+        """Start the flush thread if it is not running."""
+        with self._cond:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name=f"{self.name}-writer", daemon=True)
+            self._thread.start()
+    
+    def enqueue_row(self, row: Dict) -> bool:
+        """Queue a row for insertion; returns False if it was dropped."""
+        with self._cond:
+            if self._stopping or len(self._pending) >= self.max_queue:
+                self.dropped += 1
+                return False
+            self._pending.append(row)
+            self.queued += 1
+            if len(self._pending) >= self.batch_size:
+                self._cond.notify()
+            started = self._thread is not None
+        if not started:
+            self.start()
+        return True
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._stopping and len(self._pending) < self.batch_size:
+                    self._cond.wait(self.flush_interval)
+                batch = [self._pending.popleft() for _ in range(min(self.batch_size, len(self._pending)))]
+                self._inflight = batch
+                finished = self._stopping and not self._pending
+            if batch:
+                self._flush(batch)
+                with self._cond:
+                    self._inflight = []
+            if finished:
+                return
+    
+    def _flush(self, batch: list):
+        """Insert a batch with a single executemany."""
+        try:
+            with engine.begin() as connection:
+                connection.execute(insert(self.model), batch)
+        except Exception as e:
+            print(f"Error writing {self.model.__tablename__}: {e}")
+            with self._cond:
+                self.dropped += len(batch)
+            return
+        with self._cond:
+            self.flushed += len(batch)
+    
+    def snapshot(self) -> list:
+        """Rows queued or being written but not yet committed, oldest first."""
+        with self._cond:
+            return self._inflight + list(self._pending)
+    
+    def stop(self, timeout: Optional[float] = None):
+        """Flush everything still queued and stop the thread."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+    
+    def stats(self) -> dict:
+        """Queue depth and row counters."""
+        return {
+            "pending": len(self._pending),
+            "queued": self.queued,
+            "flushed": self.flushed,
+            "dropped": self.dropped
+        }
+
+
+class LoginHistoryWriter(BatchWriter):
+    """Write login events to `login_history` in bulk."""
+    
+    def __init__(self, batch_size: int, flush_interval: float, max_queue: int):
+        super().__init__(LoginHistory, "login-history", batch_size, flush_interval, max_queue)
+    
+    def enqueue(self, user_id: int, ip_address: Optional[str] = None, user_agent: Optional[str] = None) -> bool:
+        """Record a login; returns False if the event was dropped."""
+        return self.enqueue_row({
+            "user_id": user_id,
+            "login_at": datetime.utcnow(),
+            "ip_address": ip_address,
+            "user_agent": user_agent
+        })
+
+
+# Singleton instance
+login_history_writer = LoginHistoryWriter(
+    batch_size=settings.LOGIN_HISTORY_BATCH_SIZE,
+    flush_interval=settings.LOGIN_HISTORY_FLUSH_SECONDS,
+    max_queue=settings.LOGIN_HISTORY_MAX_QUEUE
+)
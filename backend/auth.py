@@ -1,32 +1,24 @@
+import itertools
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from backend.cache import ProfileCache, create_cache_backend
 from backend.config import settings
-from backend.database import get_db
+from backend.database import get_db, get_async_db
 from backend.models.models import User
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_PREFIX}/auth/login")
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain password against a hashed password."""
-    return pwd_context.verify(plain_password, hashed_password)
-
-
-def get_password_hash(password: str) -> str:
-    """Hash a password for storing."""
-    return pwd_context.hash(password)
-
-
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -58,11 +50,79 @@ def decode_token(token: str) -> dict:
         return None
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
-    """Get the current authenticated user."""
+@dataclass(frozen=True)
+class Principal:
+    """Immutable snapshot of an authenticated user, safe to share between requests."""
+    id: int
+    email: str
+    name: str
+    role: Optional[str]
+    education: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            role=user.role,
+            education=user.education,
+            created_at=user.created_at,
+            updated_at=user.updated_at
+        )
+
+
+# Verified principals keyed by token signature, invalidated per user
+principal_cache = ProfileCache(
+    create_cache_backend("principal", settings.PRINCIPAL_CACHE_MAX_ENTRIES),
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+
+# Session.info key holding the ids of users changed in the open transaction;
+# None in the set stands for a bulk statement whose rows are unknown
+CHANGED_USERS_KEY = "changed_user_ids"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session, flush_context):
+    """Remember users updated or deleted by a flush until the transaction ends."""
+    changed = session.info.setdefault(CHANGED_USERS_KEY, set())
+    for obj in itertools.chain(session.dirty, session.deleted):
+        if isinstance(obj, User) and obj.id is not None:
+            changed.add(obj.id)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_user_changes(orm_execute_state):
+    """Bulk update()/delete() statements skip the flush, so mark all principals stale."""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    if orm_execute_state.bind_mapper is User.__mapper__:
+        orm_execute_state.session.info.setdefault(CHANGED_USERS_KEY, set()).add(None)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_principals(session):
+    """Drop cached principals of users changed by the committed transaction."""
+    changed = session.info.pop(CHANGED_USERS_KEY, set())
+    if None in changed:
+        principal_cache.clear()
+        return
+    for user_id in changed:
+        principal_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session):
+    """Rolled-back changes never reached the database, so keep the cache."""
+    session.info.pop(CHANGED_USERS_KEY, None)
+
+
+def _verify_token(token: str) -> Tuple[int, str, float]:
+    """Verify a token and return its user id, cache key and cache TTL."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -77,17 +137,81 @@ def get_current_user(
     if user_id is None:
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
-        raise credentials_exception
+    # Never cache a principal beyond its token's expiry
+    ttl = settings.PRINCIPAL_CACHE_TTL_SECONDS
+    if payload.get("exp") is not None:
+        ttl = min(ttl, payload["exp"] - time.time())
+    
+    return user_id, "principal:" + token.rsplit(".", 1)[-1], ttl
+
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> Principal:
+    """Get the current authenticated user."""
+    user_id, cache_key, ttl = _verify_token(token)
+    
+    def load_principal() -> Optional[Principal]:
+        user = db.query(User).filter(User.id == user_id).first()
+        return Principal.from_user(user) if user else None
+    
+    principal = principal_cache.get_or_compute(user_id, cache_key, load_principal, ttl=ttl)
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    return principal
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    """Get the current authenticated user through the async session."""
+    user_id, cache_key, ttl = _verify_token(token)
     
-    return user
+    async def load_principal() -> Optional[Principal]:
+        user = (await db.execute(select(User).where(User.id == user_id))).scalars().first()
+        return Principal.from_user(user) if user else None
+    
+    principal = await principal_cache.aget_or_compute(user_id, cache_key, load_principal, ttl=ttl)
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    return principal
+
+
+def _require_placement_team(principal: Principal) -> Principal:
+    if principal.email.lower() not in {email.lower() for email in settings.PLACEMENT_TEAM_EMAILS}:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Placement team access required"
+        )
+    return principal
+
+
+def get_placement_user(current_user: Principal = Depends(get_current_user)) -> Principal:
+    """Get the current user if they belong to the placement team."""
+    return _require_placement_team(current_user)
+
+
+async def get_placement_user_async(current_user: Principal = Depends(get_current_user_async)) -> Principal:
+    """Async counterpart of `get_placement_user`."""
+    return _require_placement_team(current_user)
 
 
 def get_current_user_optional(
     token: Optional[str] = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
-) -> Optional[User]:
+) -> Optional[Principal]:
     """Get the current user if authenticated, otherwise return None."""
     if token is None:
         return None
@@ -0,0 +1,300 @@
+import dataclasses
+import functools
+import pickle
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from backend.config import settings
+from backend.data_loaders.registry import dataset_registry
+
+# Values of these types are shared between callers as is; anything else is stored pickled
+IMMUTABLE_TYPES = (str, bytes, int, float, bool, frozenset, type(None))
+
+
+def _is_immutable(value: Any) -> bool:
+    if isinstance(value, IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, tuple):
+        return all(_is_immutable(item) for item in value)
+    return dataclasses.is_dataclass(value) and value.__dataclass_params__.frozen
+
+
+class CacheBackend:
+    """Interface for key/value stores used by the profile cache."""
+    
+    name = "base"
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value, or None if missing or expired."""
+        raise NotImplementedError
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value with an optional TTL in seconds."""
+        raise NotImplementedError
+    
+    def set_if_absent(self, key: str, value: Any) -> Any:
+        """Store a value unless the key exists; return the stored value."""
+        raise NotImplementedError
+    
+    def delete(self, key: str) -> None:
+        """Remove a key."""
+        raise NotImplementedError
+    
+    def clear(self) -> None:
+        """Remove all keys."""
+        raise NotImplementedError
+    
+    def stats(self) -> Dict[str, Any]:
+        """Backend specific counters."""
+        return {}
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU cache with per-entry TTL.
+    
+    Mutable values are pickled on `set` and unpickled on `get`, so every
+    caller gets its own copy, as with the Redis backend.
+    """
+    
+    name = "memory"
+    
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at, pickled = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return pickle.loads(value) if pickled else value
+    
+    @staticmethod
+    def _entry(value: Any, expires_at: Optional[float]) -> tuple:
+        if _is_immutable(value):
+            return value, expires_at, False
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL), expires_at, True
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        entry = self._entry(value, time.monotonic() + ttl if ttl else None)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict()
+    
+    def set_if_absent(self, key: str, value: Any) -> Any:
+        new_entry = self._entry(value, None)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = new_entry
+                self._evict()
+            else:
+                self._entries.move_to_end(key)
+        stored, _, pickled = entry
+        return pickle.loads(stored) if pickled else stored
+    
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+    
+    def _evict(self):
+        """Drop least recently used entries over capacity. Caller holds the lock."""
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        return {"size": len(self._entries), "evictions": self.evictions}
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache shared between workers through a Redis-compatible server."""
+    
+    name = "redis"
+    
+    def __init__(self, url: str, prefix: str = "lakshya:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package") from e
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+        self._error = redis.RedisError
+    
+    def get(self, key: str) -> Optional[Any]:
+        raw = self._client.get(self.prefix + key)
+        return pickle.loads(raw) if raw is not None else None
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self._client.set(self.prefix + key, pickle.dumps(value), px=max(1, int(ttl * 1000)) if ttl else None)
+    
+    def set_if_absent(self, key: str, value: Any) -> Any:
+        if self._client.set(self.prefix + key, pickle.dumps(value), nx=True):
+            return value
+        existing = self.get(key)
+        return existing if existing is not None else value
+    
+    def delete(self, key: str) -> None:
+        self._client.delete(self.prefix + key)
+    
+    def clear(self) -> None:
+        for key in self._client.scan_iter(match=self.prefix + "*"):
+            self._client.delete(key)
+    
+    def stats(self) -> Dict[str, Any]:
+        try:
+            info = self._client.info("stats")
+        except self._error:
+            # Not every Redis-compatible server implements INFO
+            return {}
+        return {"evictions": info.get("evicted_keys", 0)}
+
+
+class ProfileCache:
+    """Per-user memoization of profile-derived computations.
+    
+    Entries are keyed by user id, a profile version token and a namespace.
+    Invalidating a user rotates the version token, so every worker sharing
+    the backend stops seeing the old entries; they age out by LRU/TTL.
+    """
+    
+    def __init__(self, backend: CacheBackend, ttl: Optional[float] = None):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+    
+    def _version_key(self, user_id: int) -> str:
+        return f"profile_version:{user_id}"
+    
+    def get_version(self, user_id: int) -> str:
+        """Get the current profile version token for a user."""
+        version = self.backend.get(self._version_key(user_id))
+        if version is None:
+            version = self.backend.set_if_absent(self._version_key(user_id), uuid.uuid4().hex)
+        return version
+    
+    def invalidate(self, user_id: int) -> None:
+        """Invalidate every cached computation for a user."""
+        self.backend.set(self._version_key(user_id), uuid.uuid4().hex)
+        with self._lock:
+            self.invalidations += 1
+    
+    def _entry_key(self, user_id: int, namespace: str) -> str:
+        return f"profile:{user_id}:{self.get_version(user_id)}:{namespace}"
+    
+    def _lookup(self, key: str) -> Optional[Any]:
+        """Read an entry and count the hit or miss."""
+        value = self.backend.get(key)
+        with self._lock:
+            if value is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return value
+    
+    def _store(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        # A non-positive TTL means the value must not be cached at all
+        if value is not None and (ttl is None or ttl > 0):
+            self.backend.set(key, value, ttl)
+    
+    @staticmethod
+    def _namespace_key(namespace: str, args: tuple, kwargs: dict) -> str:
+        # Results computed from an older dataset version never match a newer one
+        namespace = f"{namespace}@{dataset_registry.fingerprint()}"
+        if args or kwargs:
+            return f"{namespace}:{args!r}:{sorted(kwargs.items())!r}"
+        return namespace
+    
+    def get_or_compute(
+        self, user_id: int, namespace: str, compute: Callable[[], Any], ttl: Optional[float] = None
+    ) -> Any:
+        """Return the cached value for a user, computing and storing it on a miss."""
+        key = self._entry_key(user_id, namespace)
+        value = self._lookup(key)
+        if value is None:
+            value = compute()
+            self._store(key, value, ttl)
+        return value
+    
+    async def aget_or_compute(
+        self, user_id: int, namespace: str, compute: Callable[[], Any], ttl: Optional[float] = None
+    ) -> Any:
+        """Async counterpart of `get_or_compute`; `compute` returns an awaitable."""
+        key = self._entry_key(user_id, namespace)
+        value = self._lookup(key)
+        if value is None:
+            value = await compute()
+            self._store(key, value, ttl)
+        return value
+    
+    def memoize(self, namespace: str) -> Callable:
+        """Decorate a `(db, user_id, ...)` service method to cache its result per user and dataset versions."""
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(db, user_id: int, *args, **kwargs):
+                return self.get_or_compute(
+                    user_id,
+                    self._namespace_key(namespace, args, kwargs),
+                    lambda: func(db, user_id, *args, **kwargs)
+                )
+            return wrapper
+        return decorator
+    
+    def amemoize(self, namespace: str) -> Callable:
+        """Async counterpart of `memoize` for `(db, user_id, ...)` coroutines."""
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            async def wrapper(db, user_id: int, *args, **kwargs):
+                return await self.aget_or_compute(
+                    user_id,
+                    self._namespace_key(namespace, args, kwargs),
+                    lambda: func(db, user_id, *args, **kwargs)
+                )
+            return wrapper
+        return decorator
+    
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self.backend.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters."""
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            **self.backend.stats()
+        }
+
+
+def create_cache_backend(namespace: str = "profile", max_entries: Optional[int] = None) -> CacheBackend:
+    """Create the cache backend selected by settings."""
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(settings.CACHE_REDIS_URL, prefix=f"lakshya:{namespace}:")
+    return MemoryCacheBackend(max_entries=max_entries or settings.CACHE_MAX_ENTRIES)
+
+
+# Singleton instance
+profile_cache = ProfileCache(create_cache_backend(), ttl=settings.CACHE_TTL_SECONDS)
@@ -0,0 +1,94 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Callable, Deque, Dict, List, Tuple
+
+from backend.audit import BatchWriter
+from backend.config import settings
+from backend.models.models import ChatMessage
+
+# (role, content) pairs, oldest first
+Turns = List[Tuple[str, str]]
+
+
+class ChatHistoryWriter(BatchWriter):
+    """Write chat messages to `chat_messages` in bulk, off the request path."""
+    
+    def __init__(self, batch_size: int, flush_interval: float, max_queue: int):
+        super().__init__(ChatMessage, "chat-history", batch_size, flush_interval, max_queue)
+    
+    def enqueue(self, user_id: int, role: str, content: str) -> bool:
+        """Record a message; returns False if it was dropped."""
+        return self.enqueue_row({
+            "user_id": user_id,
+            "role": role,
+            "content": content,
+            "timestamp": datetime.utcnow()
+        })
+    
+    def pending_for(self, user_id: int) -> List[Dict]:
+        """A user's messages that are not written yet, oldest first."""
+        return [row for row in self.snapshot() if row["user_id"] == user_id]
+
+
+class RecentContextCache:
+    """The last `window` messages of recently active users, for building prompts.
+    
+    A user's window is loaded from the database and then kept current as
+    messages are recorded in this worker. Windows are reloaded after `ttl`
+    seconds so messages served by other workers show up. At most
+    `max_users` windows are kept (LRU).
+    """
+    
+    def __init__(self, window: int, max_users: int, ttl: float = 30.0):
+        self.window = window
+        self.max_users = max_users
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._windows: "OrderedDict[int, Tuple[float, Deque[Tuple[str, str]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, user_id: int, load: Callable[[int], Turns]) -> Turns:
+        """Get a user's recent turns, calling `load(window)` on a miss or once the window expired."""
+        with self._lock:
+            entry = self._windows.get(user_id)
+            if entry is not None and entry[0] > time.monotonic():
+                self._windows.move_to_end(user_id)
+                self.hits += 1
+                return list(entry[1])
+            self.misses += 1
+        
+        loaded = deque(load(self.window), maxlen=self.window)
+        with self._lock:
+            entry = self._windows.get(user_id)
+            if entry is None or entry[0] <= time.monotonic():
+                entry = self._windows[user_id] = (time.monotonic() + self.ttl, loaded)
+            self._windows.move_to_end(user_id)
+            while len(self._windows) > self.max_users:
+                self._windows.popitem(last=False)
+            return list(entry[1])
+    
+    def append(self, user_id: int, role: str, content: str):
+        """Add a message to the user's window if it is loaded."""
+        with self._lock:
+            entry = self._windows.get(user_id)
+            if entry is not None:
+                entry[1].append((role, content))
+    
+    def stats(self) -> dict:
+        return {"users": len(self._windows), "hits": self.hits, "misses": self.misses}
+
+
+# Singleton instances
+chat_history_writer = ChatHistoryWriter(
+    batch_size=settings.CHAT_HISTORY_BATCH_SIZE,
+    flush_interval=settings.CHAT_HISTORY_FLUSH_SECONDS,
+    max_queue=settings.CHAT_HISTORY_MAX_QUEUE
+)
+recent_context = RecentContextCache(
+    window=settings.CHAT_CONTEXT_MESSAGES,
+    max_users=settings.CHAT_CONTEXT_MAX_USERS,
+    ttl=settings.CHAT_CONTEXT_TTL_SECONDS
+)
@@ -10,12 +10,41 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "sqlite:///./database/lakshya.db"
+    DB_MODE: str = "sync"  # sync or async
+    ASYNC_DATABASE_URL: Optional[str] = None  # Derived from DATABASE_URL when unset
+    
+    # Connection pool
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = True
+    
+    # SQLite connect-time pragmas
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_CACHE_SIZE: int = -64000  # Negative values are KiB
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
     
     # JWT
     SECRET_KEY: str = "your-super-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 300  # Upper bound; entries never outlive the token
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    
+    # Password hashing
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2  # 0 hashes inline in the request thread
+    PASSWORD_HASH_MAX_PENDING: int = 64  # Queued jobs before requests are rejected
+    PASSWORD_REHASH_ON_LOGIN: bool = False  # Rehash stored passwords whose cost differs
+    
+    # Login audit log
+    LOGIN_HISTORY_BATCH_SIZE: int = 200  # Rows per bulk insert
+    LOGIN_HISTORY_FLUSH_SECONDS: float = 1.0  # Longest time an event waits in memory
+    LOGIN_HISTORY_MAX_QUEUE: int = 10000  # Events beyond this are dropped
     
     # CORS
     CORS_ORIGINS: list = [
@@ -25,8 +54,75 @@ class Settings(BaseSettings):
         "http://127.0.0.1:3000",
     ]
     
+    # Chat model
+    LLM_BACKEND: str = "local"  # local (deterministic stand-in) or http
+    LLM_URL: str = "http://127.0.0.1:8001/v1/completions"  # OpenAI-compatible completions endpoint
+    LLM_MODEL: str = "career-mentor"
+    LLM_API_KEY: Optional[str] = None
+    LLM_MAX_TOKENS: int = 512
+    LLM_TIMEOUT_SECONDS: float = 30.0
+    LLM_POOL_CONNECTIONS: int = 16
+    LLM_MAX_CONCURRENCY: int = 8  # Batches and streams in flight per worker
+    LLM_MAX_PENDING: int = 256  # Queued prompts before requests are rejected
+    LLM_BATCH_SIZE: int = 8
+    LLM_BATCH_WAIT_MS: float = 5  # How long a prompt waits for others to share its batch
+    LOCAL_LLM_REQUEST_LATENCY_MS: float = 0  # Simulated cost per request of the local stand-in
+    LOCAL_LLM_TOKEN_LATENCY_MS: float = 0  # Simulated cost per generated word
+    
+    # Chat history
+    CHAT_HISTORY_BATCH_SIZE: int = 200  # Messages per bulk insert
+    CHAT_HISTORY_FLUSH_SECONDS: float = 0.5  # Longest time a message waits in memory
+    CHAT_HISTORY_MAX_QUEUE: int = 10000  # Messages beyond this are dropped
+    CHAT_CONTEXT_MESSAGES: int = 10  # Recent messages included in prompts
+    CHAT_CONTEXT_MAX_USERS: int = 10000  # Users whose recent messages are kept in memory
+    CHAT_CONTEXT_TTL_SECONDS: float = 30  # Windows are reloaded after this long to pick up other workers' messages
+    
+    # Chat response cache
+    CHAT_CACHE_ENABLED: bool = True
+    CHAT_CACHE_MAX_ENTRIES: int = 5000
+    CHAT_CACHE_TTL_SECONDS: int = 3600
+    CHAT_CACHE_SIMILARITY: float = 0.8  # Cosine similarity needed to reuse a reply
+    CHAT_CACHE_DIMENSIONS: int = 512  # Size of the hashed message vectors
+    
+    # Chat streaming
+    CHAT_STREAM_KEEPALIVE_SECONDS: float = 15  # Comment sent when no event is ready in this long
+    CHAT_STREAM_TIMEOUT_SECONDS: float = 120  # Streams are ended after this long
+    
+    # Cohort scoring
+    PLACEMENT_TEAM_EMAILS: list = []  # Accounts allowed to score cohorts
+    COHORT_MAX_USERS: int = 10000
+    COHORT_BATCH_SIZE: int = 500  # Users scored per sparse product
+    
+    # Offline precomputation
+    PRECOMPUTE_CHUNK_SIZE: int = 1000  # Users per worker task and per write transaction
+    PRECOMPUTE_WORKERS: int = 4  # 0 computes in the calling process
+    PRECOMPUTE_MAX_SECONDS: float = 3600  # Stop starting new chunks after this long
+    
+    # Course recommendations
+    RECOMMENDER_ROLES: int = 3  # Closest roles whose skill gaps are targeted
+    RECOMMENDER_COURSES_PER_SKILL: int = 200  # Bounds the relevance matrix whatever the catalog size
+    RECOMMENDER_MIN_RELEVANCE: float = 0.2  # Relative to the best course for a skill
+    
+    # Prediction snapshots
+    PREDICTION_RETENTION_COUNT: int = 5  # Snapshots kept per user
+    PREDICTION_RETENTION_DAYS: int = 90
+    
+    # Prerendered responses
+    PRERENDER_MAX_ENTRIES: int = 64
+    PRERENDER_GZIP_LEVEL: int = 9
+    PRERENDER_CACHE_CONTROL: str = "public, no-cache"  # Clients revalidate with If-None-Match
+    
+    # Profile cache
+    CACHE_BACKEND: str = "memory"  # memory or redis
+    CACHE_MAX_ENTRIES: int = 10000
+    CACHE_TTL_SECONDS: int = 300
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    
     # Dataset paths
     DATASET_PATH: str = "datasets"
+    COURSE_CATALOG_PATH: Optional[str] = None  # Compiled catalog; defaults to <DATASET_PATH>/compiled/courses
+    DATASET_WARMUP: bool = False  # Load datasets in the background at startup instead of on first use
+    DATASET_RELOAD_INTERVAL_SECONDS: float = 0  # Poll dataset files for changes; 0 disables hot reload
     
     class Config:
         env_file = ".env"
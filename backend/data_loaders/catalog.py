@@ -0,0 +1,195 @@
+import json
+import mmap
+import os
+import uuid
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+
+
+class StringColumn:
+    """Strings stored back to back in one UTF-8 buffer, addressed by an offsets array."""
+    
+    def __init__(self, offsets: np.ndarray, buffer: Union[bytes, mmap.mmap]):
+        self.offsets = offsets
+        self.buffer = buffer
+    
+    @classmethod
+    def from_values(cls, values: Iterable[str]) -> "StringColumn":
+        encoded = [value.encode("utf-8") for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        return cls(offsets, b"".join(encoded))
+    
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+    
+    def __getitem__(self, index: int) -> str:
+        return self.buffer[self.offsets[index]:self.offsets[index + 1]].decode("utf-8")
+
+
+class ColumnarCatalog:
+    """Read-only table stored column by column.
+    
+    Integer columns are numpy arrays and text columns are `StringColumn`s.
+    A catalog written with `write` is opened with `open`, which memory-maps
+    every file so workers on the same host share the pages.
+    """
+    
+    def __init__(self, columns: Dict[str, Any], num_rows: int):
+        self.columns = columns
+        self.num_rows = num_rows
+    
+    def __len__(self) -> int:
+        return self.num_rows
+    
+    @classmethod
+    def from_rows(cls, rows: List[Dict]) -> "ColumnarCatalog":
+        """Build an in-memory catalog from row dicts."""
+        names: List[str] = []
+        for row in rows:
+            for name in row:
+                if name not in names:
+                    names.append(name)
+        
+        columns = {}
+        for name in names:
+            values = [row.get(name) for row in rows]
+            if all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+                columns[name] = np.array(values, dtype=np.int64)
+            else:
+                columns[name] = StringColumn.from_values("" if value is None else str(value) for value in values)
+        return cls(columns, len(rows))
+    
+    def write(self, path: str, source: Optional[Dict] = None):
+        """Write the catalog to a directory.
+        
+        Column files carry a fresh build id, so replacing the manifest is the
+        only step readers can observe. Files listed by the previous manifest
+        are removed afterwards; readers that already mapped them keep the old
+        inodes.
+        """
+        os.makedirs(path, exist_ok=True)
+        previous = self.read_manifest(path)
+        build = uuid.uuid4().hex[:12]
+        manifest = {"format": FORMAT_VERSION, "build": build, "rows": self.num_rows, "source": source, "columns": []}
+        
+        for index, (name, column) in enumerate(self.columns.items()):
+            prefix = f"{build}.c{index}"
+            entry = {"name": name, "file": prefix}
+            if isinstance(column, StringColumn):
+                entry["kind"] = "str"
+                _write_string_column(path, prefix, column)
+            else:
+                entry["kind"] = "int"
+                _replace_file(path, f"{prefix}.npy", lambda f, column=column: np.save(f, column))
+            manifest["columns"].append(entry)
+        
+        _replace_file(path, MANIFEST_FILE, lambda f: f.write(json.dumps(manifest, indent=2).encode("utf-8")))
+        
+        if previous is not None:
+            for entry in previous["columns"]:
+                for name in _column_files(entry):
+                    try:
+                        os.remove(os.path.join(path, name))
+                    except FileNotFoundError:
+                        pass
+    
+    @staticmethod
+    def read_manifest(path: str) -> Optional[Dict]:
+        """Read a catalog manifest, or None if there is no usable catalog at `path`."""
+        try:
+            with open(os.path.join(path, MANIFEST_FILE), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return manifest if manifest.get("format") == FORMAT_VERSION else None
+    
+    @classmethod
+    def open(cls, path: str, manifest: Optional[Dict] = None) -> "ColumnarCatalog":
+        """Memory-map a catalog written by `write`."""
+        manifest = manifest or cls.read_manifest(path)
+        if manifest is None:
+            raise FileNotFoundError(f"No compiled catalog at {path}")
+        
+        columns = {}
+        for entry in manifest["columns"]:
+            prefix = os.path.join(path, entry["file"])
+            if entry["kind"] == "str":
+                columns[entry["name"]] = _open_string_column(prefix)
+            else:
+                columns[entry["name"]] = np.load(f"{prefix}.npy", mmap_mode="r")
+        return cls(columns, manifest["rows"])
+    
+    def value(self, name: str, index: int) -> Any:
+        column = self.columns[name]
+        return column[index] if isinstance(column, StringColumn) else int(column[index])
+    
+    def row(self, index: int) -> Dict[str, Any]:
+        """Materialize one row as a dict."""
+        return {name: self.value(name, index) for name in self.columns}
+    
+    def rows(self, indices: Iterable[int]) -> List[Dict[str, Any]]:
+        return [self.row(index) for index in indices]
+    
+    def records(self) -> "CatalogRecords":
+        """Lazy sequence of row dicts."""
+        return CatalogRecords(self)
+
+
+class CatalogRecords(Sequence):
+    """Sequence view over a catalog that builds row dicts on access."""
+    
+    def __init__(self, catalog: ColumnarCatalog):
+        self.catalog = catalog
+    
+    def __len__(self) -> int:
+        return len(self.catalog)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.catalog.rows(range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("catalog index out of range")
+        return self.catalog.row(index)
+
+
+def _replace_file(path: str, name: str, write) -> str:
+    """Write a file next to its target and rename it into place.
+    
+    Readers that already mapped the old file keep seeing the old inode.
+    """
+    target = os.path.join(path, name)
+    tmp_path = f"{target}.tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, target)
+    return name
+
+
+def _column_files(entry: Dict) -> List[str]:
+    """Names of the files holding one manifest column."""
+    if entry["kind"] == "str":
+        return [f"{entry['file']}.offsets.npy", f"{entry['file']}.bin"]
+    return [f"{entry['file']}.npy"]
+
+
+def _write_string_column(path: str, prefix: str, column: StringColumn) -> List[str]:
+    return [
+        _replace_file(path, f"{prefix}.offsets.npy", lambda f: np.save(f, column.offsets)),
+        _replace_file(path, f"{prefix}.bin", lambda f: f.write(bytes(column.buffer)))
+    ]
+
+
+def _open_string_column(prefix: str) -> StringColumn:
+    offsets = np.load(f"{prefix}.offsets.npy", mmap_mode="r")
+    with open(f"{prefix}.bin", "rb") as f:
+        # Zero-length files cannot be mapped
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size else b""
+    return StringColumn(offsets, buffer)
@@ -0,0 +1,138 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from backend.config import settings
+from backend.data_loaders.course_search import tokenize
+from backend.data_loaders.courses import CoursesLoader
+from backend.data_loaders.job_roles import JobRolesLoader, PRIORITY_LABELS, TARGET_LEVEL
+from backend.data_loaders.registry import dataset_registry
+
+# Skills named in a recommendation's reason
+REASON_SKILLS = 2
+
+
+class CourseRecommender:
+    """Rank courses by how much of a user's skill gaps they close.
+    
+    The relevance matrix holds, for every skill in the job roles vocabulary,
+    the BM25 score of each course that teaches it, scaled so the best course
+    for the skill is 1. Only the top RECOMMENDER_COURSES_PER_SKILL courses
+    per skill are kept, so a recommendation is one sparse product whose cost
+    is bounded by the vocabulary rather than the catalog.
+    """
+    
+    def __init__(self, courses: CoursesLoader, job_roles: JobRolesLoader):
+        self.courses = courses
+        self.job_roles = job_roles
+        self.relevance = self._build_relevance()
+    
+    def _build_relevance(self) -> csr_matrix:
+        rows, cols, values = [], [], []
+        for col, skill in enumerate(self.job_roles.skill_names):
+            _, hits = self.courses.search_index.search(
+                skill, limit=settings.RECOMMENDER_COURSES_PER_SKILL, prefix=False
+            )
+            # Multi-word skills such as "UI Design" need every word, not just "design"
+            hits = [hit for hit in hits if all(self._mentions(hit[0], term) for term in tokenize(skill))]
+            if not hits:
+                continue
+            best = hits[0][1]
+            for course_id, score in hits:
+                if score < best * settings.RECOMMENDER_MIN_RELEVANCE:
+                    break
+                rows.append(course_id)
+                cols.append(col)
+                values.append(score / best)
+        return csr_matrix(
+            (np.asarray(values, dtype=np.float32), (rows, cols)),
+            shape=(len(self.courses.catalog), len(self.job_roles.skill_names))
+        )
+    
+    def _mentions(self, course_id: int, term: str) -> bool:
+        posting = self.courses.search_index.postings.get(term)
+        if posting is None:
+            return False
+        docs = posting[0]
+        # Posting lists are in catalog order
+        position = np.searchsorted(docs, course_id)
+        return position < len(docs) and docs[position] == course_id
+    
+    def recommend(
+        self,
+        user_levels: Dict[str, float],
+        limit: int = 3,
+        exclude: Iterable[int] = ()
+    ) -> List[Dict]:
+        """Top courses for the gaps to the user's closest roles, with the skills each closes."""
+        urgency, role_ids = self.job_roles.get_gap_vector(user_levels, roles=settings.RECOMMENDER_ROLES)
+        if limit <= 0 or not urgency.any():
+            return []
+        
+        scores = self.relevance @ urgency
+        excluded = np.fromiter(exclude, dtype=np.int64)
+        scores[excluded[excluded < len(scores)]] = 0
+        candidates = np.flatnonzero(scores > 0)
+        top = candidates[JobRolesLoader._top_k(scores[candidates], limit)]
+        
+        current = np.minimum(self.job_roles.get_user_proficiency_vector(user_levels), 100.0)
+        recommended = []
+        for course_id in top:
+            start, end = self.relevance.indptr[course_id], self.relevance.indptr[course_id + 1]
+            skill_ids = self.relevance.indices[start:end]
+            contributions = self.relevance.data[start:end] * urgency[skill_ids]
+            closed = [skill_ids[i] for i in np.argsort(-contributions, kind="stable")[:REASON_SKILLS] if contributions[i] > 0]
+            course = self.courses.catalog.row(int(course_id))
+            recommended.append({
+                "id": int(course_id),
+                "title": course.get("Course Name", ""),
+                "reason": "Closes your " + " and ".join(
+                    f"{self.job_roles.skill_names[skill]} gap ({current[skill]:.0f} of {TARGET_LEVEL:.0f})"
+                    for skill in closed
+                ) + f" for {self._role_for(role_ids, closed[0])}",
+                "impact": self._impact(float(urgency[closed[0]])),
+                "score": round(float(scores[course_id]), 4),
+                "skills": [self.job_roles.skill_names[skill] for skill in closed]
+            })
+        return recommended
+    
+    def _role_for(self, role_ids: List[int], skill: int) -> str:
+        """The closest role that requires a skill."""
+        role_id = next((role_id for role_id in role_ids if self.job_roles.role_skill_matrix[role_id, skill]), role_ids[0])
+        return self.job_roles.data[role_id].get("Job Role") or ""
+    
+    @staticmethod
+    def _impact(urgency: float) -> str:
+        # Thresholds match the gap priorities in JobRolesLoader.get_skill_gaps
+        return str(PRIORITY_LABELS[0 if urgency >= 0.5 else 1 if urgency >= 0.25 else 2])
+    
+    def stats(self) -> Dict:
+        return {"courses": self.relevance.shape[0], "skills": self.relevance.shape[1], "nonzero": int(self.relevance.nnz)}
+
+
+# Recommenders by dataset versions; the previous one serves requests pinned to it
+_recommenders: "OrderedDict[str, CourseRecommender]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def get_course_recommender() -> CourseRecommender:
+    """Get the recommender for the courses and job roles versions the request sees."""
+    version = f"{dataset_registry.version('courses')}:{dataset_registry.version('job_roles')}"
+    with _lock:
+        recommender = _recommenders.get(version)
+        if recommender is not None:
+            _recommenders.move_to_end(version)
+            return recommender
+    
+    recommender = CourseRecommender(
+        dataset_registry.resolve("courses").loader,
+        dataset_registry.resolve("job_roles").loader
+    )
+    with _lock:
+        recommender = _recommenders.setdefault(version, recommender)
+        while len(_recommenders) > 2:
+            _recommenders.popitem(last=False)
+    return recommender
@@ -0,0 +1,145 @@
+import math
+import re
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend.data_loaders.catalog import ColumnarCatalog, StringColumn
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+[+#]*")
+
+# Query-side expansions for common abbreviations
+SYNONYMS: Dict[str, List[str]] = {
+    "js": ["javascript"],
+    "ts": ["typescript"],
+    "py": ["python"],
+    "k8s": ["kubernetes"],
+    "ml": ["machine", "learning"],
+    "ai": ["artificial", "intelligence"],
+    "dl": ["deep", "learning"],
+    "nlp": ["natural", "language", "processing"],
+    "db": ["database"],
+    "devops": ["docker", "kubernetes"],
+    "frontend": ["react", "javascript"],
+    "backend": ["api", "node"],
+}
+
+# Upper bound on index terms a query prefix expands to
+MAX_PREFIX_TERMS = 64
+
+# Field weights; a course name match counts twice as much as a category match
+SEARCH_FIELDS: Dict[str, float] = {
+    "Course Name": 2.0,
+    "Category": 1.0,
+    "Topics": 1.0,
+    "Skills": 1.0,
+    "Keyword": 1.0,
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase search terms, keeping suffixes like C++ and C#."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class CourseSearchIndex:
+    """Inverted index over catalog rows ranked with BM25.
+    
+    Per-field term counts are weighted by SEARCH_FIELDS before scoring. The
+    last query term also matches any indexed term it is a prefix of, so
+    partially typed queries return results.
+    """
+    
+    K1 = 1.2
+    B = 0.75
+    
+    def __init__(self, postings: Dict[str, Tuple[np.ndarray, np.ndarray]], doc_lengths: np.ndarray):
+        self.postings = postings
+        self.terms = sorted(postings)
+        self.doc_lengths = doc_lengths
+        self.num_docs = len(doc_lengths)
+        self.avg_length = float(doc_lengths.mean()) if self.num_docs else 0.0
+    
+    @classmethod
+    def build(cls, catalog: ColumnarCatalog) -> "CourseSearchIndex":
+        """Index the text columns of a catalog."""
+        fields = [
+            (catalog.columns[name], weight) for name, weight in SEARCH_FIELDS.items()
+            if isinstance(catalog.columns.get(name), StringColumn)
+        ]
+        
+        frequencies: Dict[str, Dict[int, float]] = {}
+        doc_lengths = np.zeros(len(catalog), dtype=np.float32)
+        for doc in range(len(catalog)):
+            for column, weight in fields:
+                value = column[doc]
+                if value.isdigit():
+                    # Counts such as "12" topics carry no meaning as text
+                    continue
+                for term in tokenize(value):
+                    counts = frequencies.setdefault(term, {})
+                    counts[doc] = counts.get(doc, 0.0) + weight
+                    doc_lengths[doc] += weight
+        
+        postings = {
+            term: (
+                np.fromiter(counts.keys(), dtype=np.int32, count=len(counts)),
+                np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+            )
+            for term, counts in frequencies.items()
+        }
+        return cls(postings, doc_lengths)
+    
+    def _expand(self, query: str, prefix: bool) -> List[List[str]]:
+        """Map a query to groups of index terms; a document scores the best term of each group."""
+        tokens = tokenize(query)
+        groups = []
+        for position, token in enumerate(tokens):
+            if prefix and position == len(tokens) - 1:
+                start = bisect_left(self.terms, token)
+                end = start
+                while end < len(self.terms) and self.terms[end].startswith(token):
+                    end += 1
+                expansions = self.terms[start:end]
+                if len(expansions) > MAX_PREFIX_TERMS:
+                    # Keep the most common completions
+                    expansions = sorted(expansions, key=lambda term: -len(self.postings[term][0]))[:MAX_PREFIX_TERMS]
+                groups.append(expansions)
+            else:
+                groups.append([token])
+            for synonym in SYNONYMS.get(token, []):
+                groups.append([synonym])
+        return groups
+    
+    def _term_scores(self, term: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        posting = self.postings.get(term)
+        if posting is None:
+            return None
+        docs, tf = posting
+        idf = math.log(1 + (self.num_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+        norm = self.K1 * (1 - self.B + self.B * self.doc_lengths[docs] / self.avg_length)
+        return docs, idf * tf * (self.K1 + 1) / (tf + norm)
+    
+    def search(
+        self, query: str, limit: Optional[int] = 20, offset: int = 0, prefix: bool = True
+    ) -> Tuple[int, List[Tuple[int, float]]]:
+        """Rank documents for a query; returns the match count and one page of (row, score)."""
+        if not self.num_docs:
+            return 0, []
+        
+        scores = np.zeros(self.num_docs, dtype=np.float32)
+        for group in self._expand(query, prefix):
+            best = np.zeros(self.num_docs, dtype=np.float32)
+            for term in group:
+                term_scores = self._term_scores(term)
+                if term_scores is not None:
+                    docs, values = term_scores
+                    best[docs] = np.maximum(best[docs], values)
+            scores += best
+        
+        matches = np.flatnonzero(scores > 0)
+        # Highest score first, catalog order among ties
+        order = matches[np.lexsort((matches, -scores[matches]))]
+        page = order[offset:offset + limit] if limit is not None else order[offset:]
+        return len(matches), [(int(doc), round(float(scores[doc]), 4)) for doc in page]
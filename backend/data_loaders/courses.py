@@ -1,30 +1,103 @@
 import os
 import csv
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence, Tuple
 from backend.config import settings
+from backend.data_loaders.catalog import ColumnarCatalog, MANIFEST_FILE
+from backend.data_loaders.course_search import CourseSearchIndex
+from backend.data_loaders.registry import dataset_registry
+
+NAME_COLUMN = "Course Name"
+
+
+def course_key(name: str) -> str:
+    """Stable key for a course: its name, lowercased with whitespace collapsed."""
+    return " ".join(str(name).lower().split())
 
 
 class CoursesLoader:
     """Load and process courses data from Coursera dataset."""
     
-    def __init__(self):
-        self.data = []
+    def __init__(self, strict: bool = False):
+        self.strict = strict
+        self.catalog: Optional[ColumnarCatalog] = None
+        self.data: Sequence[Dict] = []
         self._load_data()
     
+    @staticmethod
+    def _csv_path() -> str:
+        return os.path.join(settings.DATASET_PATH, "Coursera data set for courses", "CourseraDataset-Clean.csv")
+    
+    @staticmethod
+    def _catalog_path() -> str:
+        return settings.COURSE_CATALOG_PATH or os.path.join(settings.DATASET_PATH, "compiled", "courses")
+    
+    @staticmethod
+    def _source_stamp(csv_path: str) -> Optional[Dict]:
+        """Identify the CSV a compiled catalog was built from."""
+        if not os.path.exists(csv_path):
+            return None
+        stat = os.stat(csv_path)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    
     def _load_data(self):
-        """Load courses data from CSV file."""
-        csv_path = os.path.join(settings.DATASET_PATH, "Coursera data set for courses", "CourseraDataset-Clean.csv")
+        """Load courses from the compiled catalog, falling back to the CSV file."""
+        csv_path = self._csv_path()
+        catalog_path = self._catalog_path()
         
+        manifest = ColumnarCatalog.read_manifest(catalog_path)
+        if manifest is not None and manifest.get("source") == self._source_stamp(csv_path):
+            try:
+                self.catalog = ColumnarCatalog.open(catalog_path, manifest)
+            except Exception as e:
+                if self.strict:
+                    raise
+                print(f"Error opening compiled courses catalog: {e}")
+        elif manifest is not None:
+            print(f"Compiled courses catalog at {catalog_path} is stale, loading CSV instead")
+        
+        if self.catalog is None:
+            self.catalog = ColumnarCatalog.from_rows(self._read_rows(csv_path))
+        
+        self.data = self.catalog.records()
+        self._build_indexes()
+    
+    def _read_rows(self, csv_path: str) -> List[Dict]:
+        """Read courses data from CSV file."""
         if os.path.exists(csv_path):
             try:
                 with open(csv_path, 'r', encoding='utf-8') as f:
                     reader = csv.DictReader(f)
-                    self.data = list(reader)
+                    return list(reader)
             except Exception as e:
+                if self.strict:
+                    raise
                 print(f"Error loading courses data: {e}")
-                self.data = self._get_default_data()
-        else:
-            self.data = self._get_default_data()
+        return self._get_default_data()
+    
+    def _build_indexes(self):
+        """Build name, category and difficulty lookups over catalog row numbers."""
+        self._by_name: Dict[str, int] = {}
+        self._by_category: Dict[str, List[int]] = {}
+        self._by_difficulty: Dict[str, List[int]] = {}
+        
+        columns = self.catalog.columns
+        for index in range(len(self.catalog)):
+            if NAME_COLUMN in columns:
+                self._by_name.setdefault(course_key(self.catalog.value(NAME_COLUMN, index)), index)
+            category = self.catalog.value("Category", index) if "Category" in columns else ""
+            self._by_category.setdefault(str(category).lower(), []).append(index)
+            difficulty = self.catalog.value("Difficulty", index) if "Difficulty" in columns else "Beginner"
+            self._by_difficulty.setdefault(str(difficulty), []).append(index)
+        
+        self.search_index = CourseSearchIndex.build(self.catalog)
+    
+    def build_catalog(self, output_path: Optional[str] = None) -> str:
+        """Compile the CSV (or default data) into a memory-mappable catalog."""
+        csv_path = self._csv_path()
+        output_path = output_path or self._catalog_path()
+        catalog = ColumnarCatalog.from_rows(self._read_rows(csv_path))
+        catalog.write(output_path, source=self._source_stamp(csv_path))
+        return output_path
     
     def _get_default_data(self) -> List[Dict]:
         """Get default courses data if file not found."""
@@ -101,49 +174,69 @@ class CoursesLoader:
             }
         ]
     
-    def get_all_courses(self) -> List[Dict]:
+    def get_all_courses(self) -> Sequence[Dict]:
         """Get all courses."""
         return self.data
     
     def get_course_by_name(self, course_name: str) -> Optional[Dict]:
         """Get a specific course by name."""
-        for course in self.data:
-            if course.get("Course Name", "").lower() == course_name.lower():
-                return course
-        return None
+        index = self._by_name.get(course_key(course_name))
+        return self.catalog.row(index) if index is not None else None
+    
+    def get_course_id(self, course_name: str) -> Optional[int]:
+        """Get the catalog row number of a course by name or course key."""
+        return self._by_name.get(course_key(course_name))
+    
+    def get_course(self, course_id: int) -> Optional[Dict]:
+        """Get a course by catalog row number."""
+        return self.catalog.row(course_id) if 0 <= course_id < len(self.catalog) else None
     
     def get_courses_by_category(self, category: str) -> List[Dict]:
         """Get courses by category."""
-        return [c for c in self.data if c.get("Category", "").lower() == category.lower()]
+        return self.catalog.rows(self._by_category.get(category.lower(), []))
     
     def get_courses_by_skill(self, skill: str) -> List[Dict]:
-        """Get courses related to a specific skill."""
-        matching_courses = []
-        for course in self.data:
-            course_name = course.get("Course Name", "").lower()
-            if skill.lower() in course_name:
-                matching_courses.append(course)
-        return matching_courses
+        """Get courses related to a specific skill, best match first."""
+        _, hits = self.search_index.search(skill, limit=None)
+        return self.catalog.rows(index for index, _ in hits)
+    
+    def search_courses(self, query: str, limit: int = 20, offset: int = 0) -> Tuple[int, List[Tuple[int, float, Dict]]]:
+        """Full-text search; returns the match count and one page of (id, score, course)."""
+        total, hits = self.search_index.search(query, limit=limit, offset=offset)
+        return total, [(index, score, self.catalog.row(index)) for index, score in hits]
+    
+    def get_roadmap_course_ids(self) -> Dict[str, List[int]]:
+        """Get catalog row numbers organized by roadmap stage."""
+        advanced = sorted(
+            index
+            for difficulty, indices in self._by_difficulty.items()
+            if difficulty not in ("Beginner", "Intermediate")
+            for index in indices
+        )
+        return {
+            "Foundation": list(self._by_difficulty.get("Beginner", [])),
+            "Intermediate": list(self._by_difficulty.get("Intermediate", [])),
+            "Advanced": advanced
+        }
     
     def get_roadmap_courses(self) -> Dict[str, List[Dict]]:
         """Get courses organized by roadmap stage."""
-        roadmap = {
-            "Foundation": [],
-            "Intermediate": [],
-            "Advanced": []
-        }
-        
-        for course in self.data:
-            difficulty = course.get("Difficulty", "Beginner")
-            if difficulty == "Beginner":
-                roadmap["Foundation"].append(course)
-            elif difficulty == "Intermediate":
-                roadmap["Intermediate"].append(course)
-            else:
-                roadmap["Advanced"].append(course)
-        
-        return roadmap
+        return {stage: self.catalog.rows(indices) for stage, indices in self.get_roadmap_course_ids().items()}
 
 
 # Singleton instance
-courses_loader = CoursesLoader()
+courses_loader = dataset_registry.register(
+    "courses",
+    CoursesLoader,
+    size=lambda loader: len(loader.data),
+    sources=lambda: [
+        CoursesLoader._csv_path(),
+        os.path.join(CoursesLoader._catalog_path(), MANIFEST_FILE)
+    ],
+    reload_factory=lambda: CoursesLoader(strict=True)
+)
+
+
+if __name__ == "__main__":
+    path = courses_loader.build_catalog()
+    print(f"Wrote compiled courses catalog to {path}")
@@ -1,11 +1,75 @@
-from typing import List, Dict
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from backend.config import settings
+from backend.data_loaders.registry import dataset_registry
+
+EMPTY_IDS = np.zeros(0, dtype=np.int64)
 
 
 class InterviewQuestionsLoader:
     """Generate and manage interview questions."""
     
-    def __init__(self):
-        self.questions = self._get_default_questions()
+    def __init__(self, strict: bool = False):
+        self.strict = strict
+        self.questions: List[Dict] = []
+        self._load_data()
+        self._build_indexes()
+    
+    @staticmethod
+    def _json_path() -> str:
+        return os.path.join(settings.DATASET_PATH, "interview_questions.json")
+    
+    def _load_data(self):
+        """Load an imported question bank, falling back to the default questions."""
+        json_path = self._json_path()
+        questions = None
+        if os.path.exists(json_path):
+            try:
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    questions = json.load(f)
+            except Exception as e:
+                if self.strict:
+                    raise
+                print(f"Error loading interview questions: {e}")
+        
+        questions = questions or self._get_default_questions()
+        next_id = max((q["id"] for q in questions if isinstance(q.get("id"), int)), default=0) + 1
+        for question in questions:
+            if not isinstance(question.get("id"), int):
+                question["id"] = next_id
+                next_id += 1
+            question.setdefault("tags", [])
+        # Id order is the pagination order; the first question with an id wins
+        unique: Dict[int, Dict] = {}
+        for question in questions:
+            unique.setdefault(question["id"], question)
+        self.questions = sorted(unique.values(), key=lambda q: q["id"])
+    
+    def _build_indexes(self):
+        """Build id lookups and sorted id arrays per category, difficulty and tag."""
+        self.ids = np.fromiter((q["id"] for q in self.questions), dtype=np.int64, count=len(self.questions))
+        self._by_id: Dict[int, Dict] = {}
+        self._category_names: Dict[str, str] = {}
+        groups: Dict[str, Dict[str, List[int]]] = {"category": {}, "difficulty": {}, "tag": {}}
+        
+        for question in self.questions:
+            self._by_id[question["id"]] = question
+            category = question.get("category", "")
+            self._category_names.setdefault(category.lower(), category)
+            groups["category"].setdefault(category.lower(), []).append(question["id"])
+            groups["difficulty"].setdefault(question.get("difficulty", "").lower(), []).append(question["id"])
+            for tag in set(tag.lower() for tag in question.get("tags", [])):
+                groups["tag"].setdefault(tag, []).append(question["id"])
+        
+        # Questions are in id order, so every id list is already sorted
+        self._index = {
+            field: {key: np.asarray(ids, dtype=np.int64) for key, ids in values.items()}
+            for field, values in groups.items()
+        }
     
     def _get_default_questions(self) -> List[Dict]:
         """Get default interview questions."""
@@ -173,28 +237,64 @@ class InterviewQuestionsLoader:
         """Get all interview questions."""
         return self.questions
     
+    def _questions(self, ids: Iterable[int]) -> List[Dict]:
+        return [self._by_id[int(question_id)] for question_id in ids]
+    
     def get_questions_by_category(self, category: str) -> List[Dict]:
         """Get questions by category."""
-        return [q for q in self.questions if q.get("category", "").lower() == category.lower()]
+        return self._questions(self._index["category"].get(category.lower(), EMPTY_IDS))
     
     def get_questions_by_difficulty(self, difficulty: str) -> List[Dict]:
         """Get questions by difficulty."""
-        return [q for q in self.questions if q.get("difficulty", "").lower() == difficulty.lower()]
+        return self._questions(self._index["difficulty"].get(difficulty.lower(), EMPTY_IDS))
     
-    def get_question_by_id(self, question_id: int) -> Dict:
+    def get_question_by_id(self, question_id: int) -> Optional[Dict]:
         """Get a specific question by ID."""
-        for q in self.questions:
-            if q.get("id") == question_id:
-                return q
-        return None
+        return self._by_id.get(question_id)
+    
+    def find_questions(
+        self,
+        category: Optional[str] = None,
+        difficulty: Optional[str] = None,
+        tags: Iterable[str] = (),
+        after: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[List[Dict], Optional[int]]:
+        """Questions matching every filter, in id order after a cursor; returns a page and the next cursor."""
+        filters = [("tag", tag) for tag in tags]
+        if category is not None:
+            filters.append(("category", category))
+        if difficulty is not None:
+            filters.append(("difficulty", difficulty))
+        
+        candidates = sorted(
+            (self._index[field].get(value.lower(), EMPTY_IDS) for field, value in filters), key=len
+        )
+        # Walk the smallest id array and probe the others with binary search
+        ids = candidates[0] if candidates else self.ids
+        if after is not None:
+            ids = ids[np.searchsorted(ids, after, side="right"):]
+        for other in candidates[1:]:
+            if not len(ids) or not len(other):
+                ids = EMPTY_IDS
+                break
+            positions = np.minimum(np.searchsorted(other, ids), len(other) - 1)
+            ids = ids[other[positions] == ids]
+        
+        end = len(ids) if limit is None else min(limit, len(ids))
+        next_cursor = int(ids[end - 1]) if end < len(ids) else None
+        return self._questions(ids[:end]), next_cursor
     
     def get_categories(self) -> List[str]:
         """Get all unique categories."""
-        categories = set()
-        for q in self.questions:
-            categories.add(q.get("category"))
-        return sorted(list(categories))
+        return sorted(self._category_names.values())
 
 
 # Singleton instance
-interview_questions_loader = InterviewQuestionsLoader()
+interview_questions_loader = dataset_registry.register(
+    "interview_questions",
+    InterviewQuestionsLoader,
+    size=lambda loader: len(loader.questions),
+    sources=lambda: [InterviewQuestionsLoader._json_path()],
+    reload_factory=lambda: InterviewQuestionsLoader(strict=True)
+)
@@ -1,25 +1,56 @@
 import json
 import os
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
 from backend.config import settings
+from backend.data_loaders.registry import dataset_registry
+
+
+# Proficiency (0-100) a role's required skills are measured against
+TARGET_LEVEL = 90.0
+PRIORITY_LABELS = np.array(["High", "Medium", "Low"])
+EFFORT_LABELS = np.array(["4-6 weeks", "2-3 weeks", "1-2 weeks"])
+
+
+def normalize_skill(skill: str) -> str:
+    """Normalize a skill name for index lookups."""
+    return skill.strip().lower()
 
 
 class JobRolesLoader:
     """Load and process IT job roles and skills data."""
     
-    def __init__(self):
+    def __init__(self, strict: bool = False):
+        self.strict = strict
         self.data = []
+        self.skill_vocabulary: Dict[str, int] = {}
+        self.skill_names: List[str] = []
+        self.skill_importance = np.zeros(0, dtype=np.float32)
+        self.role_index: Dict[str, int] = {}
+        self.skill_postings: Dict[str, np.ndarray] = {}
+        self.role_skill_matrix = csr_matrix((0, 0), dtype=np.float32)
+        self.role_skill_counts = np.zeros(0, dtype=np.float64)
         self._load_data()
+        self._build_index()
+    
+    @staticmethod
+    def _json_path() -> str:
+        return os.path.join(settings.DATASET_PATH, "Top_207_IT_Job_Roles_Skills_Database.json")
     
     def _load_data(self):
         """Load job roles data from JSON file."""
-        json_path = os.path.join(settings.DATASET_PATH, "Top_207_IT_Job_Roles_Skills_Database.json")
+        json_path = self._json_path()
         
         if os.path.exists(json_path):
             try:
                 with open(json_path, 'r', encoding='utf-8') as f:
                     self.data = json.load(f)
             except Exception as e:
+                if self.strict:
+                    raise
                 print(f"Error loading job roles data: {e}")
                 self.data = self._get_default_data()
         else:
@@ -90,16 +121,140 @@ class JobRolesLoader:
             }
         ]
     
+    def _build_index(self):
+        """Build the skill vocabulary, role x skill matrix and posting lists."""
+        vocabulary: Dict[str, int] = {}
+        display_names: Dict[str, str] = {}
+        postings: Dict[str, List[int]] = {}
+        indptr = [0]
+        indices = []
+        
+        for role_idx, role in enumerate(self.data):
+            self.role_index.setdefault((role.get("Job Role") or "").lower(), role_idx)
+            role_skills = set()
+            for raw_skill in role.get("Skills", "").split(","):
+                skill = normalize_skill(raw_skill)
+                if skill:
+                    role_skills.add(skill)
+                    display_names.setdefault(skill, raw_skill.strip())
+            
+            for skill in sorted(role_skills):
+                col = vocabulary.setdefault(skill, len(vocabulary))
+                indices.append(col)
+                postings.setdefault(skill, []).append(role_idx)
+            indptr.append(len(indices))
+        
+        self.skill_vocabulary = vocabulary
+        self.skill_names = [display_names[skill] for skill in vocabulary]
+        self.skill_postings = {
+            skill: np.asarray(roles, dtype=np.int32) for skill, roles in postings.items()
+        }
+        self.role_skill_matrix = csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), indices, indptr),
+            shape=(len(self.data), len(vocabulary))
+        )
+        self.role_skill_counts = np.diff(self.role_skill_matrix.indptr).astype(np.float64)
+        # Share of roles requiring each skill
+        self.skill_importance = (
+            np.asarray(self.role_skill_matrix.sum(axis=0)).ravel() / max(len(self.data), 1)
+        ).astype(np.float32)
+    
+    def get_user_skill_vector(self, user_skills: List[str]) -> np.ndarray:
+        """Build a dense 0/1 vector of the user's skills over the skill vocabulary."""
+        vector = np.zeros(len(self.skill_vocabulary), dtype=np.float32)
+        for skill in user_skills:
+            col = self.skill_vocabulary.get(normalize_skill(skill))
+            if col is not None:
+                vector[col] = 1.0
+        return vector
+    
+    def get_user_proficiency_vector(self, user_levels: Dict[str, float]) -> np.ndarray:
+        """Build a dense vector of the user's proficiency (0-100) over the skill vocabulary."""
+        vector = np.zeros(len(self.skill_vocabulary), dtype=np.float32)
+        for skill, level in user_levels.items():
+            col = self.skill_vocabulary.get(normalize_skill(skill))
+            if col is not None:
+                vector[col] = max(vector[col], float(level or 0))
+        return vector
+    
+    def get_skill_gaps(self, user_levels: Dict[str, float], role_idx: int) -> List[Dict]:
+        """Gap, priority and effort for every skill a role requires, largest gap first."""
+        start, end = self.role_skill_matrix.indptr[role_idx], self.role_skill_matrix.indptr[role_idx + 1]
+        cols = self.role_skill_matrix.indices[start:end]
+        
+        current = np.minimum(self.get_user_proficiency_vector(user_levels)[cols], 100.0)
+        gap = np.maximum(TARGET_LEVEL - current, 0.0)
+        # Large gaps in skills that many roles share are the most urgent
+        importance = self.skill_importance[cols] / max(float(self.skill_importance.max(initial=0)), 1e-9)
+        urgency = gap / TARGET_LEVEL * (0.5 + 0.5 * importance)
+        priority = np.where(urgency >= 0.5, 0, np.where(urgency >= 0.25, 1, 2))
+        status = np.where(gap == 0, "completed", np.where(current == 0, "not-started", "in-progress"))
+        
+        order = np.argsort(-gap, kind="stable")
+        return [
+            {
+                "skill_name": self.skill_names[cols[i]],
+                "current_level": float(current[i]),
+                "target_level": TARGET_LEVEL,
+                "priority": str(PRIORITY_LABELS[priority[i]]),
+                "estimated_effort": str(EFFORT_LABELS[priority[i]]),
+                "gap_score": float(gap[i]),
+                "status": str(status[i])
+            }
+            for i in order
+        ]
+    
+    def get_gap_vector(self, user_levels: Dict[str, float], roles: int = 3) -> Tuple[np.ndarray, List[int]]:
+        """Urgency (0-1) of every skill gap across the user's closest roles, and those roles' indices."""
+        fits = self.get_role_fit(user_levels, limit=roles)
+        urgency = np.zeros(len(self.skill_vocabulary), dtype=np.float32)
+        if not fits:
+            return urgency, []
+        
+        role_ids = [fit["role_index"] for fit in fits]
+        required = np.asarray(self.role_skill_matrix[role_ids].max(axis=0).todense()).ravel()
+        current = np.minimum(self.get_user_proficiency_vector(user_levels), 100.0)
+        gap = np.maximum(TARGET_LEVEL - current, 0.0) / TARGET_LEVEL
+        # Same weighting as get_skill_gaps: shared skills are the most urgent
+        importance = self.skill_importance / max(float(self.skill_importance.max(initial=0)), 1e-9)
+        urgency = (gap * (0.5 + 0.5 * importance) * required).astype(np.float32)
+        return urgency, role_ids
+    
+    def get_role_fit(self, user_levels: Dict[str, float], limit: int = 5) -> List[Dict]:
+        """Score the user against every role at once; closest roles first.
+        
+        Each fit carries its row in `role_index`, since role names need not be unique.
+        """
+        if limit <= 0 or not len(self.data):
+            return []
+        
+        proficiency = self.get_user_proficiency_vector(user_levels)
+        attainment = np.minimum(proficiency, TARGET_LEVEL) / TARGET_LEVEL
+        counts = np.maximum(self.role_skill_counts, 1.0)
+        readiness = np.round((self.role_skill_matrix @ attainment).astype(np.float64) / counts * 100, 1)
+        matched = self.role_skill_matrix @ (proficiency > 0).astype(np.float32)
+        
+        top = self._top_k(readiness, limit)
+        return [
+            {
+                "role": self.data[i].get("Job Role") or "",
+                "role_index": int(i),
+                "readiness": float(readiness[i]),
+                "matched_skills": int(matched[i]),
+                "missing_skills": int(self.role_skill_counts[i] - matched[i]),
+                "demand": self.data[i].get("Demand", "Medium")
+            }
+            for i in top
+        ]
+    
     def get_all_roles(self) -> List[Dict]:
         """Get all job roles."""
         return self.data
     
     def get_role_by_name(self, role_name: str) -> Optional[Dict]:
         """Get a specific job role by name."""
-        for role in self.data:
-            if role.get("Job Role", "").lower() == role_name.lower():
-                return role
-        return None
+        role_idx = self.role_index.get(role_name.lower())
+        return self.data[role_idx] if role_idx is not None else None
     
     def get_roles_by_skill(self, skill: str) -> List[Dict]:
         """Get job roles that require a specific skill."""
@@ -138,22 +293,91 @@ class JobRolesLoader:
     
     def get_career_matches(self, user_skills: List[str], limit: int = 10) -> List[Dict]:
         """Get career matches sorted by match score."""
-        matches = []
-        for role in self.data:
-            score = self.calculate_match_score(user_skills, role)
-            if score > 0:
-                matches.append({
-                    "role": role.get("Job Role"),
-                    "match_percentage": score,
-                    "demand": role.get("Demand", "Medium"),
-                    "salary_range": role.get("Salary Range"),
-                    "skills": role.get("Skills", "")
-                })
-        
-        # Sort by match percentage descending
-        matches.sort(key=lambda x: x["match_percentage"], reverse=True)
-        return matches[:limit]
+        if limit <= 0:
+            return []
+        
+        # Only roles sharing at least one skill with the user can score above zero
+        user_postings = [
+            self.skill_postings[skill]
+            for skill in {normalize_skill(s) for s in user_skills}
+            if skill in self.skill_postings
+        ]
+        if not user_postings:
+            return []
+        candidates = np.unique(np.concatenate(user_postings))
+        
+        user_vector = self.get_user_skill_vector(user_skills)
+        matched = (self.role_skill_matrix[candidates] @ user_vector).astype(np.float64)
+        scores = np.round(matched / self.role_skill_counts[candidates] * 100, 1)
+        
+        top = self._top_k(scores, limit)
+        return [self._build_match(int(candidates[i]), float(scores[i])) for i in top]
+    
+    def get_career_matches_batch(self, user_skill_lists: List[List[str]], limit: int = 10) -> List[List[Dict]]:
+        """Career matches for many users with one users x skills by skills x roles product."""
+        if limit <= 0 or not user_skill_lists:
+            return [[] for _ in user_skill_lists]
+        
+        indptr = [0]
+        indices = []
+        for user_skills in user_skill_lists:
+            cols = {
+                self.skill_vocabulary[skill]
+                for skill in (normalize_skill(s) for s in user_skills)
+                if skill in self.skill_vocabulary
+            }
+            indices.extend(sorted(cols))
+            indptr.append(len(indices))
+        user_matrix = csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), indices, indptr),
+            shape=(len(user_skill_lists), len(self.skill_vocabulary))
+        )
+        
+        # Only non-zero entries are roles sharing a skill with the user
+        matched = (user_matrix @ self.role_skill_matrix.T).tocsr()
+        matched.sort_indices()
+        
+        results = []
+        for row in range(matched.shape[0]):
+            start, end = matched.indptr[row], matched.indptr[row + 1]
+            candidates = matched.indices[start:end]
+            scores = np.round(
+                matched.data[start:end].astype(np.float64) / self.role_skill_counts[candidates] * 100, 1
+            )
+            top = self._top_k(scores, limit)
+            results.append([self._build_match(int(candidates[i]), float(scores[i])) for i in top])
+        return results
+    
+    @staticmethod
+    def _top_k(scores: np.ndarray, limit: int) -> np.ndarray:
+        """Indices of the top `limit` scores, descending, ties kept in catalog order."""
+        if len(scores) > limit:
+            threshold = scores[np.argpartition(-scores, limit - 1)[limit - 1]]
+            above = np.flatnonzero(scores > threshold)
+            tied = np.flatnonzero(scores == threshold)[:limit - len(above)]
+            selected = np.concatenate([above, tied])
+        else:
+            selected = np.arange(len(scores))
+        
+        return selected[np.lexsort((selected, -scores[selected]))]
+    
+    def _build_match(self, role_idx: int, score: float) -> Dict:
+        """Build a career match dict for a role."""
+        role = self.data[role_idx]
+        return {
+            "role": role.get("Job Role"),
+            "match_percentage": score,
+            "demand": role.get("Demand", "Medium"),
+            "salary_range": role.get("Salary Range"),
+            "skills": role.get("Skills", "")
+        }
 
 
 # Singleton instance
-job_roles_loader = JobRolesLoader()
+job_roles_loader = dataset_registry.register(
+    "job_roles",
+    JobRolesLoader,
+    size=lambda loader: len(loader.data),
+    sources=lambda: [JobRolesLoader._json_path()],
+    reload_factory=lambda: JobRolesLoader(strict=True)
+)
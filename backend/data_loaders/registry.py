@@ -0,0 +1,260 @@
+import hashlib
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+class DatasetVersion(NamedTuple):
+    """A loaded dataset together with the source version it was built from."""
+    loader: Any
+    version: str
+
+
+# Datasets already resolved by the current request
+_pinned: ContextVar[Optional[Dict[str, DatasetVersion]]] = ContextVar("pinned_datasets", default=None)
+
+
+class DatasetRegistry:
+    """Build dataset loaders on first use instead of at import time.
+    
+    Each dataset is constructed at most once, under its own lock, so
+    concurrent first requests wait for a single load rather than repeating it.
+    
+    Loaders are treated as immutable. A reload builds a new instance off the
+    request path and swaps the reference, so a request pinned with `pinned()`
+    keeps the version it first saw while new requests get the new one.
+    """
+    
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._reload_factories: Dict[str, Callable[[], Any]] = {}
+        self._sizers: Dict[str, Callable[[Any], int]] = {}
+        self._sources: Dict[str, Callable[[], List[str]]] = {}
+        self._current: Dict[str, DatasetVersion] = {}
+        self._failed_versions: Dict[str, str] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._reload_hooks: List[Callable[[str], None]] = []
+        self._pending_versions: Dict[str, str] = {}
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
+    
+    def register(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        size: Optional[Callable[[Any], int]] = None,
+        sources: Optional[Callable[[], List[str]]] = None,
+        reload_factory: Optional[Callable[[], Any]] = None
+    ) -> "LazyDataset":
+        """Register a dataset and return a proxy that loads it on first attribute access.
+        
+        `sources` lists the files the dataset is built from; changes to them
+        trigger a reload while the registry is watching. `reload_factory` is
+        used for reloads and should raise on bad input rather than fall back,
+        so the previous version stays in place.
+        """
+        self._factories[name] = factory
+        self._reload_factories[name] = reload_factory or factory
+        self._sizers[name] = size or (lambda loader: 0)
+        self._sources[name] = sources or (lambda: [])
+        self._locks[name] = threading.Lock()
+        return LazyDataset(self, name)
+    
+    def source_version(self, name: str) -> str:
+        """Fingerprint of a dataset's source files (path, size and mtime)."""
+        parts = []
+        for path in self._sources[name]():
+            try:
+                stat = os.stat(path)
+                parts.append(f"{path}:{stat.st_size}:{stat.st_mtime_ns}")
+            except OSError:
+                parts.append(f"{path}:missing")
+        return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()[:16]
+    
+    def _build(self, name: str, factory: Callable[[], Any]) -> Tuple[DatasetVersion, Dict[str, Any]]:
+        """Construct a dataset without publishing it; returns it with its load stats."""
+        version = self.source_version(name)
+        started = time.perf_counter()
+        loader = factory()
+        load_stats = {
+            "load_seconds": round(time.perf_counter() - started, 4),
+            "records": self._sizers[name](loader)
+        }
+        return DatasetVersion(loader, version), load_stats
+    
+    def _publish(self, name: str, built: DatasetVersion, load_stats: Dict[str, Any]):
+        """Swap in a built dataset. Caller holds the dataset lock."""
+        previous = self._stats.get(name, {})
+        self._current[name] = built
+        self._stats[name] = {
+            "version": built.version,
+            **load_stats,
+            "loaded_at": time.time(),
+            "reloads": previous.get("reloads", -1) + 1
+        }
+    
+    def current(self, name: str) -> DatasetVersion:
+        """Return a dataset and its version, loading it if this is the first use."""
+        entry = self._current.get(name)
+        if entry is None:
+            with self._locks[name]:
+                entry = self._current.get(name)
+                if entry is None:
+                    entry, load_stats = self._build(name, self._factories[name])
+                    self._publish(name, entry, load_stats)
+        return entry
+    
+    def get(self, name: str) -> Any:
+        """Return a dataset, loading it if this is the first use."""
+        return self.current(name).loader
+    
+    def resolve(self, name: str) -> DatasetVersion:
+        """Return a dataset, reusing the version already seen by the current request."""
+        pinned = _pinned.get()
+        if pinned is None:
+            return self.current(name)
+        entry = pinned.get(name)
+        if entry is None:
+            entry = pinned[name] = self.current(name)
+        return entry
+    
+    @contextmanager
+    def pinned(self):
+        """Keep every dataset resolved inside the block at a single version."""
+        token = _pinned.set({})
+        try:
+            yield
+        finally:
+            _pinned.reset(token)
+    
+    def version(self, name: str) -> str:
+        """Source version of the dataset the current request sees."""
+        return self.resolve(name).version
+    
+    def fingerprint(self) -> str:
+        """Versions of every registered dataset as the current request sees them.
+        
+        Loaded datasets are resolved (and so pinned); the others are
+        identified by their source files without loading them.
+        """
+        return ":".join(
+            self.version(name) if self.is_loaded(name) else self.source_version(name)
+            for name in sorted(self._factories)
+        )
+    
+    def is_loaded(self, name: str) -> bool:
+        return name in self._current
+    
+    def on_reload(self, hook: Callable[[str], None]):
+        """Call `hook(name)` after a dataset has been swapped."""
+        self._reload_hooks.append(hook)
+    
+    def reload(self, name: str):
+        """Rebuild a dataset and swap it in; requests keep using the old one until then."""
+        built, load_stats = self._build(name, self._reload_factories[name])
+        with self._locks[name]:
+            self._publish(name, built, load_stats)
+        for hook in self._reload_hooks:
+            hook(name)
+    
+    def check_for_changes(self) -> List[str]:
+        """Reload loaded datasets whose sources changed; returns the reloaded names.
+        
+        A change must be seen unchanged on two consecutive checks before it is
+        loaded, so a file that is still being written is not picked up.
+        """
+        reloaded = []
+        for name, entry in list(self._current.items()):
+            current = self.source_version(name)
+            if current in (entry.version, self._failed_versions.get(name)):
+                self._pending_versions.pop(name, None)
+                continue
+            if self._pending_versions.get(name) != current:
+                self._pending_versions[name] = current
+                continue
+            self._pending_versions.pop(name, None)
+            try:
+                self.reload(name)
+                reloaded.append(name)
+            except Exception as e:
+                print(f"Error reloading dataset {name}: {e}")
+                # Do not retry until the files change again
+                self._failed_versions[name] = current
+        return reloaded
+    
+    def start_watching(self, interval: float):
+        """Poll dataset sources for changes on a daemon thread."""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop_watching.clear()
+        
+        def watch():
+            while not self._stop_watching.wait(interval):
+                self.check_for_changes()
+        
+        self._watcher = threading.Thread(target=watch, name="dataset-watcher", daemon=True)
+        self._watcher.start()
+    
+    def stop_watching(self):
+        self._stop_watching.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+    
+    def warm_up(self, names: Optional[Iterable[str]] = None):
+        """Load the given datasets, or all registered ones."""
+        for name in names or list(self._factories):
+            self.get(name)
+    
+    def warm_up_in_background(self, names: Optional[Iterable[str]] = None) -> threading.Thread:
+        """Load datasets on a daemon thread so startup does not wait for them."""
+        thread = threading.Thread(target=self.warm_up, args=(names,), name="dataset-warm-up", daemon=True)
+        thread.start()
+        return thread
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Version, load time and record count per dataset."""
+        return {
+            name: {"loaded": name in self._current, **self._stats.get(name, {})}
+            for name in self._factories
+        }
+
+
+class LazyDataset:
+    """Stand-in for a loader singleton that resolves through the registry."""
+    
+    __slots__ = ("_registry", "_name")
+    
+    def __init__(self, registry: DatasetRegistry, name: str):
+        self._registry = registry
+        self._name = name
+    
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._registry.resolve(self._name).loader, attribute)
+    
+    def __repr__(self) -> str:
+        state = "loaded" if self._registry.is_loaded(self._name) else "not loaded"
+        return f"<LazyDataset {self._name} ({state})>"
+
+
+class PinnedDatasetsMiddleware:
+    """ASGI middleware that pins dataset versions for the duration of each request."""
+    
+    def __init__(self, app, registry: Optional[DatasetRegistry] = None):
+        self.app = app
+        self.registry = registry or dataset_registry
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with self.registry.pinned():
+            await self.app(scope, receive, send)
+
+
+# Singleton instance
+dataset_registry = DatasetRegistry()
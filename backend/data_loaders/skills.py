@@ -1,11 +1,16 @@
 from typing import List, Dict, Optional
 
+from backend.data_loaders.registry import dataset_registry
+
 
 class SkillsLoader:
     """Load and process skills data."""
     
     def __init__(self):
         self.skills = self._get_default_skills()
+        self._by_name = {}
+        for skill in self.skills:
+            self._by_name.setdefault(skill.get("name", "").lower(), skill)
     
     def _get_default_skills(self) -> List[Dict]:
         """Get default skills data."""
@@ -66,10 +71,7 @@ class SkillsLoader:
     
     def get_skill_by_name(self, name: str) -> Optional[Dict]:
         """Get a specific skill by name."""
-        for skill in self.skills:
-            if skill.get("name", "").lower() == name.lower():
-                return skill
-        return None
+        return self._by_name.get(name.lower())
     
     def get_all_categories(self) -> List[str]:
         """Get all unique categories."""
@@ -122,4 +124,4 @@ class SkillsLoader:
 
 
 # Singleton instance
-skills_loader = SkillsLoader()
+skills_loader = dataset_registry.register("skills", SkillsLoader, size=lambda loader: len(loader.skills))
@@ -0,0 +1,163 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from passlib.context import CryptContext
+
+from backend.config import settings
+
+# Password hashing; hashes below or above the configured cost are flagged by needs_update
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(password, hashed_password)
+
+
+class PasswordHasherBusyError(RuntimeError):
+    """Raised when too many hashing jobs are already queued."""
+
+
+class PasswordHasher:
+    """Run bcrypt in a bounded process pool instead of the request thread.
+    
+    At most `max_pending` jobs may be queued or running; further requests are
+    rejected immediately with PasswordHasherBusyError. With `max_workers=0`
+    hashing runs inline in the caller.
+    """
+    
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._callbacks: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+    
+    def _get_callback_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._callbacks is None:
+                self._callbacks = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rehash")
+            return self._callbacks
+    
+    def _submit(self, fn: Callable, *args) -> Future:
+        """Queue a job, rejecting it when the pool is saturated."""
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise PasswordHasherBusyError("Too many authentication requests, try again shortly")
+            self.pending += 1
+        
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except Exception:
+            self._job_done(None)
+            raise
+        future.add_done_callback(self._job_done)
+        return future
+    
+    def _job_done(self, future: Optional[Future]):
+        with self._lock:
+            self.pending -= 1
+            if future is not None:
+                self.completed += 1
+    
+    def hash(self, password: str) -> str:
+        """Hash a password, blocking the caller until done."""
+        if self.max_workers <= 0:
+            return _hash(password)
+        return self._submit(_hash, password).result()
+    
+    def verify(self, password: str, hashed_password: str) -> bool:
+        """Verify a password, blocking the caller until done."""
+        if self.max_workers <= 0:
+            return _verify(password, hashed_password)
+        return self._submit(_verify, password, hashed_password).result()
+    
+    async def hash_async(self, password: str) -> str:
+        """Hash a password without blocking the event loop."""
+        if self.max_workers <= 0:
+            return await asyncio.to_thread(_hash, password)
+        return await asyncio.wrap_future(self._submit(_hash, password))
+    
+    async def verify_async(self, password: str, hashed_password: str) -> bool:
+        """Verify a password without blocking the event loop."""
+        if self.max_workers <= 0:
+            return await asyncio.to_thread(_verify, password, hashed_password)
+        return await asyncio.wrap_future(self._submit(_verify, password, hashed_password))
+    
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Whether a stored hash was made with a different cost than configured."""
+        return settings.PASSWORD_REHASH_ON_LOGIN and pwd_context.needs_update(hashed_password)
+    
+    def rehash_in_background(self, password: str, on_done: Callable[[str], None]) -> bool:
+        """Hash a password off the request path and pass the result to `on_done`.
+        
+        `on_done` runs on a dedicated thread rather than the pool's result
+        thread, so a slow callback never delays other hashing results.
+        Returns False if the pool is saturated; rehashing is best effort.
+        """
+        if self.max_workers <= 0:
+            return False
+        try:
+            future = self._submit(_hash, password)
+        except PasswordHasherBusyError:
+            return False
+        
+        def deliver(done: Future):
+            if done.exception() is None:
+                self._get_callback_executor().submit(on_done, done.result())
+        
+        future.add_done_callback(deliver)
+        return True
+    
+    def shutdown(self):
+        """Stop the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            callbacks, self._callbacks = self._callbacks, None
+        if callbacks is not None:
+            callbacks.shutdown(wait=True)
+    
+    def stats(self) -> dict:
+        """Queue depth and job counters."""
+        return {
+            "workers": self.max_workers,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "rejected": self.rejected
+        }
+
+
+# Singleton instance
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING
+)
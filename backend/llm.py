@@ -0,0 +1,476 @@
+import asyncio
+import json
+import re
+import threading
+import time
+from collections import deque
+from typing import AsyncIterator, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+import anyio.from_thread
+
+from backend.config import settings
+
+# A word and the whitespace after it; the unit of streamed output
+CHUNK_PATTERN = re.compile(r"\s*\S+\s*")
+
+
+class ChatPrompt(NamedTuple):
+    """One chat turn sent to the model, with the conversation so far."""
+    system: str
+    message: str
+    history: Tuple[Tuple[str, str], ...] = ()  # (role, content), oldest first
+    
+    def render(self) -> str:
+        """Flatten the conversation into a completion prompt."""
+        turns = "".join(
+            f"{'User' if role == 'user' else 'Assistant'}: {content}\n" for role, content in self.history
+        )
+        return f"{self.system}\n\n{turns}User: {self.message}\nAssistant:"
+
+
+class LLMUnavailableError(RuntimeError):
+    """Raised when the model is overloaded, times out or fails."""
+
+
+class LLMBackend:
+    """Interface for the model servers behind the chat service."""
+    
+    name = "base"
+    
+    async def complete_batch(self, prompts: List[ChatPrompt]) -> List[str]:
+        """Complete several prompts in one request; replies are in prompt order."""
+        raise NotImplementedError
+    
+    async def stream(self, prompt: ChatPrompt) -> AsyncIterator[str]:
+        """Yield a reply in chunks as the model produces them."""
+        replies = await self.complete_batch([prompt])
+        for chunk in CHUNK_PATTERN.findall(replies[0]):
+            yield chunk
+    
+    async def aclose(self) -> None:
+        """Release pooled connections."""
+    
+    def stats(self) -> Dict:
+        """Backend specific counters."""
+        return {}
+
+
+class LocalLLMBackend(LLMBackend):
+    """Deterministic in-process stand-in for a model server.
+    
+    Replies come from `reply`. Latency is simulated as a fixed cost per
+    request plus a cost per generated word; a batch decodes its prompts
+    side by side, so it costs as much as its longest reply. This gives
+    throughput and tail-latency measurements with batching effects but
+    without network access.
+    """
+    
+    name = "local"
+    
+    def __init__(
+        self,
+        reply: Callable[[ChatPrompt], str],
+        request_latency: float = 0.0,
+        token_latency: float = 0.0
+    ):
+        self.reply = reply
+        self.request_latency = request_latency
+        self.token_latency = token_latency
+    
+    async def complete_batch(self, prompts: List[ChatPrompt]) -> List[str]:
+        replies = [self.reply(prompt) for prompt in prompts]
+        longest = max((len(CHUNK_PATTERN.findall(reply)) for reply in replies), default=0)
+        await asyncio.sleep(self.request_latency + self.token_latency * longest)
+        return replies
+    
+    async def stream(self, prompt: ChatPrompt) -> AsyncIterator[str]:
+        await asyncio.sleep(self.request_latency)
+        for chunk in CHUNK_PATTERN.findall(self.reply(prompt)):
+            await asyncio.sleep(self.token_latency)
+            yield chunk
+
+
+class HTTPLLMBackend(LLMBackend):
+    """Model server speaking the OpenAI-compatible /v1/completions API."""
+    
+    name = "http"
+    
+    def __init__(
+        self,
+        url: str,
+        model: str,
+        api_key: Optional[str] = None,
+        max_tokens: int = 512,
+        timeout: float = 30.0,
+        max_connections: int = 16
+    ):
+        try:
+            import httpx
+        except ImportError as e:
+            raise RuntimeError("LLM_BACKEND=http requires the 'httpx' package") from e
+        self.url = url
+        self.model = model
+        self.max_tokens = max_tokens
+        self._httpx = httpx
+        self._client_kwargs = {
+            "headers": {"Authorization": f"Bearer {api_key}"} if api_key else {},
+            "timeout": httpx.Timeout(timeout),
+            "limits": httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        }
+        self._clients: Dict[asyncio.AbstractEventLoop, "httpx.AsyncClient"] = {}
+    
+    def _client(self):
+        # Pooled connections belong to the event loop that opened them
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._clients[loop] = self._httpx.AsyncClient(**self._client_kwargs)
+        return client
+    
+    def _payload(self, prompt, stream: bool = False) -> Dict:
+        return {"model": self.model, "prompt": prompt, "max_tokens": self.max_tokens, "stream": stream}
+    
+    async def complete_batch(self, prompts: List[ChatPrompt]) -> List[str]:
+        response = await self._client().post(self.url, json=self._payload([prompt.render() for prompt in prompts]))
+        response.raise_for_status()
+        choices = sorted(response.json()["choices"], key=lambda choice: choice["index"])
+        return [choice["text"] for choice in choices]
+    
+    async def stream(self, prompt: ChatPrompt) -> AsyncIterator[str]:
+        async with self._client().stream("POST", self.url, json=self._payload(prompt.render(), stream=True)) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                text = json.loads(data)["choices"][0].get("text")
+                if text:
+                    yield text
+    
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+    
+    def stats(self) -> Dict:
+        return {"url": self.url, "model": self.model}
+
+
+class LLMClient:
+    """Per-worker front end to an LLM backend.
+    
+    Prompts that arrive within `batch_wait` seconds of each other are sent
+    as one batch of up to `batch_size`. A semaphore caps the batches and
+    streams in flight at `max_concurrency`. Once `max_pending` prompts are
+    queued or running, further ones are rejected with LLMUnavailableError,
+    as are prompts that are not answered within `timeout` seconds.
+    """
+    
+    def __init__(
+        self,
+        backend: LLMBackend,
+        max_concurrency: int = 8,
+        max_pending: int = 256,
+        batch_size: int = 8,
+        batch_wait: float = 0.005,
+        timeout: float = 30.0
+    ):
+        self.backend = backend
+        self.max_concurrency = max(max_concurrency, 1)
+        self.max_pending = max_pending
+        self.batch_size = max(batch_size, 1)
+        self.batch_wait = batch_wait
+        self.timeout = timeout
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_prompts = 0
+        self._latencies = deque(maxlen=1000)
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        """Create the asyncio primitives for the running loop on first use."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._queue: List[Tuple[ChatPrompt, asyncio.Future]] = []
+            self._flush_handle: Optional[asyncio.Handle] = None
+            self._tasks: Set[asyncio.Task] = set()
+        return loop
+    
+    def _admit(self):
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise LLMUnavailableError("Chat model is busy, try again shortly")
+            self.pending += 1
+    
+    def _finish(self, started: float, ok: bool):
+        with self._lock:
+            self.pending -= 1
+            if ok:
+                self.completed += 1
+                self._latencies.append(time.perf_counter() - started)
+    
+    async def generate(self, prompt: ChatPrompt) -> str:
+        """Complete a prompt, batched with other prompts submitted at about the same time."""
+        loop = self._bind_loop()
+        self._admit()
+        started = time.perf_counter()
+        ok = False
+        future = loop.create_future()
+        self._queue.append((prompt, future))
+        if len(self._queue) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_wait, self._flush)
+        try:
+            reply = await asyncio.wait_for(future, self.timeout)
+            ok = True
+            return reply
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise LLMUnavailableError("Chat model timed out")
+        finally:
+            self._finish(started, ok)
+    
+    def generate_sync(self, prompt: ChatPrompt) -> str:
+        """Blocking `generate` for sync endpoints, which run in the event loop's worker threads."""
+        return anyio.from_thread.run(self.generate, prompt)
+    
+    def _flush(self):
+        """Send up to one batch of queued prompts."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._queue = self._queue[:self.batch_size], self._queue[self.batch_size:]
+        if self._queue:
+            self._flush_handle = self._loop.call_soon(self._flush)
+        if batch:
+            task = self._loop.create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _run_batch(self, batch: List[Tuple[ChatPrompt, asyncio.Future]]):
+        async with self._semaphore:
+            # Callers that timed out or went away are not sent to the model
+            live = [(prompt, future) for prompt, future in batch if not future.done()]
+            if not live:
+                return
+            try:
+                replies = await asyncio.wait_for(
+                    self.backend.complete_batch([prompt for prompt, _ in live]), self.timeout
+                )
+            except Exception as e:
+                self.errors += 1
+                print(f"Error completing chat batch: {e}")
+                for _, future in live:
+                    if not future.done():
+                        future.set_exception(LLMUnavailableError("Chat model request failed"))
+                return
+        
+        self.batches += 1
+        self.batched_prompts += len(live)
+        for (_, future), reply in zip(live, replies):
+            if not future.done():
+                future.set_result(reply)
+        # Prompts the backend left unanswered would otherwise wait out the full timeout
+        if len(replies) < len(live):
+            self.errors += 1
+            print(f"Error completing chat batch: {len(replies)} replies for {len(live)} prompts")
+            for _, future in live[len(replies):]:
+                if not future.done():
+                    future.set_exception(LLMUnavailableError("Chat model request failed"))
+    
+    async def stream(self, prompt: ChatPrompt) -> AsyncIterator[str]:
+        """Yield a reply in chunks; streams are not batched but count against the concurrency limit."""
+        self._bind_loop()
+        self._admit()
+        started = time.perf_counter()
+        ok = False
+        try:
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.timeout)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                raise LLMUnavailableError("Chat model timed out")
+            try:
+                async for chunk in self.backend.stream(prompt):
+                    yield chunk
+                ok = True
+            except LLMUnavailableError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                print(f"Error streaming chat reply: {e}")
+                raise LLMUnavailableError("Chat model request failed") from e
+            finally:
+                self._semaphore.release()
+        finally:
+            self._finish(started, ok)
+    
+    async def aclose(self):
+        """Close the backend's connections."""
+        await self.backend.aclose()
+    
+    def stats(self) -> Dict:
+        """Queue depth, batching and latency percentiles over recent requests."""
+        latencies = sorted(self._latencies)
+        
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(int(len(latencies) * p), len(latencies) - 1)] * 1000, 2)
+        
+        return {
+            "backend": self.backend.name,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "max_concurrency": self.max_concurrency,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "batches": self.batches,
+            "avg_batch_size": round(self.batched_prompts / self.batches, 2) if self.batches else 0.0,
+            "latency_ms": {"p50": percentile(0.5), "p95": percentile(0.95), "p99": percentile(0.99)},
+            **self.backend.stats()
+        }
+
+
+def create_llm_backend(local_reply: Callable[[ChatPrompt], str]) -> LLMBackend:
+    """Create the LLM backend selected by settings."""
+    if settings.LLM_BACKEND == "http":
+        return HTTPLLMBackend(
+            settings.LLM_URL,
+            settings.LLM_MODEL,
+            api_key=settings.LLM_API_KEY,
+            max_tokens=settings.LLM_MAX_TOKENS,
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+            max_connections=settings.LLM_POOL_CONNECTIONS
+        )
+    return LocalLLMBackend(
+        local_reply,
+        request_latency=settings.LOCAL_LLM_REQUEST_LATENCY_MS / 1000,
+        token_latency=settings.LOCAL_LLM_TOKEN_LATENCY_MS / 1000
+    )
+
+
+def create_llm_client(backend: LLMBackend) -> LLMClient:
+    """Wrap a backend with the limits configured in settings."""
+    return LLMClient(
+        backend,
+        max_concurrency=settings.LLM_MAX_CONCURRENCY,
+        max_pending=settings.LLM_MAX_PENDING,
+        batch_size=settings.LLM_BATCH_SIZE,
+        batch_wait=settings.LLM_BATCH_WAIT_MS / 1000,
+        timeout=settings.LLM_TIMEOUT_SECONDS
+    )
+
+
+def create_stand_in_app(backend: LLMBackend):
+    """ASGI app serving a backend over the /v1/completions API, for benchmarking the HTTP client."""
+    from fastapi import FastAPI
+    from fastapi.responses import StreamingResponse
+    
+    app = FastAPI(title="Local LLM stand-in")
+    
+    @app.post("/v1/completions")
+    async def completions(body: Dict):
+        prompts = body["prompt"] if isinstance(body["prompt"], list) else [body["prompt"]]
+        # Rendered prompts end with the user's message; the stand-in only needs that part
+        turns = [ChatPrompt("", prompt.rsplit("User: ", 1)[-1].rsplit("\nAssistant:", 1)[0]) for prompt in prompts]
+        if not body.get("stream"):
+            replies = await backend.complete_batch(turns)
+            return {"choices": [{"index": index, "text": reply} for index, reply in enumerate(replies)]}
+        
+        async def events():
+            async for chunk in backend.stream(turns[0]):
+                yield f"data: {json.dumps({'choices': [{'index': 0, 'text': chunk}]})}\n\n"
+            yield "data: [DONE]\n\n"
+        
+        return StreamingResponse(events(), media_type="text/event-stream")
+    
+    return app
+
+
+async def benchmark(client: LLMClient, requests: int, concurrency: int) -> Dict:
+    """Send `requests` prompts from `concurrency` simulated users; returns throughput and latency."""
+    from backend.services.chat_service import ChatService
+    
+    messages = ["How can I improve my readiness score?", "What should I focus on this week?",
+                "Best practices for React development", "Career paths in software engineering"]
+    latencies: List[float] = []
+    failures = 0
+    counter = iter(range(requests))
+    
+    async def user():
+        nonlocal failures
+        for index in counter:
+            started = time.perf_counter()
+            try:
+                await client.generate(ChatService._build_prompt(messages[index % len(messages)], None))
+                latencies.append(time.perf_counter() - started)
+            except LLMUnavailableError:
+                failures += 1
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    await client.aclose()
+    
+    latencies.sort()
+    at = lambda p: round(latencies[min(int(len(latencies) * p), len(latencies) - 1)] * 1000, 2) if latencies else 0.0
+    return {
+        "requests": requests,
+        "failures": failures,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "latency_ms": {"p50": at(0.5), "p95": at(0.95), "p99": at(0.99), "max": at(1.0)},
+        "avg_batch_size": client.stats()["avg_batch_size"]
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Serve or benchmark the chat model backend.")
+    parser.add_argument("command", choices=["serve", "bench"])
+    parser.add_argument("--port", type=int, default=8001, help="serve: port for the stand-in server")
+    parser.add_argument("--url", help="bench: benchmark a /v1/completions server instead of the in-process stand-in")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=settings.LLM_BATCH_SIZE)
+    parser.add_argument("--request-latency-ms", type=float, default=50.0, help="stand-in cost per model request")
+    parser.add_argument("--token-latency-ms", type=float, default=0.5, help="stand-in cost per generated word")
+    args = parser.parse_args()
+    
+    from backend.services.chat_service import ChatService
+    
+    local = LocalLLMBackend(
+        lambda prompt: ChatService._generate_response(prompt.message, None),
+        request_latency=args.request_latency_ms / 1000,
+        token_latency=args.token_latency_ms / 1000
+    )
+    if args.command == "serve":
+        import uvicorn
+        uvicorn.run(create_stand_in_app(local), host="127.0.0.1", port=args.port)
+    else:
+        backend = HTTPLLMBackend(args.url, settings.LLM_MODEL) if args.url else local
+        client = LLMClient(
+            backend,
+            max_concurrency=settings.LLM_MAX_CONCURRENCY,
+            max_pending=max(settings.LLM_MAX_PENDING, args.concurrency),
+            batch_size=args.batch_size,
+            batch_wait=settings.LLM_BATCH_WAIT_MS / 1000,
+            timeout=settings.LLM_TIMEOUT_SECONDS
+        )
+        print(json.dumps(asyncio.run(benchmark(client, args.requests, args.concurrency)), indent=2))
@@ -2,18 +2,42 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
+from backend.audit import login_history_writer
+from backend.auth import principal_cache
+from backend.cache import profile_cache
+from backend.chat_history import chat_history_writer, recent_context
 from backend.config import settings
-from backend.database import engine, Base
+from backend.data_loaders.registry import PinnedDatasetsMiddleware, dataset_registry
+from backend.database import engine, async_engine, get_pool_stats
+from backend.hashing import password_hasher
+from backend.migrations import run_migrations
+from backend.prerendered import prerendered_responses
+from backend.response_cache import response_cache
 from backend.routers import auth, users, careers, skills, roadmap, interview, chat
+from backend.routers import async_auth, async_users, async_careers
+from backend.services.chat_service import llm_client
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
-    # Startup: Create database tables
-    Base.metadata.create_all(bind=engine)
+    # Startup: Create or upgrade database tables
+    run_migrations(engine)
+    login_history_writer.start()
+    chat_history_writer.start()
+    if settings.DATASET_WARMUP:
+        dataset_registry.warm_up_in_background()
+    if settings.DATASET_RELOAD_INTERVAL_SECONDS > 0:
+        dataset_registry.start_watching(settings.DATASET_RELOAD_INTERVAL_SECONDS)
     yield
-    # Shutdown: cleanup if needed
+    # Shutdown: drain the login and chat logs, stop hashing workers and release pooled connections
+    dataset_registry.stop_watching()
+    login_history_writer.stop()
+    chat_history_writer.stop()
+    password_hasher.shutdown()
+    await llm_client.aclose()
+    if async_engine is not None:
+        await async_engine.dispose()
 
 
 # Create FastAPI application
@@ -31,12 +55,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
-# Include routers
-app.include_router(auth.router, prefix=settings.API_PREFIX)
-app.include_router(users.router, prefix=settings.API_PREFIX)
-app.include_router(careers.router, prefix=settings.API_PREFIX)
+# Give each request a consistent view of hot-reloaded datasets
+app.add_middleware(PinnedDatasetsMiddleware)
+
+# Profile computations depend on the datasets; drop them when one is swapped
+dataset_registry.on_reload(lambda name: profile_cache.clear())
+
+# Include routers; auth, users and careers have async variants selected by DB_MODE
+if settings.DB_MODE == "async":
+    app.include_router(async_auth.router, prefix=settings.API_PREFIX)
+    app.include_router(async_users.router, prefix=settings.API_PREFIX)
+    app.include_router(async_careers.router, prefix=settings.API_PREFIX)
+else:
+    app.include_router(auth.router, prefix=settings.API_PREFIX)
+    app.include_router(users.router, prefix=settings.API_PREFIX)
+    app.include_router(careers.router, prefix=settings.API_PREFIX)
 app.include_router(skills.router, prefix=settings.API_PREFIX)
 app.include_router(roadmap.router, prefix=settings.API_PREFIX)
 app.include_router(interview.router, prefix=settings.API_PREFIX)
@@ -59,6 +95,23 @@ def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics")
+def metrics():
+    """Runtime counters for caches and background workers."""
+    return {
+        "profile_cache": profile_cache.stats(),
+        "principal_cache": principal_cache.stats(),
+        "db_pool": get_pool_stats(),
+        "password_hasher": password_hasher.stats(),
+        "login_history": login_history_writer.stats(),
+        "chat_history": {**chat_history_writer.stats(), "context": recent_context.stats()},
+        "datasets": dataset_registry.stats(),
+        "llm": llm_client.stats(),
+        "chat_response_cache": response_cache.stats(),
+        "prerendered": prerendered_responses.stats()
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
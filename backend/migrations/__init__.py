@@ -0,0 +1,69 @@
+"""Versioned schema migrations.
+
+Each migration is an idempotent `upgrade(connection)` function applied once,
+in order, inside its own transaction. Applied versions are recorded in the
+`schema_migrations` table, so existing databases are upgraded in place.
+"""
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+
+from backend.migrations import (
+    m0001_initial_schema,
+    m0002_prediction_skills_hash,
+    m0003_per_user_indexes,
+    m0004_user_recommendations,
+    m0005_chat_messages,
+    m0006_user_course_progress,
+)
+
+MIGRATIONS = [
+    (1, "initial_schema", m0001_initial_schema.upgrade),
+    (2, "prediction_skills_hash", m0002_prediction_skills_hash.upgrade),
+    (3, "per_user_indexes", m0003_per_user_indexes.upgrade),
+    (4, "user_recommendations", m0004_user_recommendations.upgrade),
+    (5, "chat_messages", m0005_chat_messages.upgrade),
+    (6, "user_course_progress", m0006_user_course_progress.upgrade),
+]
+
+_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    _metadata,
+    Column("version", Integer, primary_key=True),
+    Column("name", String(100), nullable=False),
+    Column("applied_at", DateTime, default=datetime.utcnow),
+)
+
+
+def get_applied_versions(bind: Engine) -> List[int]:
+    """Get the migration versions already applied to the database."""
+    _metadata.create_all(bind=bind)
+    with bind.connect() as connection:
+        return sorted(connection.execute(select(schema_migrations.c.version)).scalars())
+
+
+def run_migrations(bind: Engine) -> List[int]:
+    """Apply pending migrations and return the versions applied."""
+    applied = set(get_applied_versions(bind))
+    newly_applied = []
+    
+    for version, name, upgrade in MIGRATIONS:
+        if version in applied:
+            continue
+        try:
+            with bind.begin() as connection:
+                upgrade(connection)
+                connection.execute(schema_migrations.insert().values(
+                    version=version, name=name, applied_at=datetime.utcnow()
+                ))
+        except IntegrityError:
+            # Another worker recorded this version first
+            continue
+        newly_applied.append(version)
+    
+    return newly_applied
@@ -0,0 +1,9 @@
+from backend.database import engine
+from backend.migrations import MIGRATIONS, get_applied_versions, run_migrations
+
+if __name__ == "__main__":
+    applied = run_migrations(engine)
+    current = get_applied_versions(engine)
+    for version, name, _ in MIGRATIONS:
+        marker = "applied now" if version in applied else ("applied" if version in current else "pending")
+        print(f"{version:04d} {name}: {marker}")
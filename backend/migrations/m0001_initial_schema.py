@@ -0,0 +1,8 @@
+"""Create the base tables for a fresh database."""
+from backend.database import Base
+import backend.models.models  # noqa: F401  (registers the tables on Base)
+
+
+def upgrade(connection):
+    # checkfirst leaves tables of pre-migration databases untouched
+    Base.metadata.create_all(bind=connection, checkfirst=True)
@@ -0,0 +1,8 @@
+"""Add predictions.skills_hash for prediction snapshots."""
+from sqlalchemy import inspect, text
+
+
+def upgrade(connection):
+    columns = {column["name"] for column in inspect(connection).get_columns("predictions")}
+    if "skills_hash" not in columns:
+        connection.execute(text("ALTER TABLE predictions ADD COLUMN skills_hash VARCHAR(64)"))
@@ -0,0 +1,23 @@
+"""Composite indexes for per-user lookups."""
+from sqlalchemy import text
+
+from backend.models.models import UserSkill, UserPreference, Prediction, LoginHistory
+
+INDEXES = {
+    UserSkill: "ix_user_skills_user_id_skill_name",
+    UserPreference: "ix_user_preferences_user_id_interest",
+    Prediction: "ix_predictions_user_id_created_at",
+    LoginHistory: "ix_login_history_user_id_login_at",
+}
+
+
+def upgrade(connection):
+    # Keep the newest row of any duplicated (user_id, skill_name) before the unique index
+    connection.execute(text(
+        "DELETE FROM user_skills WHERE id NOT IN "
+        "(SELECT MAX(id) FROM user_skills GROUP BY user_id, skill_name)"
+    ))
+    
+    for model, name in INDEXES.items():
+        index = next(i for i in model.__table__.indexes if i.name == name)
+        index.create(bind=connection, checkfirst=True)
@@ -0,0 +1,6 @@
+"""Add the user_recommendations table filled by the offline precompute job."""
+from backend.models.models import UserRecommendation
+
+
+def upgrade(connection):
+    UserRecommendation.__table__.create(bind=connection, checkfirst=True)
@@ -0,0 +1,6 @@
+"""Add the chat_messages table for persisted chat history."""
+from backend.models.models import ChatMessage
+
+
+def upgrade(connection):
+    ChatMessage.__table__.create(bind=connection, checkfirst=True)
@@ -0,0 +1,6 @@
+"""Add the user_course_progress table for persisted roadmap progress."""
+from backend.models.models import UserCourseProgress
+
+
+def upgrade(connection):
+    UserCourseProgress.__table__.create(bind=connection, checkfirst=True)
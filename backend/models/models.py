@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from backend.database import Base
@@ -31,6 +31,10 @@ class UserSkill(Base):
     
     # Relationships
     user = relationship("User", back_populates="skills")
+    
+    __table_args__ = (
+        Index("ix_user_skills_user_id_skill_name", user_id, skill_name, unique=True),
+    )
 
 class UserPreference(Base):
     __tablename__ = "user_preferences"
@@ -43,12 +47,17 @@ class UserPreference(Base):
     
     # Relationships
     user = relationship("User", back_populates="preferences")
+    
+    __table_args__ = (
+        Index("ix_user_preferences_user_id_interest", user_id, interest),
+    )
 
 class Prediction(Base):
     __tablename__ = "predictions"
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    skills_hash = Column(String(64))  # Content hash of the user's skills at prediction time
     career_matches = Column(JSON)  # List of matched careers
     readiness_score = Column(Float)
     skill_gaps = Column(JSON)  # List of missing skills
@@ -57,6 +66,10 @@ class Prediction(Base):
     
     # Relationships
     user = relationship("User", back_populates="predictions")
+    
+    __table_args__ = (
+        Index("ix_predictions_user_id_created_at", user_id, created_at.desc()),
+    )
 
 class LoginHistory(Base):
     __tablename__ = "login_history"
@@ -66,3 +79,40 @@ class LoginHistory(Base):
     login_at = Column(DateTime, default=datetime.utcnow)
     ip_address = Column(String(50))
     user_agent = Column(String(255))
+    
+    __table_args__ = (
+        Index("ix_login_history_user_id_login_at", user_id, login_at),
+    )
+
+class UserRecommendation(Base):
+    __tablename__ = "user_recommendations"
+    
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    version = Column(String(64), nullable=False)  # Dataset versions the row was computed against
+    skills_hash = Column(String(64), nullable=False)  # Skills and version hash; stale rows are ignored
+    career_matches = Column(JSON)
+    skill_gaps = Column(JSON)  # Gaps against the closest role
+    recommended_courses = Column(JSON)
+    computed_at = Column(DateTime, default=datetime.utcnow)
+
+class ChatMessage(Base):
+    __tablename__ = "chat_messages"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    role = Column(String(20), nullable=False)  # user or assistant
+    content = Column(Text, nullable=False)
+    timestamp = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        Index("ix_chat_messages_user_id_id", user_id, id),
+    )
+
+class UserCourseProgress(Base):
+    __tablename__ = "user_course_progress"
+    
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    course_key = Column(String(255), primary_key=True)  # Normalized course name; survives catalog rebuilds
+    status = Column(String(20), nullable=False)
+    progress = Column(Float, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,186 @@
+"""Offline job that materializes career matches, skill gaps and course
+recommendations for every user into the user_recommendations table.
+
+Users are walked in id order, PRECOMPUTE_CHUNK_SIZE at a time. Each chunk's skills are
+read in one query and users whose stored row is still current are skipped,
+so a nightly run only recomputes users whose skills or datasets changed.
+Chunks are scored in a process pool with a bounded number in flight, and
+no new chunk is started once the time budget is spent; the next run picks
+up the rest.
+
+Run with `python -m backend.precompute`.
+"""
+import argparse
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import select
+
+from backend.config import settings
+from backend.data_loaders.course_recommender import get_course_recommender
+from backend.data_loaders.job_roles import job_roles_loader
+from backend.data_loaders.registry import dataset_registry
+from backend.database import engine
+from backend.migrations import run_migrations
+from backend.models.models import User, UserSkill
+from backend.services.precompute_service import RECOMMENDATION_CANDIDATES, PrecomputeService
+from backend.services.skill_service import SkillService
+
+MATCH_LIMIT = 10  # Same as CareerService.get_career_matches
+
+
+class SkillRow(NamedTuple):
+    skill_name: str
+    proficiency: float
+
+
+# (user_id, skills) pairs handed to a worker
+Chunk = List[Tuple[int, List[SkillRow]]]
+
+
+def compute_chunk(chunk: Chunk) -> List[Dict]:
+    """Score one chunk of users; runs in a worker process."""
+    with dataset_registry.pinned():
+        version = PrecomputeService.current_version()
+        recommender = get_course_recommender()
+        matches = job_roles_loader.get_career_matches_batch(
+            [[skill.skill_name for skill in skills] for _, skills in chunk], limit=MATCH_LIMIT
+        )
+        rows = []
+        for (user_id, skills), user_matches in zip(chunk, matches):
+            levels = {skill.skill_name: skill.proficiency for skill in skills}
+            gaps = SkillService.gaps_for_levels(levels)
+            rows.append({
+                "user_id": user_id,
+                "version": version,
+                "skills_hash": PrecomputeService.compute_hash(skills, version),
+                "career_matches": user_matches,
+                "skill_gaps": gaps,
+                "recommended_courses": recommender.recommend(levels, limit=RECOMMENDATION_CANDIDATES)
+            })
+        return rows
+
+
+def _warm_up():
+    dataset_registry.warm_up(["job_roles", "courses"])
+    get_course_recommender()
+
+
+def iter_chunks(chunk_size: int, full: bool, stats: Dict) -> Iterator[Chunk]:
+    """Walk users by id and yield those whose precomputed row is missing or stale."""
+    version = PrecomputeService.current_version()
+    last_id = 0
+    while True:
+        with engine.connect() as connection:
+            user_ids = connection.execute(
+                select(User.id).where(User.id > last_id).order_by(User.id).limit(chunk_size)
+            ).scalars().all()
+            if not user_ids:
+                return
+            last_id = user_ids[-1]
+            
+            skills_by_user: Dict[int, List[SkillRow]] = {}
+            for user_id, skill_name, proficiency in connection.execute(
+                select(UserSkill.user_id, UserSkill.skill_name, UserSkill.proficiency)
+                .where(UserSkill.user_id.in_(user_ids))
+            ):
+                skills_by_user.setdefault(user_id, []).append(SkillRow(skill_name, proficiency or 0.0))
+            stored = {} if full else PrecomputeService.get_stored_hashes(connection, user_ids)
+        
+        chunk = []
+        for user_id in user_ids:
+            skills = skills_by_user.get(user_id)
+            stats["users"] += 1
+            if not skills:
+                # Users without skills get the constant defaults on demand
+                stats["skipped_no_skills"] += 1
+            elif stored.get(user_id) == PrecomputeService.compute_hash(skills, version):
+                stats["skipped_current"] += 1
+            else:
+                chunk.append((user_id, skills))
+        stats["last_user_id"] = last_id
+        if chunk:
+            yield chunk
+
+
+def run(
+    chunk_size: Optional[int] = None,
+    workers: Optional[int] = None,
+    max_seconds: Optional[float] = None,
+    full: bool = False
+) -> Dict:
+    """Precompute recommendations for all users; returns run statistics."""
+    chunk_size = max(chunk_size or settings.PRECOMPUTE_CHUNK_SIZE, 1)
+    workers = settings.PRECOMPUTE_WORKERS if workers is None else workers
+    max_seconds = settings.PRECOMPUTE_MAX_SECONDS if max_seconds is None else max_seconds
+    
+    run_migrations(engine)
+    started = time.perf_counter()
+    deadline = started + max_seconds
+    stats = {
+        "users": 0,
+        "computed": 0,
+        "skipped_current": 0,
+        "skipped_no_skills": 0,
+        "chunks": 0,
+        "last_user_id": 0,
+        "completed": False
+    }
+    
+    def write(rows: List[Dict]):
+        with engine.begin() as connection:
+            PrecomputeService.save_rows(connection, rows)
+        stats["computed"] += len(rows)
+        stats["chunks"] += 1
+    
+    chunks = iter_chunks(chunk_size, full, stats)
+    if workers <= 0:
+        for chunk in chunks:
+            write(compute_chunk(chunk))
+            if time.perf_counter() >= deadline:
+                break
+        else:
+            stats["completed"] = True
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_up
+        ) as executor:
+            in_flight: Set[Future] = set()
+            exhausted = False
+            while True:
+                # Keep every worker busy with one chunk queued behind it
+                while not exhausted and len(in_flight) < workers * 2 and time.perf_counter() < deadline:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                    else:
+                        in_flight.add(executor.submit(compute_chunk, chunk))
+                if not in_flight:
+                    break
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    write(future.result())
+            stats["completed"] = exhausted
+    
+    stats["seconds"] = round(time.perf_counter() - started, 2)
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute per-user recommendations.")
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-seconds", type=float, default=None)
+    parser.add_argument("--full", action="store_true", help="Recompute rows that are still current")
+    args = parser.parse_args()
+    
+    result = run(args.chunk_size, args.workers, args.max_seconds, args.full)
+    state = "complete" if result["completed"] else f"stopped after user {result['last_user_id']}"
+    print(
+        f"Precomputed {result['computed']} users in {result['seconds']}s ({state}); "
+        f"{result['skipped_current']} current, {result['skipped_no_skills']} without skills"
+    )
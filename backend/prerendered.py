@@ -0,0 +1,159 @@
+import gzip
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from backend.config import settings
+from backend.data_loaders.registry import dataset_registry
+
+# Preferred first when the client accepts several
+ENCODINGS = ("br", "gzip", "identity")
+
+
+class PrerenderedResponse(NamedTuple):
+    """A JSON payload serialized once, with a body per content coding."""
+    digest: str
+    bodies: Dict[str, bytes]
+    
+    def etag(self, encoding: str) -> str:
+        # Each coding is its own representation, so each gets its own strong tag
+        return f'"{self.digest}"' if encoding == "identity" else f'"{self.digest}-{encoding}"'
+
+
+def _brotli_compress(body: bytes) -> Optional[bytes]:
+    try:
+        import brotli
+    except ImportError:
+        # Optional; clients fall back to gzip
+        return None
+    return brotli.compress(body, quality=11)
+
+
+def render(value: Any) -> PrerenderedResponse:
+    """Serialize a payload the way FastAPI's JSONResponse does and compress it."""
+    body = json.dumps(
+        jsonable_encoder(value), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+    bodies = {"identity": body}
+    for encoding, compressed in (
+        ("gzip", gzip.compress(body, compresslevel=settings.PRERENDER_GZIP_LEVEL, mtime=0)),
+        ("br", _brotli_compress(body))
+    ):
+        # Tiny payloads can grow when compressed
+        if compressed is not None and len(compressed) < len(body):
+            bodies[encoding] = compressed
+    return PrerenderedResponse(hashlib.sha256(body).hexdigest()[:32], bodies)
+
+
+def _accepted_encodings(header: str) -> Dict[str, float]:
+    accepted = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def choose_encoding(prerendered: PrerenderedResponse, accept_encoding: str) -> str:
+    """Pick the best coding the client accepts; identity is always acceptable."""
+    accepted = _accepted_encodings(accept_encoding)
+    for encoding in ENCODINGS[:-1]:
+        if encoding in prerendered.bodies and accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return "identity"
+
+
+def matches_etag(prerendered: PrerenderedResponse, if_none_match: str) -> bool:
+    """Whether If-None-Match names any coding of this payload (weak comparison, RFC 9110)."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag.strip('"').split("-", 1)[0] == prerendered.digest:
+            return True
+    return False
+
+
+class PrerenderedResponses:
+    """Responses that only change with a dataset, serialized once per dataset version.
+    
+    A payload is rendered to JSON bytes and compressed on the first request
+    for a dataset version; later requests are served from memory, or with
+    304 Not Modified when If-None-Match carries the current ETag.
+    """
+    
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.renders = 0
+        self.not_modified = 0
+        self._entries: "OrderedDict[Tuple[str, str], PrerenderedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, name: str, dataset: str, build: Callable[[], Any]) -> PrerenderedResponse:
+        """Get the rendered payload `name` for the dataset version the request sees."""
+        key = (name, dataset_registry.version(dataset))
+        with self._lock:
+            prerendered = self._entries.get(key)
+            if prerendered is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return prerendered
+        
+        prerendered = render(build())
+        with self._lock:
+            self.renders += 1
+            self._entries[key] = prerendered
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return prerendered
+    
+    def respond(self, request: Request, name: str, dataset: str, build: Callable[[], Any]) -> Response:
+        """Serve a prerendered payload, honouring If-None-Match and Accept-Encoding."""
+        prerendered = self.get(name, dataset, build)
+        encoding = choose_encoding(prerendered, request.headers.get("accept-encoding", ""))
+        headers = {
+            "ETag": prerendered.etag(encoding),
+            "Vary": "Accept-Encoding",
+            "Cache-Control": settings.PRERENDER_CACHE_CONTROL
+        }
+        
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and matches_etag(prerendered, if_none_match):
+            with self._lock:
+                self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(content=prerendered.bodies[encoding], media_type="application/json", headers=headers)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "renders": self.renders,
+            "not_modified": self.not_modified
+        }
+
+
+# Singleton instance
+prerendered_responses = PrerenderedResponses(max_entries=settings.PRERENDER_MAX_ENTRIES)
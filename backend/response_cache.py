@@ -0,0 +1,177 @@
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend.config import settings
+from backend.data_loaders.course_search import tokenize
+
+# Words that carry no intent; dropped before embedding
+STOPWORDS = frozenset("""
+a about am an and any are as at be can could do does for give help how i in is it me my of on or please
+should tell that the this to u what which with would you your
+""".split())
+
+# Words that flip a message's intent; a message containing one is only matched exactly
+NEGATIONS = frozenset("avoid never no nor not skip stop without".split())
+
+
+def normalize_message(message: str) -> List[str]:
+    """Intent terms of a message: lowercase tokens without stopwords, singularized, sorted.
+    
+    Contractions such as "don't", "can't" and "cannot" become the term "not".
+    """
+    terms = set()
+    tokens = tokenize(message)
+    for i, token in enumerate(tokens):
+        if token == "cannot" or (token == "t" and i and tokens[i - 1].endswith("n")):
+            terms.add("not")
+            continue
+        if token in STOPWORDS or (i + 1 < len(tokens) and tokens[i + 1] == "t" and token.endswith("n")):
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        terms.add(token)
+    return sorted(terms)
+
+
+class SemanticResponseCache:
+    """Cache chat replies for messages with the same intent.
+    
+    Messages are embedded as L2-normalized hashed bag-of-words vectors and
+    kept in a fixed-size matrix, so a lookup is one matrix-vector product
+    over the live entries of the caller's partition (the profile features
+    the reply may depend on). The best match is a hit when its cosine
+    similarity reaches `threshold`; identical term sets skip the product.
+    Messages with a negation term ("not", "never", "avoid", ...) are only
+    matched by an identical term set, so "should I not learn X" never gets
+    the reply cached for "should I learn X" or the other way round.
+    Entries expire after `ttl` seconds and the least recently used entry is
+    evicted when the matrix is full.
+    """
+    
+    def __init__(self, max_entries: int, ttl: float, threshold: float, dimensions: int = 512):
+        self.max_entries = max(max_entries, 1)
+        self.ttl = ttl
+        self.threshold = threshold
+        self.dimensions = dimensions
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self.clear()
+    
+    def _embed(self, message: str) -> Tuple[str, Optional[np.ndarray], bool]:
+        terms = normalize_message(message)
+        if not terms:
+            return "", None, False
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for term in terms:
+            digest = zlib.crc32(term.encode("utf-8"))
+            # The top bit picks a sign so colliding terms tend to cancel out
+            vector[digest % self.dimensions] += 1.0 if digest & 0x80000000 else -1.0
+        norm = np.linalg.norm(vector)
+        negated = not NEGATIONS.isdisjoint(terms)
+        return " ".join(terms), (vector / norm if norm else None), negated
+    
+    def lookup(self, partition: str, message: str) -> Optional[Any]:
+        """Get the reply cached for the closest message in a partition, or None."""
+        key, vector, negated = self._embed(message)
+        with self._lock:
+            code = self._partition_codes.get(partition)
+            slot = None
+            if vector is not None and code is not None:
+                now = time.monotonic()
+                slot = self._exact.get((code, key))
+                if slot is not None and self._expires_at[slot] <= now:
+                    slot = None
+                if slot is None and not negated:
+                    live = np.flatnonzero(
+                        (self._partitions == code) & (self._expires_at > now) & ~self._negated
+                    )
+                    if live.size:
+                        similarities = self._vectors[live] @ vector
+                        best = int(np.argmax(similarities))
+                        if similarities[best] >= self.threshold:
+                            slot = int(live[best])
+            if slot is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._clock += 1
+            self._last_used[slot] = self._clock
+            return self._values[slot]
+    
+    def store(self, partition: str, message: str, value: Any) -> bool:
+        """Cache a reply; returns False for messages without intent terms."""
+        key, vector, negated = self._embed(message)
+        if vector is None:
+            return False
+        with self._lock:
+            code = self._partition_codes.setdefault(partition, len(self._partition_codes))
+            slot = self._exact.get((code, key))
+            if slot is None:
+                slot = self._free_slot()
+            self._clock += 1
+            self._vectors[slot] = vector
+            self._partitions[slot] = code
+            self._negated[slot] = negated
+            self._expires_at[slot] = time.monotonic() + self.ttl
+            self._last_used[slot] = self._clock
+            self._values[slot] = value
+            self._keys[slot] = (code, key)
+            self._exact[(code, key)] = slot
+            return True
+    
+    def _free_slot(self) -> int:
+        """An empty or expired slot, else the least recently used one. Caller holds the lock."""
+        free = np.flatnonzero((self._partitions < 0) | (self._expires_at <= time.monotonic()))
+        if free.size:
+            slot = int(free[0])
+        else:
+            slot = int(np.argmin(self._last_used))
+            self.evictions += 1
+        if self._keys[slot] is not None:
+            self._exact.pop(self._keys[slot], None)
+            self._keys[slot] = None
+        return slot
+    
+    def clear(self) -> None:
+        """Drop all cached replies."""
+        with self._lock:
+            self._vectors = np.zeros((self.max_entries, self.dimensions), dtype=np.float32)
+            self._partitions = np.full(self.max_entries, -1, dtype=np.int64)
+            self._negated = np.zeros(self.max_entries, dtype=bool)
+            self._expires_at = np.zeros(self.max_entries, dtype=np.float64)
+            self._last_used = np.zeros(self.max_entries, dtype=np.int64)
+            self._values: List[Any] = [None] * self.max_entries
+            self._keys: List[Optional[Tuple[int, str]]] = [None] * self.max_entries
+            self._exact: Dict[Tuple[int, str], int] = {}
+            self._partition_codes: Dict[str, int] = {}
+            self._clock = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters."""
+        lookups = self.hits + self.misses
+        with self._lock:
+            entries = int(np.count_nonzero((self._partitions >= 0) & (self._expires_at > time.monotonic())))
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "threshold": self.threshold
+        }
+
+
+# Singleton instance
+response_cache = SemanticResponseCache(
+    max_entries=settings.CHAT_CACHE_MAX_ENTRIES,
+    ttl=settings.CHAT_CACHE_TTL_SECONDS,
+    threshold=settings.CHAT_CACHE_SIMILARITY,
+    dimensions=settings.CHAT_CACHE_DIMENSIONS
+)
@@ -0,0 +1,79 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.database import get_async_db
+from backend.hashing import PasswordHasherBusyError
+from backend.auth import Principal, get_current_user_async
+from backend.schemas.user import LoginRequest, RegisterRequest, TokenResponse, ChangePasswordRequest, UserResponse
+from backend.services.async_auth_service import async_auth_service
+
+router = APIRouter(prefix="/auth", tags=["Authentication"])
+
+
+@router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
+async def register(user_data: RegisterRequest, db: AsyncSession = Depends(get_async_db)):
+    """Register a new user."""
+    try:
+        return await async_auth_service.register(db, user_data)
+    except PasswordHasherBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post("/login", response_model=TokenResponse)
+async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_async_db)):
+    """Authenticate user and return tokens."""
+    try:
+        return await async_auth_service.login(db, login_data)
+    except PasswordHasherBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh_token(refresh_data: dict, db: AsyncSession = Depends(get_async_db)):
+    """Refresh access token."""
+    try:
+        return await async_auth_service.refresh_token(db, refresh_data.get("refresh_token"))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+
+
+@router.post("/change-password")
+async def change_password(
+    password_data: ChangePasswordRequest,
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Change user password."""
+    try:
+        await async_auth_service.change_password(
+            db, current_user.id, 
+            password_data.current_password, 
+            password_data.new_password
+        )
+        return {"message": "Password changed successfully"}
+    except PasswordHasherBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/me", response_model=UserResponse)
+async def get_current_user_info(current_user: Principal = Depends(get_current_user_async)):
+    """Get current user information."""
+    return UserResponse.model_validate(current_user)
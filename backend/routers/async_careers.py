@@ -0,0 +1,95 @@
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from backend.database import get_async_db
+from backend.auth import Principal, get_current_user_async, get_placement_user_async
+from backend.schemas.career import (
+    CareerMatchBase,
+    CohortMatchRequest,
+    ReadinessScoreResponse,
+    DashboardStatsResponse,
+    CareerTrendResponse,
+    ActivityDataResponse
+)
+from backend.services.async_career_service import async_career_service
+
+router = APIRouter(prefix="/careers", tags=["Careers"])
+
+
+@router.get("/matches", response_model=List[dict])
+async def get_career_matches(
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get career matches for current user."""
+    return await async_career_service.get_career_matches(db, current_user.id)
+
+
+@router.post("/cohort/matches")
+async def score_cohort(
+    request: CohortMatchRequest,
+    current_user: Principal = Depends(get_placement_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Stream career matches for a cohort of users as NDJSON, one line per user."""
+    try:
+        results = await async_career_service.score_cohort(db, request.user_ids, request.limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return StreamingResponse(
+        (json.dumps(result) + "\n" for result in results),
+        media_type="application/x-ndjson"
+    )
+
+
+@router.get("/matches/{match_id}", response_model=dict)
+async def get_career_match(
+    match_id: int,
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a specific career match by ID."""
+    match = await async_career_service.get_career_match_by_id(db, current_user.id, match_id)
+    if not match:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Career match not found")
+    return match
+
+
+@router.get("/readiness", response_model=ReadinessScoreResponse)
+async def get_readiness_score(
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get user's readiness score."""
+    return await async_career_service.get_readiness_score(db, current_user.id)
+
+
+@router.get("/dashboard-stats", response_model=DashboardStatsResponse)
+async def get_dashboard_stats(
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get dashboard statistics."""
+    return await async_career_service.get_dashboard_stats(db, current_user.id)
+
+
+@router.get("/trends", response_model=List[CareerTrendResponse])
+async def get_career_trends(
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get career readiness progress over time."""
+    return await async_career_service.get_career_trends(db, current_user.id)
+
+
+@router.get("/activity", response_model=List[ActivityDataResponse])
+async def get_activity_data(
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get weekly activity data."""
+    return await async_career_service.get_activity_data(db, current_user.id)
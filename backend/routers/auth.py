@@ -2,8 +2,8 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from backend.database import get_db
-from backend.auth import get_current_user
-from backend.models.models import User
+from backend.hashing import PasswordHasherBusyError
+from backend.auth import Principal, get_current_user
 from backend.schemas.user import LoginRequest, RegisterRequest, TokenResponse, ChangePasswordRequest, UserResponse
 from backend.services import auth_service
 
@@ -15,6 +15,12 @@ def register(user_data: RegisterRequest, db: Session = Depends(get_db)):
     """Register a new user."""
     try:
         return auth_service.register(db, user_data)
+    except PasswordHasherBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -24,6 +30,12 @@ def login(login_data: LoginRequest, db: Session = Depends(get_db)):
     """Authenticate user and return tokens."""
     try:
         return auth_service.login(db, login_data)
+    except PasswordHasherBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
 
@@ -40,22 +52,28 @@ def refresh_token(refresh_data: dict, db: Session = Depends(get_db)):
 @router.post("/change-password")
 def change_password(
     password_data: ChangePasswordRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Change user password."""
     try:
         auth_service.change_password(
-            db, current_user, 
+            db, current_user.id, 
             password_data.current_password, 
             password_data.new_password
         )
         return {"message": "Password changed successfully"}
+    except PasswordHasherBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user_info(current_user: User = Depends(get_current_user)):
+def get_current_user_info(current_user: Principal = Depends(get_current_user)):
     """Get current user information."""
     return UserResponse.model_validate(current_user)
@@ -1,12 +1,15 @@
+import json
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List
 
 from backend.database import get_db
-from backend.auth import get_current_user
-from backend.models.models import User
+from backend.auth import Principal, get_current_user, get_placement_user
 from backend.schemas.career import (
     CareerMatchBase,
+    CohortMatchRequest,
     ReadinessScoreResponse,
     DashboardStatsResponse,
     CareerTrendResponse,
@@ -19,17 +22,34 @@ router = APIRouter(prefix="/careers", tags=["Careers"])
 
 @router.get("/matches", response_model=List[dict])
 def get_career_matches(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get career matches for current user."""
     return career_service.get_career_matches(db, current_user.id)
 
 
+@router.post("/cohort/matches")
+def score_cohort(
+    request: CohortMatchRequest,
+    current_user: Principal = Depends(get_placement_user),
+    db: Session = Depends(get_db)
+):
+    """Stream career matches for a cohort of users as NDJSON, one line per user."""
+    try:
+        results = career_service.score_cohort(db, request.user_ids, request.limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return StreamingResponse(
+        (json.dumps(result) + "\n" for result in results),
+        media_type="application/x-ndjson"
+    )
+
+
 @router.get("/matches/{match_id}", response_model=dict)
 def get_career_match(
     match_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get a specific career match by ID."""
@@ -41,7 +61,7 @@ def get_career_match(
 
 @router.get("/readiness", response_model=ReadinessScoreResponse)
 def get_readiness_score(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get user's readiness score."""
@@ -50,7 +70,7 @@ def get_readiness_score(
 
 @router.get("/dashboard-stats", response_model=DashboardStatsResponse)
 def get_dashboard_stats(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get dashboard statistics."""
@@ -59,7 +79,7 @@ def get_dashboard_stats(
 
 @router.get("/trends", response_model=List[CareerTrendResponse])
 def get_career_trends(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get career readiness progress over time."""
@@ -68,7 +88,7 @@ def get_career_trends(
 
 @router.get("/activity", response_model=List[ActivityDataResponse])
 def get_activity_data(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get weekly activity data."""
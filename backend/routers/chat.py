@@ -1,20 +1,102 @@
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from typing import AsyncIterator, Dict, Optional, Tuple
 
+from backend.config import settings
 from backend.database import get_db
-from backend.auth import get_current_user
-from backend.models.models import User
-from backend.schemas.chat import ChatRequest, ChatResponse
+from backend.auth import Principal, get_current_user
+from backend.llm import LLMUnavailableError
+from backend.schemas.chat import ChatHistoryResponse, ChatRequest, ChatResponse
 from backend.services import chat_service
 
 router = APIRouter(prefix="/chat", tags=["Chat"])
 
 
+def _format_event(event: str, data: Dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _event_stream(events: AsyncIterator[Tuple[str, Dict]]) -> AsyncIterator[str]:
+    """Frame events as Server-Sent Events.
+    
+    The next event is only requested once the previous one has been sent,
+    so a slow client throttles generation instead of buffering it. Idle
+    gaps get keep-alive comments, and the stream ends after
+    CHAT_STREAM_TIMEOUT_SECONDS. On client disconnect the response task is
+    cancelled and the `finally` block stops the producer.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.CHAT_STREAM_TIMEOUT_SECONDS
+    pending = None
+    try:
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                yield _format_event("error", {"detail": "Response timed out"})
+                return
+            if pending is None:
+                pending = asyncio.ensure_future(events.__anext__())
+            done, _ = await asyncio.wait({pending}, timeout=min(settings.CHAT_STREAM_KEEPALIVE_SECONDS, remaining))
+            if not done:
+                # Comment lines keep proxies from closing an idle connection
+                yield ": keep-alive\n\n"
+                continue
+            
+            task, pending = pending, None
+            try:
+                event, data = task.result()
+            except StopAsyncIteration:
+                return
+            yield _format_event(event, data)
+    finally:
+        # No awaits here: the response task may already be cancelled
+        if pending is not None:
+            pending.cancel()
+        else:
+            asyncio.ensure_future(events.aclose())
+
+
 @router.post("", response_model=ChatResponse)
 def send_message(
     chat_data: ChatRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Send a message to AI chat and get response."""
-    return chat_service.process_message(db, current_user.id, chat_data.message)
+    try:
+        return chat_service.process_message(db, current_user.id, chat_data.message)
+    except LLMUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+
+
+@router.post("/stream")
+def stream_message(
+    chat_data: ChatRequest,
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Stream the AI response as Server-Sent Events, followed by suggestions."""
+    events = chat_service.stream_message(db, current_user.id, chat_data.message)
+    return StreamingResponse(
+        _event_stream(events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/history", response_model=ChatHistoryResponse)
+def get_history(
+    before: Optional[int] = Query(None, description="Cursor from a previous page's next_cursor"),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get the current user's chat history, newest page first."""
+    return chat_service.get_history(db, current_user.id, before, limit)
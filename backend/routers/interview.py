@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from backend.database import get_db
 from backend.auth import get_current_user
 from backend.models.models import User
+from backend.prerendered import prerendered_responses
 from backend.schemas.interview import (
     InterviewQuestionResponse,
     InterviewCategoryResponse,
@@ -16,21 +17,47 @@ router = APIRouter(prefix="/interview", tags=["Interview"])
 
 
 @router.get("/questions", response_model=List[InterviewQuestionResponse])
-def get_all_questions():
-    """Get all interview questions."""
-    return interview_service.get_all_questions()
+def get_all_questions(
+    request: Request,
+    response: Response,
+    category: Optional[str] = None,
+    difficulty: Optional[str] = None,
+    tag: List[str] = Query([], description="Repeat to require several tags"),
+    after: Optional[int] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+    limit: Optional[int] = Query(None, ge=1, le=200)
+):
+    """Get interview questions matching all filters, in id order.
+    
+    Without filters or paging the full list is served prerendered. When
+    more questions match than `limit`, the X-Next-Cursor header carries the
+    `after` value for the next page.
+    """
+    if category is None and difficulty is None and not tag and after is None and limit is None:
+        return prerendered_responses.respond(
+            request, "interview_questions", "interview_questions", interview_service.get_all_questions
+        )
+    
+    questions, next_cursor = interview_service.find_questions(category, difficulty, tag, after, limit)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return questions
 
 
 @router.get("/questions/{question_id}", response_model=InterviewQuestionResponse)
 def get_question(question_id: int):
     """Get a specific interview question by ID."""
-    return interview_service.get_question_by_id(question_id)
+    question = interview_service.get_question_by_id(question_id)
+    if question is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question not found")
+    return question
 
 
 @router.get("/categories", response_model=List[InterviewCategoryResponse])
-def get_categories():
+def get_categories(request: Request):
     """Get all interview categories with questions."""
-    return interview_service.get_all_categories()
+    return prerendered_responses.respond(
+        request, "interview_categories", "interview_questions", interview_service.get_all_categories
+    )
 
 
 @router.get("/categories/{category}", response_model=InterviewCategoryResponse)
@@ -40,6 +67,8 @@ def get_questions_by_category(category: str):
 
 
 @router.get("/stats", response_model=InterviewStatsResponse)
-def get_interview_stats():
+def get_interview_stats(request: Request):
     """Get interview preparation statistics."""
-    return interview_service.get_stats()
+    return prerendered_responses.respond(
+        request, "interview_stats", "interview_questions", interview_service.get_stats
+    )
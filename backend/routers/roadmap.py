@@ -1,11 +1,16 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from typing import List
 
 from backend.database import get_db
-from backend.auth import get_current_user
-from backend.models.models import User
-from backend.schemas.roadmap import LearningRoadmapResponse, CourseProgressUpdate
+from backend.auth import Principal, get_current_user
+from backend.schemas.roadmap import (
+    LearningRoadmapResponse,
+    CourseProgressUpdate,
+    CourseProgressBulkUpdate,
+    CourseResponse,
+    CourseSearchResponse
+)
 from backend.services import roadmap_service
 
 router = APIRouter(prefix="/roadmap", tags=["Roadmap"])
@@ -13,33 +18,67 @@ router = APIRouter(prefix="/roadmap", tags=["Roadmap"])
 
 @router.get("", response_model=LearningRoadmapResponse)
 def get_learning_roadmap(
-    current_user: User = Depends(get_current_user),
+    limit: int = Query(50, ge=1, le=500, description="Courses per stage"),
+    offset: int = Query(0, ge=0),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get learning roadmap for current user."""
-    return roadmap_service.get_learning_roadmap(db, current_user.id)
+    # The roadmap is assembled from pre-serialized fragments
+    return Response(
+        content=roadmap_service.get_learning_roadmap(db, current_user.id, limit, offset),
+        media_type="application/json"
+    )
 
 
 @router.get("/recommended")
 def get_recommended_courses(
-    current_user: User = Depends(get_current_user),
+    limit: int = Query(3, ge=1, le=20),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get AI-recommended courses based on user profile."""
-    return roadmap_service.get_recommended_courses(db, current_user.id)
+    return roadmap_service.get_recommended_courses(db, current_user.id, limit)
+
+
+@router.get("/courses/search", response_model=CourseSearchResponse)
+def search_courses(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    current_user: Principal = Depends(get_current_user)
+):
+    """Search courses by name, category and topics."""
+    return roadmap_service.search_courses(q, limit, offset)
 
 
 @router.put("/courses/{course_id}")
 def update_course_progress(
     course_id: int,
     progress_data: CourseProgressUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Update course progress."""
-    return roadmap_service.update_course_progress(
-        db, current_user.id, 
-        course_id, 
-        progress_data.progress, 
-        progress_data.status
-    )
+    try:
+        return roadmap_service.update_course_progress(
+            db, current_user.id, 
+            course_id, 
+            progress_data.progress, 
+            progress_data.status
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.put("/courses", response_model=List[CourseResponse])
+def save_course_progress(
+    progress_data: CourseProgressBulkUpdate,
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Save progress for many courses at once."""
+    try:
+        return roadmap_service.save_course_progress(db, current_user.id, progress_data.updates)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -1,11 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from backend.database import get_db
-from backend.auth import get_current_user
-from backend.models.models import User
-from backend.schemas.skill import SkillGapResponse, SkillAnalysisResponse
+from backend.auth import Principal, get_current_user
+from backend.schemas.skill import SkillGapResponse, SkillAnalysisResponse, RoleFitResponse
 from backend.services import skill_service
 
 router = APIRouter(prefix="/skills", tags=["Skills"])
@@ -13,7 +12,7 @@ router = APIRouter(prefix="/skills", tags=["Skills"])
 
 @router.get("/analysis", response_model=SkillAnalysisResponse)
 def get_skill_analysis(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get comprehensive skill analysis for current user."""
@@ -22,16 +21,30 @@ def get_skill_analysis(
 
 @router.get("/gaps", response_model=List[SkillGapResponse])
 def get_skill_gaps(
-    current_user: User = Depends(get_current_user),
+    role: Optional[str] = Query(None, description="Target role; defaults to the closest role"),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get skill gaps for current user."""
-    return skill_service.get_skill_gaps(db, current_user.id)
+    try:
+        return skill_service.get_skill_gaps(db, current_user.id, role)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.get("/role-fit", response_model=List[RoleFitResponse])
+def get_role_fit(
+    limit: int = Query(5, ge=1, le=50),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get the job roles closest to the current user's skills."""
+    return skill_service.get_role_fit(db, current_user.id, limit)
 
 
 @router.get("/priority")
 def get_priority_skills(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get high priority skills for current user."""
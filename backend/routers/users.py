@@ -3,8 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List
 
 from backend.database import get_db
-from backend.auth import get_current_user
-from backend.models.models import User
+from backend.auth import Principal, get_current_user
 from backend.schemas.user import (
     UserResponse,
     UserUpdate,
@@ -17,13 +16,14 @@ from backend.schemas.user import (
     UserWithSkills
 )
 from backend.services import user_service
+from backend.services.user_service import DuplicateSkillError
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
 @router.get("/me", response_model=UserWithSkills)
 def get_current_user_profile(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get current user profile with skills and preferences."""
@@ -33,7 +33,7 @@ def get_current_user_profile(
 @router.put("/me", response_model=UserResponse)
 def update_user_profile(
     user_data: UserUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Update user profile."""
@@ -46,7 +46,7 @@ def update_user_profile(
 @router.post("/onboarding", response_model=UserResponse)
 def complete_onboarding(
     onboarding_data: OnboardingRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Complete user onboarding."""
@@ -59,7 +59,7 @@ def complete_onboarding(
 # Skills endpoints
 @router.get("/skills", response_model=List[UserSkillResponse])
 def get_user_skills(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get all skills for current user."""
@@ -69,7 +69,7 @@ def get_user_skills(
 @router.post("/skills", response_model=UserSkillResponse, status_code=status.HTTP_201_CREATED)
 def add_skill(
     skill_data: UserSkillCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Add a skill to user profile."""
@@ -80,12 +80,14 @@ def add_skill(
 def update_skill(
     skill_id: int,
     skill_data: UserSkillUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Update user skill."""
     try:
         return user_service.update_skill(db, current_user.id, skill_id, skill_data)
+    except DuplicateSkillError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
@@ -93,7 +95,7 @@ def update_skill(
 @router.delete("/skills/{skill_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_skill(
     skill_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Delete user skill."""
@@ -106,7 +108,7 @@ def delete_skill(
 # Preferences endpoints
 @router.get("/preferences", response_model=List[UserPreferenceResponse])
 def get_user_preferences(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get all preferences for current user."""
@@ -116,7 +118,7 @@ def get_user_preferences(
 @router.post("/preferences", response_model=UserPreferenceResponse, status_code=status.HTTP_201_CREATED)
 def add_preference(
     pref_data: UserPreferenceCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Add user preference."""
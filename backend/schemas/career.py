@@ -19,6 +19,12 @@ class CareerMatchResponse(CareerMatchBase):
         from_attributes = True
 
 
+# Cohort scoring
+class CohortMatchRequest(BaseModel):
+    user_ids: List[int] = Field(..., min_length=1)
+    limit: int = Field(10, ge=1, le=50)
+
+
 # Readiness Score
 class ReadinessScoreResponse(BaseModel):
     overall_score: float
@@ -37,3 +37,4 @@ class ChatResponse(BaseModel):
 # Chat History
 class ChatHistoryResponse(BaseModel):
     messages: List[ChatMessageResponse] = []
+    next_cursor: Optional[int] = Field(None, description="Pass as `before` to load older messages")
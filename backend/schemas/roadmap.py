@@ -20,6 +20,24 @@ class CourseResponse(CourseBase):
         from_attributes = True
 
 
+class CourseSearchResult(BaseModel):
+    id: int
+    title: str
+    category: Optional[str] = None
+    difficulty: Optional[str] = None
+    duration: str
+    topics: int
+    score: float
+
+
+class CourseSearchResponse(BaseModel):
+    query: str
+    total: int
+    limit: int
+    offset: int
+    results: List[CourseSearchResult] = []
+
+
 # Stage/Level schemas
 class RoadmapStageBase(BaseModel):
     stage: str  # Foundation, Intermediate, Advanced
@@ -28,6 +46,7 @@ class RoadmapStageBase(BaseModel):
 
 
 class RoadmapStageResponse(RoadmapStageBase):
+    total: int = 0  # Courses in the stage; `courses` holds one page of them
     courses: List[CourseResponse] = []
 
     class Config:
@@ -68,3 +87,7 @@ class CourseProgressUpdate(BaseModel):
     course_id: int
     progress: float = Field(..., ge=0, le=100)
     status: str = Field(..., description="not-started, in-progress, completed, or locked")
+
+
+class CourseProgressBulkUpdate(BaseModel):
+    updates: List[CourseProgressUpdate] = Field(..., min_length=1, max_length=500)
@@ -34,6 +34,15 @@ class SkillGapResponse(SkillGapBase):
         from_attributes = True
 
 
+# Role fit across all job roles
+class RoleFitResponse(BaseModel):
+    role: str
+    readiness: float = Field(..., ge=0, le=100)
+    matched_skills: int
+    missing_skills: int
+    demand: Optional[str] = None
+
+
 # Skill Radar Data
 class SkillRadarData(BaseModel):
     skill: str
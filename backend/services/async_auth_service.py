@@ -0,0 +1,127 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.audit import login_history_writer
+from backend.auth import (
+    create_access_token,
+    create_refresh_token,
+    decode_token
+)
+from backend.hashing import password_hasher
+from backend.models.models import User
+from backend.schemas.user import RegisterRequest, LoginRequest, TokenResponse, UserResponse
+from backend.services.auth_service import AuthService
+
+
+class AsyncAuthService:
+    """Async service for authentication operations."""
+    
+    @staticmethod
+    async def register(db: AsyncSession, user_data: RegisterRequest) -> TokenResponse:
+        """Register a new user."""
+        # Check if user already exists
+        result = await db.execute(select(User).where(User.email == user_data.email))
+        if result.scalars().first():
+            raise ValueError("User with this email already exists")
+        
+        # Create new user; bcrypt is CPU bound, keep it off the event loop
+        hashed_password = await password_hasher.hash_async(user_data.password)
+        new_user = User(
+            email=user_data.email,
+            name=user_data.name,
+            password_hash=hashed_password,
+            role="student"
+        )
+        
+        db.add(new_user)
+        await db.commit()
+        await db.refresh(new_user)
+        
+        # Generate tokens
+        access_token = create_access_token(data={"sub": new_user.id})
+        refresh_token = create_refresh_token(data={"sub": new_user.id})
+        
+        return TokenResponse(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            user=UserResponse.model_validate(new_user)
+        )
+    
+    @staticmethod
+    async def login(db: AsyncSession, login_data: LoginRequest, ip_address: str = None, user_agent: str = None) -> TokenResponse:
+        """Authenticate user and return tokens."""
+        # Find user by email
+        result = await db.execute(select(User).where(User.email == login_data.email))
+        user = result.scalars().first()
+        if not user:
+            raise ValueError("Invalid email or password")
+        
+        # Verify password
+        if not await password_hasher.verify_async(login_data.password, user.password_hash):
+            raise ValueError("Invalid email or password")
+        
+        AuthService.schedule_rehash(user, login_data.password)
+        
+        # Log login history; written in bulk by the background writer
+        login_history_writer.enqueue(user.id, ip_address, user_agent)
+        
+        # Generate tokens
+        access_token = create_access_token(data={"sub": user.id})
+        refresh_token = create_refresh_token(data={"sub": user.id})
+        
+        return TokenResponse(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            token_type="bearer",
+            user=UserResponse.model_validate(user)
+        )
+    
+    @staticmethod
+    async def refresh_token(db: AsyncSession, refresh_token: str) -> TokenResponse:
+        """Refresh access token using refresh token."""
+        # Decode refresh token
+        payload = decode_token(refresh_token)
+        if not payload or payload.get("type") != "refresh":
+            raise ValueError("Invalid refresh token")
+        
+        user_id = payload.get("sub")
+        if not user_id:
+            raise ValueError("Invalid refresh token")
+        
+        # Find user
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalars().first()
+        if not user:
+            raise ValueError("User not found")
+        
+        # Generate new tokens
+        access_token = create_access_token(data={"sub": user.id})
+        new_refresh_token = create_refresh_token(data={"sub": user.id})
+        
+        return TokenResponse(
+            access_token=access_token,
+            refresh_token=new_refresh_token,
+            token_type="bearer",
+            user=UserResponse.model_validate(user)
+        )
+    
+    @staticmethod
+    async def change_password(db: AsyncSession, user_id: int, current_password: str, new_password: str) -> bool:
+        """Change user password."""
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalars().first()
+        if not user:
+            raise ValueError("User not found")
+        
+        # Verify current password
+        if not await password_hasher.verify_async(current_password, user.password_hash):
+            raise ValueError("Current password is incorrect")
+        
+        # Update password
+        user.password_hash = await password_hasher.hash_async(new_password)
+        await db.commit()
+        
+        return True
+
+
+async_auth_service = AsyncAuthService()
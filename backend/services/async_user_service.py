@@ -0,0 +1,241 @@
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, List
+
+from backend.cache import profile_cache
+from backend.models.models import User, UserSkill, UserPreference, Prediction
+from backend.schemas.user import (
+    UserUpdate,
+    UserWithSkills,
+    UserSkillCreate,
+    UserSkillUpdate,
+    UserPreferenceCreate,
+    OnboardingRequest
+)
+from backend.services.user_service import DuplicateSkillError
+
+
+class AsyncUserService:
+    """Async service for user profile operations."""
+    
+    @staticmethod
+    async def get_user(db: AsyncSession, user_id: int) -> Optional[User]:
+        """Get user by ID."""
+        result = await db.execute(select(User).where(User.id == user_id))
+        return result.scalars().first()
+    
+    @staticmethod
+    async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
+        """Get user by email."""
+        result = await db.execute(select(User).where(User.email == email))
+        return result.scalars().first()
+    
+    @staticmethod
+    async def get_user_with_skills(db: AsyncSession, user_id: int) -> Optional[UserWithSkills]:
+        """Get user with skills and preferences."""
+        user = await AsyncUserService.get_user(db, user_id)
+        if not user:
+            return None
+        
+        skills = await AsyncUserService.get_user_skills(db, user_id)
+        preferences = await AsyncUserService.get_user_preferences(db, user_id)
+        
+        return UserWithSkills(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            role=user.role,
+            education=user.education,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            skills=skills,
+            preferences=preferences
+        )
+    
+    @staticmethod
+    async def update_user(db: AsyncSession, user_id: int, user_data: UserUpdate) -> User:
+        """Update user profile."""
+        user = await AsyncUserService.get_user(db, user_id)
+        if not user:
+            raise ValueError("User not found")
+        
+        if user_data.name is not None:
+            user.name = user_data.name
+        if user_data.education is not None:
+            user.education = user_data.education
+        if user_data.role is not None:
+            user.role = user_data.role
+        
+        await db.commit()
+        profile_cache.invalidate(user_id)
+        await db.refresh(user)
+        return user
+    
+    @staticmethod
+    async def add_skill(db: AsyncSession, user_id: int, skill_data: UserSkillCreate) -> UserSkill:
+        """Add a skill to user profile."""
+        # Check if skill already exists
+        result = await db.execute(select(UserSkill).where(
+            UserSkill.user_id == user_id,
+            UserSkill.skill_name == skill_data.skill_name
+        ))
+        existing_skill = result.scalars().first()
+        
+        if existing_skill:
+            # Update existing skill
+            existing_skill.proficiency = skill_data.proficiency
+            await db.commit()
+            profile_cache.invalidate(user_id)
+            await db.refresh(existing_skill)
+            return existing_skill
+        
+        # Create new skill
+        new_skill = UserSkill(
+            user_id=user_id,
+            skill_name=skill_data.skill_name,
+            proficiency=skill_data.proficiency
+        )
+        db.add(new_skill)
+        try:
+            await db.commit()
+        except IntegrityError:
+            # A concurrent request added the same skill first; update that one instead
+            await db.rollback()
+            result = await db.execute(select(UserSkill).where(
+                UserSkill.user_id == user_id,
+                UserSkill.skill_name == skill_data.skill_name
+            ))
+            new_skill = result.scalars().first()
+            if new_skill is None:
+                raise
+            new_skill.proficiency = skill_data.proficiency
+            await db.commit()
+        profile_cache.invalidate(user_id)
+        await db.refresh(new_skill)
+        return new_skill
+    
+    @staticmethod
+    async def update_skill(db: AsyncSession, user_id: int, skill_id: int, skill_data: UserSkillUpdate) -> UserSkill:
+        """Update user skill."""
+        result = await db.execute(select(UserSkill).where(
+            UserSkill.id == skill_id,
+            UserSkill.user_id == user_id
+        ))
+        skill = result.scalars().first()
+        
+        if not skill:
+            raise ValueError("Skill not found")
+        
+        if skill_data.skill_name is not None:
+            skill.skill_name = skill_data.skill_name
+        if skill_data.proficiency is not None:
+            skill.proficiency = skill_data.proficiency
+        
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise DuplicateSkillError("Skill with this name already exists")
+        profile_cache.invalidate(user_id)
+        await db.refresh(skill)
+        return skill
+    
+    @staticmethod
+    async def delete_skill(db: AsyncSession, user_id: int, skill_id: int) -> bool:
+        """Delete user skill."""
+        result = await db.execute(select(UserSkill).where(
+            UserSkill.id == skill_id,
+            UserSkill.user_id == user_id
+        ))
+        skill = result.scalars().first()
+        
+        if not skill:
+            raise ValueError("Skill not found")
+        
+        await db.delete(skill)
+        await db.commit()
+        profile_cache.invalidate(user_id)
+        return True
+    
+    @staticmethod
+    async def get_user_skills(db: AsyncSession, user_id: int) -> List[UserSkill]:
+        """Get all skills for user."""
+        result = await db.execute(select(UserSkill).where(UserSkill.user_id == user_id))
+        return list(result.scalars().all())
+    
+    @staticmethod
+    async def add_preference(db: AsyncSession, user_id: int, pref_data: UserPreferenceCreate) -> UserPreference:
+        """Add user preference."""
+        # Check if preference already exists
+        result = await db.execute(select(UserPreference).where(
+            UserPreference.user_id == user_id,
+            UserPreference.interest == pref_data.interest
+        ))
+        existing_pref = result.scalars().first()
+        
+        if existing_pref:
+            return existing_pref
+        
+        new_pref = UserPreference(
+            user_id=user_id,
+            interest=pref_data.interest,
+            goal=pref_data.goal
+        )
+        db.add(new_pref)
+        await db.commit()
+        profile_cache.invalidate(user_id)
+        await db.refresh(new_pref)
+        return new_pref
+    
+    @staticmethod
+    async def get_user_preferences(db: AsyncSession, user_id: int) -> List[UserPreference]:
+        """Get all preferences for user."""
+        result = await db.execute(select(UserPreference).where(UserPreference.user_id == user_id))
+        return list(result.scalars().all())
+    
+    @staticmethod
+    async def complete_onboarding(db: AsyncSession, user_id: int, onboarding_data: OnboardingRequest) -> User:
+        """Complete user onboarding."""
+        user = await AsyncUserService.get_user(db, user_id)
+        if not user:
+            raise ValueError("User not found")
+        
+        # Update user education
+        user.education = onboarding_data.education
+        
+        # Add skills not already on the profile, then interests and goals
+        existing_skills = set((await db.execute(
+            select(UserSkill.skill_name).where(UserSkill.user_id == user_id)
+        )).scalars())
+        db.add_all([
+            UserSkill(user_id=user_id, skill_name=skill_name, proficiency=50)
+            for skill_name in dict.fromkeys(onboarding_data.skills)
+            if skill_name not in existing_skills
+        ])
+        db.add_all([
+            UserPreference(user_id=user_id, interest=interest)
+            for interest in onboarding_data.interests
+        ])
+        db.add_all([
+            UserPreference(user_id=user_id, goal=goal)
+            for goal in onboarding_data.goals
+        ])
+        
+        await db.commit()
+        profile_cache.invalidate(user_id)
+        await db.refresh(user)
+        return user
+    
+    @staticmethod
+    async def get_predictions(db: AsyncSession, user_id: int) -> List[Prediction]:
+        """Get user's career predictions."""
+        result = await db.execute(
+            select(Prediction)
+            .where(Prediction.user_id == user_id)
+            .order_by(Prediction.created_at.desc())
+        )
+        return list(result.scalars().all())
+
+
+async_user_service = AsyncUserService()
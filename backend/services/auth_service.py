@@ -1,16 +1,18 @@
+import functools
 from datetime import timedelta
 from sqlalchemy.orm import Session
 from typing import Optional
 
+from backend.audit import login_history_writer
 from backend.auth import (
-    get_password_hash,
-    verify_password,
     create_access_token,
     create_refresh_token,
     decode_token
 )
 from backend.config import settings
-from backend.models.models import User, LoginHistory
+from backend.database import SessionLocal
+from backend.hashing import password_hasher
+from backend.models.models import User
 from backend.schemas.user import RegisterRequest, LoginRequest, TokenResponse, UserResponse
 
 
@@ -26,7 +28,7 @@ class AuthService:
             raise ValueError("User with this email already exists")
         
         # Create new user
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = password_hasher.hash(user_data.password)
         new_user = User(
             email=user_data.email,
             name=user_data.name,
@@ -57,17 +59,13 @@ class AuthService:
             raise ValueError("Invalid email or password")
         
         # Verify password
-        if not verify_password(login_data.password, user.password_hash):
+        if not password_hasher.verify(login_data.password, user.password_hash):
             raise ValueError("Invalid email or password")
         
-        # Log login history
-        login_record = LoginHistory(
-            user_id=user.id,
-            ip_address=ip_address,
-            user_agent=user_agent
-        )
-        db.add(login_record)
-        db.commit()
+        AuthService.schedule_rehash(user, login_data.password)
+        
+        # Log login history; written in bulk by the background writer
+        login_history_writer.enqueue(user.id, ip_address, user_agent)
         
         # Generate tokens
         access_token = create_access_token(data={"sub": user.id})
@@ -109,17 +107,47 @@ class AuthService:
         )
     
     @staticmethod
-    def change_password(db: Session, user: User, current_password: str, new_password: str) -> bool:
+    def change_password(db: Session, user_id: int, current_password: str, new_password: str) -> bool:
         """Change user password."""
+        user = db.query(User).filter(User.id == user_id).first()
+        if not user:
+            raise ValueError("User not found")
+        
         # Verify current password
-        if not verify_password(current_password, user.password_hash):
+        if not password_hasher.verify(current_password, user.password_hash):
             raise ValueError("Current password is incorrect")
         
         # Update password
-        user.password_hash = get_password_hash(new_password)
+        user.password_hash = password_hasher.hash(new_password)
         db.commit()
         
         return True
+    
+    
+    @staticmethod
+    def schedule_rehash(user: User, password: str) -> None:
+        """Rehash a verified password off the request path if its cost is outdated."""
+        if password_hasher.needs_rehash(user.password_hash):
+            password_hasher.rehash_in_background(
+                password,
+                functools.partial(AuthService._store_rehashed_password, user.id, user.password_hash)
+            )
+    
+    @staticmethod
+    def _store_rehashed_password(user_id: int, old_hash: str, new_hash: str) -> None:
+        """Replace a stored hash unless the password changed in the meantime."""
+        db = SessionLocal()
+        try:
+            # Assigning the loaded row keeps the principal invalidation scoped to this user
+            user = db.query(User).filter(User.id == user_id, User.password_hash == old_hash).first()
+            if user is not None:
+                user.password_hash = new_hash
+                db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"Error storing rehashed password: {e}")
+        finally:
+            db.close()
 
 
 auth_service = AuthService()
@@ -1,10 +1,15 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 
+from backend.cache import profile_cache
+from backend.config import settings
 from backend.models.models import User, UserSkill, UserPreference, Prediction
 from backend.data_loaders.job_roles import job_roles_loader
+from backend.data_loaders.registry import dataset_registry
 from backend.data_loaders.skills import skills_loader
+from backend.services.precompute_service import PrecomputeService
+from backend.services.prediction_service import PredictionService
 from backend.schemas.career import (
     CareerMatchBase,
     CareerMatchResponse,
@@ -19,6 +24,7 @@ class CareerService:
     """Service for career prediction and analysis operations."""
     
     @staticmethod
+    @profile_cache.memoize("career_matches")
     def get_career_matches(db: Session, user_id: int) -> List[Dict]:
         """Get career matches for user based on their skills."""
         # Get user skills
@@ -29,22 +35,74 @@ class CareerService:
             # Return default careers for new users
             return job_roles_loader.get_career_matches([], limit=5)
         
+        # Prefer the offline precomputed row, then the latest snapshot
+        precomputed = PrecomputeService.get_current(db, user_id, user_skills)
+        if precomputed is not None:
+            return precomputed.career_matches
+        
+        skills_hash = PredictionService.compute_skills_hash(
+            user_skills, dataset_registry.version("job_roles")
+        )
+        snapshot = PredictionService.get_current_snapshot(db, user_id, skills_hash)
+        if snapshot:
+            return snapshot.career_matches
+        
         # Get career matches from job roles loader
         matches = job_roles_loader.get_career_matches(skill_names, limit=10)
         
-        # Save prediction to database
-        prediction = Prediction(
-            user_id=user_id,
-            career_matches=matches,
-            readiness_score=CareerService._calculate_readiness_score(len(skill_names)),
-            skill_gaps=[],
-            created_at=datetime.utcnow()
+        # Save prediction snapshot to database
+        PredictionService.save_snapshot(
+            db,
+            user_id,
+            skills_hash,
+            matches,
+            CareerService._calculate_readiness_score(len(skill_names))
         )
-        db.add(prediction)
-        db.commit()
         
         return matches
     
+    @staticmethod
+    def score_cohort(db: Session, user_ids: List[int], limit: int = 10) -> Iterator[Dict]:
+        """Load a cohort's skills in one query; returns a lazy iterator of per-user matches."""
+        user_ids = CareerService._validate_cohort(user_ids)
+        rows = db.query(UserSkill.user_id, UserSkill.skill_name).filter(
+            UserSkill.user_id.in_(user_ids)
+        ).all()
+        return CareerService.iter_cohort_matches(
+            user_ids, rows, limit, job_roles_loader.get_career_matches_batch
+        )
+    
+    @staticmethod
+    def _validate_cohort(user_ids: List[int]) -> List[int]:
+        """Drop duplicate IDs and enforce the cohort size limit."""
+        user_ids = list(dict.fromkeys(user_ids))
+        if len(user_ids) > settings.COHORT_MAX_USERS:
+            raise ValueError(f"At most {settings.COHORT_MAX_USERS} users can be scored per request")
+        return user_ids
+    
+    @staticmethod
+    def iter_cohort_matches(
+        user_ids: List[int],
+        skill_rows: List[Tuple[int, str]],
+        limit: int,
+        score_batch: Callable[[List[List[str]], int], List[List[Dict]]]
+    ) -> Iterator[Dict]:
+        """Yield career matches per user, scoring COHORT_BATCH_SIZE users per sparse product.
+        
+        `score_batch` is bound to one job roles dataset, so a stream that
+        outlives a dataset reload is scored consistently.
+        """
+        skills_by_user: Dict[int, List[str]] = {}
+        for user_id, skill_name in skill_rows:
+            skills_by_user.setdefault(user_id, []).append(skill_name)
+        
+        batch_size = max(settings.COHORT_BATCH_SIZE, 1)
+        for start in range(0, len(user_ids), batch_size):
+            batch = user_ids[start:start + batch_size]
+            matches = score_batch([skills_by_user.get(user_id, []) for user_id in batch], limit)
+            for user_id, user_matches in zip(batch, matches):
+                yield {"user_id": user_id, "matches": user_matches}
+    
     @staticmethod
     def get_career_match_by_id(db: Session, user_id: int, match_id: int) -> Optional[Dict]:
         """Get a specific career match by ID."""
@@ -68,6 +126,7 @@ class CareerService:
             return 85.0
     
     @staticmethod
+    @profile_cache.memoize("readiness_score")
     def get_readiness_score(db: Session, user_id: int) -> ReadinessScoreResponse:
         """Get user's readiness score with breakdown."""
         # Get user skills
@@ -111,6 +170,7 @@ class CareerService:
         )
     
     @staticmethod
+    @profile_cache.memoize("dashboard_stats")
     def get_dashboard_stats(db: Session, user_id: int) -> DashboardStatsResponse:
         """Get dashboard statistics."""
         # Get user skills
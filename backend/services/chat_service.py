@@ -1,9 +1,24 @@
 from sqlalchemy.orm import Session
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional, Tuple
 from datetime import datetime
 
-from backend.models.models import User
-from backend.schemas.chat import ChatMessageCreate, ChatMessageResponse, ChatRequest, ChatResponse
+from backend.chat_history import Turns, chat_history_writer, recent_context
+from backend.config import settings
+from backend.data_loaders.course_search import tokenize
+from backend.llm import CHUNK_PATTERN, ChatPrompt, LLMUnavailableError, create_llm_backend, create_llm_client
+from backend.models.models import ChatMessage, User
+from backend.response_cache import response_cache
+from backend.schemas.chat import ChatMessageCreate, ChatMessageResponse, ChatRequest, ChatResponse, ChatHistoryResponse
+
+SYSTEM_PROMPT = (
+    "You are LakshyaSetu AI, a career mentor for students and job seekers in tech. "
+    "Give specific, encouraging and actionable advice."
+)
+
+# Words that point back at earlier turns; messages without them are answered without history
+FOLLOW_UP_WORDS = frozenset("""
+again above also earlier elaborate else instead it its last more previous same that them they those
+""".split())
 
 
 class ChatService:
@@ -13,21 +28,172 @@ class ChatService:
     def process_message(db: Session, user_id: int, message: str) -> ChatResponse:
         """Process user message and return AI response."""
         user = db.query(User).filter(User.id == user_id).first()
+        history = ChatService._prompt_history(db, user_id, message)
         
-        # Generate response based on message content
-        response_text = ChatService._generate_response(message, user)
-        
-        # Generate suggestions
-        suggestions = ChatService._get_suggestions(message)
+        # Reuse the reply to a message with the same intent from a similar profile
+        profile_key = ChatService._profile_key(user, history)
+        cached = ChatService._lookup_cached(profile_key, message)
+        if cached is not None:
+            response_text, suggestions = cached
+        else:
+            response_text = llm_client.generate_sync(ChatService._build_prompt(message, user, history))
+            suggestions = ChatService._get_suggestions(message)
+            ChatService._store_cached(profile_key, message, response_text, suggestions)
+        ChatService._record_exchange(user_id, message, response_text)
         
         return ChatResponse(
             message=response_text,
             suggestions=suggestions
         )
     
+    @staticmethod
+    def stream_message(db: Session, user_id: int, message: str) -> AsyncIterator[Tuple[str, Dict]]:
+        """Look up the user now and return an async iterator of (event, data) pairs for the reply."""
+        user = db.query(User).filter(User.id == user_id).first()
+        history = ChatService._prompt_history(db, user_id, message)
+        profile_key = ChatService._profile_key(user, history)
+        cached = ChatService._lookup_cached(profile_key, message)
+        if cached is not None:
+            return ChatService._replay_events(user_id, message, *cached)
+        return ChatService._stream_events(
+            user_id, message, ChatService._build_prompt(message, user, history), profile_key
+        )
+    
+    @staticmethod
+    async def _stream_events(
+        user_id: int, message: str, prompt: ChatPrompt, profile_key: Optional[str]
+    ) -> AsyncIterator[Tuple[str, Dict]]:
+        """Reply chunks as `token` events, then `suggestions`, then `done`."""
+        chunks = []
+        try:
+            async for chunk in llm_client.stream(prompt):
+                chunks.append(chunk)
+                yield "token", {"delta": chunk}
+        except LLMUnavailableError as e:
+            yield "error", {"detail": str(e)}
+            return
+        # Only completed replies are saved
+        reply = "".join(chunks)
+        suggestions = ChatService._get_suggestions(message)
+        ChatService._store_cached(profile_key, message, reply, suggestions)
+        ChatService._record_exchange(user_id, message, reply)
+        yield "suggestions", {"suggestions": suggestions}
+        yield "done", {}
+    
+    @staticmethod
+    async def _replay_events(
+        user_id: int, message: str, reply: str, suggestions: List[str]
+    ) -> AsyncIterator[Tuple[str, Dict]]:
+        """Stream a cached reply in the same event sequence as a generated one."""
+        for chunk in CHUNK_PATTERN.findall(reply):
+            yield "token", {"delta": chunk}
+        ChatService._record_exchange(user_id, message, reply)
+        yield "suggestions", {"suggestions": suggestions}
+        yield "done", {}
+    
+    @staticmethod
+    def _is_follow_up(message: str) -> bool:
+        """Whether a message refers back to the conversation, e.g. "tell me more about that"."""
+        return not FOLLOW_UP_WORDS.isdisjoint(tokenize(message))
+    
+    @staticmethod
+    def _prompt_history(db: Session, user_id: int, message: str) -> Turns:
+        """Recent turns for follow-up messages; standalone questions are answered without them.
+        
+        The window is loaded either way so it keeps every recorded exchange.
+        """
+        history = ChatService.get_recent_context(db, user_id)
+        return history if ChatService._is_follow_up(message) else []
+    
+    @staticmethod
+    def _profile_key(user: Optional[User], history: Turns = ()) -> Optional[str]:
+        """The profile features a reply may depend on; cached replies are shared within one key.
+        
+        Replies to prompts that include the user's own conversation are
+        never shared, so there is no key for them.
+        """
+        if history:
+            return None
+        if user is None:
+            return "anonymous"
+        return f"{user.role or ''}|{user.education or ''}"
+    
+    @staticmethod
+    def _lookup_cached(profile_key: Optional[str], message: str) -> Optional[Tuple[str, List[str]]]:
+        """Cached (reply, suggestions) for a message with the same intent, if any."""
+        if not settings.CHAT_CACHE_ENABLED or profile_key is None:
+            return None
+        return response_cache.lookup(profile_key, message)
+    
+    @staticmethod
+    def _store_cached(profile_key: Optional[str], message: str, reply: str, suggestions: List[str]):
+        if settings.CHAT_CACHE_ENABLED and profile_key is not None:
+            response_cache.store(profile_key, message, (reply, suggestions))
+    
+    @staticmethod
+    def _build_prompt(message: str, user: Optional[User], history: Turns = ()) -> ChatPrompt:
+        """Build the model prompt for a user's message.
+        
+        Besides the user's own recent messages, which are only passed for
+        follow-up messages, just the profile features in `_profile_key` go
+        into the prompt. Prompts with history are not cached, so a shared
+        reply never carries details of another user.
+        """
+        system = SYSTEM_PROMPT
+        if user is not None:
+            system += f" The user is a {user.role or 'student'}"
+            system += f", education: {user.education}." if user.education else "."
+        return ChatPrompt(system, message, tuple(history))
+    
+    @staticmethod
+    def get_recent_context(db: Session, user_id: int) -> Turns:
+        """The user's last CHAT_CONTEXT_MESSAGES messages, oldest first.
+        
+        Messages still queued for writing are merged in, so a reloaded window
+        never loses the latest exchanges.
+        """
+        def load(window: int) -> Turns:
+            queued = [(row["role"], row["content"], row["timestamp"]) for row in chat_history_writer.pending_for(user_id)]
+            rows = db.query(ChatMessage.role, ChatMessage.content, ChatMessage.timestamp).filter(
+                ChatMessage.user_id == user_id
+            ).order_by(ChatMessage.id.desc()).limit(window).all()
+            written = [tuple(row) for row in reversed(rows)]
+            # A queued message may have been committed between the two reads
+            seen = set(written)
+            turns = written + [row for row in queued if row not in seen]
+            return [(role, content) for role, content, _ in turns[-window:]]
+        
+        return recent_context.get(user_id, load)
+    
+    @staticmethod
+    def _record_exchange(user_id: int, message: str, reply: str):
+        """Queue both sides of an exchange for writing and add them to the prompt context."""
+        for role, content in (("user", message), ("assistant", reply)):
+            chat_history_writer.enqueue(user_id, role, content)
+            recent_context.append(user_id, role, content)
+    
+    @staticmethod
+    def get_history(db: Session, user_id: int, before: Optional[int] = None, limit: int = 50) -> ChatHistoryResponse:
+        """Page backwards through a user's messages with a keyset cursor.
+        
+        Each page is an index range scan on (user_id, id), so the cost does not
+        grow with how far back the page is. Messages are returned oldest first.
+        """
+        query = db.query(ChatMessage).filter(ChatMessage.user_id == user_id)
+        if before is not None:
+            query = query.filter(ChatMessage.id < before)
+        rows = query.order_by(ChatMessage.id.desc()).limit(limit + 1).all()
+        
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return ChatHistoryResponse(
+            messages=[ChatMessageResponse.model_validate(row) for row in reversed(rows)],
+            next_cursor=rows[-1].id if has_more else None
+        )
+    
     @staticmethod
     def _generate_response(message: str, user: Optional[User]) -> str:
-        """Generate AI response based on user message."""
+        """Scripted reply used by the local model stand-in."""
         message_lower = message.lower()
         
         if "readiness" in message_lower or "score" in message_lower:
@@ -38,7 +204,7 @@ class ChatService:
 3. Work on a portfolio project that demonstrates your full-stack capabilities
 
 Focusing on these areas over the next 2-3 weeks could push your score to 85%+, making you highly competitive for your target roles."""
-        
+
         if "focus" in message_lower or "this week" in message_lower:
             return """Based on your current progress and upcoming milestones, here's what I recommend focusing on this week:
 
@@ -55,7 +221,7 @@ Focusing on these areas over the next 2-3 weeks could push your score to 85%+, m
 - Apply to 3-5 Frontend Developer positions that match your 92% score
 
 This balanced approach will help you maintain momentum while building market-ready skills."""
-        
+
         if "react" in message_lower:
             return """Here are some best practices for React development that align with current industry standards:
 
@@ -70,7 +236,7 @@ This balanced approach will help you maintain momentum while building market-rea
 5. **TypeScript**: Use it! It catches bugs early and improves developer experience.
 
 Would you like me to elaborate on any of these points?"""
-        
+
         if "career path" in message_lower or "career options" in message_lower:
             return f"""Software engineering offers diverse career paths! Based on your profile, here are the most promising options:
 
@@ -87,7 +253,7 @@ Average Salary: $90k-125k
 Grow into: Senior UI Engineer → Design Systems Lead → Principal Designer
 
 Your current skills align best with Frontend and Full Stack roles. Would you like a detailed roadmap for any specific path?"""
-        
+
         # Default response
         return """That's a great question! I'm here to help you with personalized career guidance. I can assist you with:
 
@@ -99,7 +265,7 @@ Your current skills align best with Frontend and Full Stack roles. Would you lik
 • Work-life balance in tech
 
 Feel free to ask me anything specific about your career journey!"""
-    
+
     @staticmethod
     def _get_suggestions(message: str) -> List[str]:
         """Get suggested follow-up questions."""
@@ -142,3 +308,8 @@ Feel free to ask me anything specific about your career journey!"""
 
 
 chat_service = ChatService()
+
+# Model client shared by all chat requests in this worker
+llm_client = create_llm_client(
+    create_llm_backend(local_reply=lambda prompt: ChatService._generate_response(prompt.message, None))
+)
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from typing import List, Dict
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from backend.data_loaders.interview import interview_questions_loader
 from backend.schemas.interview import (
@@ -12,38 +12,46 @@ from backend.schemas.interview import (
 class InterviewService:
     """Service for interview preparation operations."""
     
+    @staticmethod
+    def _to_response(q: Dict) -> InterviewQuestionResponse:
+        return InterviewQuestionResponse(
+            id=q["id"],
+            question=q["question"],
+            difficulty=q["difficulty"],
+            category=q["category"],
+            tags=q.get("tags", []),
+            answered=False,
+            rating=None
+        )
+    
     @staticmethod
     def get_all_questions() -> List[InterviewQuestionResponse]:
         """Get all interview questions."""
         questions = interview_questions_loader.get_all_questions()
         return [
-            InterviewQuestionResponse(
-                id=q["id"],
-                question=q["question"],
-                difficulty=q["difficulty"],
-                category=q["category"],
-                tags=q.get("tags", []),
-                answered=False,
-                rating=None
-            )
+            InterviewService._to_response(q)
             for q in questions
         ]
     
+    @staticmethod
+    def find_questions(
+        category: Optional[str] = None,
+        difficulty: Optional[str] = None,
+        tags: Iterable[str] = (),
+        after: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[List[InterviewQuestionResponse], Optional[int]]:
+        """Get one page of questions matching all filters, with the cursor for the next page."""
+        questions, next_cursor = interview_questions_loader.find_questions(category, difficulty, tags, after, limit)
+        return [InterviewService._to_response(q) for q in questions], next_cursor
+    
     @staticmethod
     def get_questions_by_category(category: str) -> InterviewCategoryResponse:
         """Get questions by category with statistics."""
         questions = interview_questions_loader.get_questions_by_category(category)
         
         question_responses = [
-            InterviewQuestionResponse(
-                id=q["id"],
-                question=q["question"],
-                difficulty=q["difficulty"],
-                category=q["category"],
-                tags=q.get("tags", []),
-                answered=False,
-                rating=None
-            )
+            InterviewService._to_response(q)
             for q in questions
         ]
         
@@ -72,15 +80,7 @@ class InterviewService:
         if not question:
             return None
         
-        return InterviewQuestionResponse(
-            id=question["id"],
-            question=question["question"],
-            difficulty=question["difficulty"],
-            category=question["category"],
-            tags=question.get("tags", []),
-            answered=False,
-            rating=None
-        )
+        return InterviewService._to_response(question)
     
     @staticmethod
     def get_stats() -> InterviewStatsResponse:
@@ -0,0 +1,90 @@
+from datetime import datetime
+from sqlalchemy import delete, insert, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional
+
+from backend.data_loaders.registry import dataset_registry
+from backend.models.models import UserSkill, UserRecommendation
+from backend.services.prediction_service import PredictionService
+
+# Bump when the precomputed payload changes shape or meaning
+FORMAT_VERSION = 3
+
+# Recommended courses stored per user, so completed ones can be dropped at read time
+RECOMMENDATION_CANDIDATES = 10
+
+# Datasets the precomputed rows are derived from
+DATASETS = ("job_roles", "courses")
+
+
+class PrecomputeService:
+    """Service for reading and writing materialized per-user recommendations."""
+    
+    @staticmethod
+    def _dataset_version(name: str) -> str:
+        # Avoid loading a dataset just to read its version
+        if dataset_registry.is_loaded(name):
+            return dataset_registry.version(name)
+        return dataset_registry.source_version(name)
+    
+    @staticmethod
+    def current_version() -> str:
+        """Version stamp for rows computed against the datasets in use now."""
+        versions = ":".join(PrecomputeService._dataset_version(name) for name in DATASETS)
+        return f"{FORMAT_VERSION}:{versions}"
+    
+    @staticmethod
+    def compute_hash(user_skills: List[UserSkill], version: str) -> str:
+        """Hash a user's skills together with a version stamp."""
+        return PredictionService.compute_skills_hash(user_skills, version)
+    
+    @staticmethod
+    def get_current(db: Session, user_id: int, user_skills: List[UserSkill]) -> Optional[UserRecommendation]:
+        """Get the user's precomputed row if it matches their skills and the current datasets."""
+        if not user_skills:
+            return None
+        row = db.get(UserRecommendation, user_id)
+        if row and row.skills_hash == PrecomputeService.compute_hash(user_skills, PrecomputeService.current_version()):
+            return row
+        return None
+    
+    @staticmethod
+    async def get_current_async(
+        db: AsyncSession, user_id: int, user_skills: List[UserSkill]
+    ) -> Optional[UserRecommendation]:
+        """Async counterpart of `get_current`."""
+        if not user_skills:
+            return None
+        row = await db.get(UserRecommendation, user_id)
+        if row and row.skills_hash == PrecomputeService.compute_hash(user_skills, PrecomputeService.current_version()):
+            return row
+        return None
+    
+    @staticmethod
+    def get_stored_hashes(connection: Connection, user_ids: List[int]) -> Dict[int, str]:
+        """Get the skills hash of each user's stored row."""
+        rows = connection.execute(
+            select(UserRecommendation.user_id, UserRecommendation.skills_hash)
+            .where(UserRecommendation.user_id.in_(user_ids))
+        )
+        return dict(rows.all())
+    
+    @staticmethod
+    def save_rows(connection: Connection, rows: List[Dict]):
+        """Replace the stored rows of the given users in one transaction."""
+        if not rows:
+            return
+        computed_at = datetime.utcnow()
+        connection.execute(
+            delete(UserRecommendation)
+            .where(UserRecommendation.user_id.in_([row["user_id"] for row in rows]))
+        )
+        connection.execute(
+            insert(UserRecommendation),
+            [{**row, "computed_at": computed_at} for row in rows]
+        )
+
+
+precompute_service = PrecomputeService()
@@ -0,0 +1,148 @@
+import hashlib
+from datetime import datetime, timedelta
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from backend.config import settings
+from backend.models.models import UserSkill, Prediction
+
+
+class PredictionService:
+    """Service for persisting and compacting prediction snapshots."""
+    
+    @staticmethod
+    def compute_skills_hash(user_skills: List[UserSkill], dataset_version: str = "") -> str:
+        """Compute a content hash over a user's skill rows and the job roles dataset version."""
+        digest = hashlib.sha256(dataset_version.encode("utf-8"))
+        for name, proficiency in sorted(
+            (skill.skill_name.strip().lower(), float(skill.proficiency or 0))
+            for skill in user_skills
+        ):
+            digest.update(f"{name}\x1f{proficiency}\x1e".encode("utf-8"))
+        return digest.hexdigest()
+    
+    @staticmethod
+    def get_latest_snapshot(db: Session, user_id: int) -> Optional[Prediction]:
+        """Get the most recent prediction snapshot for user."""
+        return db.query(Prediction).filter(
+            Prediction.user_id == user_id
+        ).order_by(Prediction.created_at.desc(), Prediction.id.desc()).first()
+    
+    @staticmethod
+    def get_current_snapshot(db: Session, user_id: int, skills_hash: str) -> Optional[Prediction]:
+        """Get the latest snapshot if it was computed from the given skill set."""
+        snapshot = PredictionService.get_latest_snapshot(db, user_id)
+        if snapshot and snapshot.skills_hash == skills_hash:
+            return snapshot
+        return None
+    
+    @staticmethod
+    def save_snapshot(
+        db: Session,
+        user_id: int,
+        skills_hash: str,
+        career_matches: List[dict],
+        readiness_score: float
+    ) -> Prediction:
+        """Persist a new prediction snapshot."""
+        snapshot = Prediction(
+            user_id=user_id,
+            skills_hash=skills_hash,
+            career_matches=career_matches,
+            readiness_score=readiness_score,
+            skill_gaps=[],
+            created_at=datetime.utcnow()
+        )
+        db.add(snapshot)
+        db.commit()
+        return snapshot
+    
+    @staticmethod
+    async def get_current_snapshot_async(
+        db: AsyncSession, user_id: int, skills_hash: str
+    ) -> Optional[Prediction]:
+        """Async counterpart of `get_current_snapshot`."""
+        result = await db.execute(
+            select(Prediction)
+            .where(Prediction.user_id == user_id)
+            .order_by(Prediction.created_at.desc(), Prediction.id.desc())
+            .limit(1)
+        )
+        snapshot = result.scalars().first()
+        if snapshot and snapshot.skills_hash == skills_hash:
+            return snapshot
+        return None
+    
+    @staticmethod
+    async def save_snapshot_async(
+        db: AsyncSession,
+        user_id: int,
+        skills_hash: str,
+        career_matches: List[dict],
+        readiness_score: float
+    ) -> Prediction:
+        """Async counterpart of `save_snapshot`."""
+        snapshot = Prediction(
+            user_id=user_id,
+            skills_hash=skills_hash,
+            career_matches=career_matches,
+            readiness_score=readiness_score,
+            skill_gaps=[],
+            created_at=datetime.utcnow()
+        )
+        db.add(snapshot)
+        await db.commit()
+        return snapshot
+    
+    @staticmethod
+    def compact_snapshots(
+        db: Session,
+        keep_latest: int = None,
+        max_age_days: int = None
+    ) -> int:
+        """Delete old snapshots, always keeping each user's latest one.
+        
+        A snapshot is removed when it is beyond the newest `keep_latest` for
+        its user, or older than `max_age_days`. Returns the number deleted.
+        """
+        if keep_latest is None:
+            keep_latest = settings.PREDICTION_RETENTION_COUNT
+        if max_age_days is None:
+            max_age_days = settings.PREDICTION_RETENTION_DAYS
+        keep_latest = max(1, keep_latest)
+        cutoff = datetime.utcnow() - timedelta(days=max_age_days)
+        
+        ranked = select(
+            Prediction.id,
+            Prediction.created_at,
+            func.row_number().over(
+                partition_by=Prediction.user_id,
+                order_by=(Prediction.created_at.desc(), Prediction.id.desc())
+            ).label("rank")
+        ).subquery()
+        stale = select(ranked.c.id).where(
+            (ranked.c.rank > keep_latest)
+            | ((ranked.c.rank > 1) & (ranked.c.created_at < cutoff))
+        )
+        
+        deleted = db.query(Prediction).filter(
+            Prediction.id.in_(stale)
+        ).delete(synchronize_session=False)
+        db.commit()
+        return deleted
+
+
+prediction_service = PredictionService()
+
+
+if __name__ == "__main__":
+    from backend.database import SessionLocal
+    
+    db = SessionLocal()
+    try:
+        removed = PredictionService.compact_snapshots(db)
+        print(f"Removed {removed} stale prediction snapshots")
+    finally:
+        db.close()
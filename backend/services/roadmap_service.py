@@ -1,139 +1,303 @@
+import json
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from sqlalchemy import delete, insert
 from sqlalchemy.orm import Session
-from typing import List, Dict, Optional
+from typing import List, Dict, NamedTuple, Optional, Tuple
 
-from backend.data_loaders.courses import courses_loader
+from backend.cache import profile_cache
+from backend.data_loaders.course_recommender import get_course_recommender
+from backend.data_loaders.courses import course_key, courses_loader
+from backend.data_loaders.registry import dataset_registry
+from backend.models.models import UserCourseProgress, UserSkill
 from backend.schemas.roadmap import (
-    LearningRoadmapResponse,
-    RoadmapStageResponse,
     CourseResponse,
+    CourseProgressUpdate,
+    CourseSearchResponse,
+    CourseSearchResult,
     MilestoneResponse
 )
+from backend.services.precompute_service import RECOMMENDATION_CANDIDATES, PrecomputeService
+from backend.services.skill_service import SkillService
+
+# Shown when the user has no skill gaps to recommend for
+DEFAULT_RECOMMENDATIONS = [
+    {
+        "title": "TypeScript Advanced",
+        "reason": "Boosts your technical skills score by 8 points",
+        "impact": "High"
+    },
+    {
+        "title": "React State Management",
+        "reason": "Essential for Frontend Developer roles",
+        "impact": "High"
+    },
+    {
+        "title": "System Design Principles",
+        "reason": "Frequently asked in senior developer interviews",
+        "impact": "Medium"
+    }
+]
+
+
+DURATION_HOURS = re.compile(r"(\d+(?:\.\d+)?)\s*hour", re.IGNORECASE)
+
+
+ROADMAP_STAGES = [
+    ("Foundation", "Build your core skills"),
+    ("Intermediate", "Build your intermediate skills"),
+    ("Advanced", "Build your advanced skills")
+]
+
+MILESTONES_JSON = json.dumps([
+    MilestoneResponse(id=1, title="Frontend Developer Ready", completed=True, target_date="Dec 2025").model_dump(),
+    MilestoneResponse(id=2, title="Full Stack Capable", completed=False, target_date="Mar 2026").model_dump(),
+    MilestoneResponse(id=3, title="Senior Engineer Level", completed=False, target_date="Aug 2026").model_dump()
+], separators=(",", ":"))
+
+
+class StageSkeleton(NamedTuple):
+    """One roadmap stage as every user without progress sees it."""
+    name: str
+    header: str  # Opening of the stage object, up to the per-user fields
+    course_ids: Tuple[int, ...]
+    fragments: Tuple[str, ...]  # CourseResponse JSON with the stage's default status
+    positions: Dict[str, List[int]]  # Course key -> positions in the stage
+    hours: Tuple[float, ...]
+
+
+# Skeletons by courses dataset version, built once and shared by all users
+_skeletons: "OrderedDict[str, Tuple[StageSkeleton, ...]]" = OrderedDict()
+_skeleton_lock = threading.Lock()
+
+
+def _duration_hours(duration: str) -> float:
+    match = DURATION_HOURS.search(str(duration))
+    return float(match.group(1)) if match else 0.0
 
 
 class RoadmapService:
     """Service for learning roadmap operations."""
     
     @staticmethod
-    def get_learning_roadmap(db: Session, user_id: int) -> LearningRoadmapResponse:
-        """Get learning roadmap for user."""
-        # Get courses organized by stage
-        roadmap_courses = courses_loader.get_roadmap_courses()
+    def get_progress_by_key(db: Session, user_id: int) -> Dict[str, UserCourseProgress]:
+        """Get all of a user's course progress rows in one query, keyed by course key."""
+        rows = db.query(UserCourseProgress).filter(UserCourseProgress.user_id == user_id).all()
+        return {row.course_key: row for row in rows}
+    
+    @staticmethod
+    def _course_response(course_id: int, course: Dict, progress: Optional[UserCourseProgress], default_status: str = "not-started") -> CourseResponse:
+        return CourseResponse(
+            id=course_id,
+            title=course.get("Course Name", ""),
+            duration=course.get("Duration", ""),
+            topics=int(course.get("Topics", 0)),
+            status=progress.status if progress else default_status,
+            progress=progress.progress if progress else 0
+        )
+    
+    @staticmethod
+    def get_roadmap_skeleton() -> Tuple[StageSkeleton, ...]:
+        """Get the shared roadmap skeleton for the courses version the request sees."""
+        version = dataset_registry.version("courses")
+        with _skeleton_lock:
+            skeleton = _skeletons.get(version)
+            if skeleton is not None:
+                _skeletons.move_to_end(version)
+                return skeleton
         
-        # Build stages with courses
+        roadmap_ids = courses_loader.get_roadmap_course_ids()
         stages = []
-        for stage_name in ["Foundation", "Intermediate", "Advanced"]:
-            stage_courses = roadmap_courses.get(stage_name, [])
-            courses = []
-            
-            for idx, course in enumerate(stage_courses):
-                # Determine status based on stage
-                if stage_name == "Foundation":
-                    status = "completed" if idx < 3 else ("in-progress" if idx == 3 else "not-started")
-                    progress = 100 if idx < 3 else (60 if idx == 3 else 0)
-                elif stage_name == "Intermediate":
-                    status = "in-progress" if idx == 0 else ("not-started" if idx > 0 else "completed")
-                    progress = 45 if idx == 0 else 0
-                else:
-                    status = "locked"
-                    progress = 0
-                
-                courses.append(CourseResponse(
-                    id=idx + 1,
-                    title=course.get("Course Name", ""),
-                    duration=course.get("Duration", ""),
-                    topics=int(course.get("Topics", 0)),
-                    status=status,
-                    progress=progress
-                ))
-            
-            # Calculate stage progress
-            if courses:
-                completed = sum(1 for c in courses if c.status == "completed")
-                progress = (completed / len(courses)) * 100
-            else:
-                progress = 0
-            
-            stages.append(RoadmapStageResponse(
-                stage=stage_name,
-                description=f"Build your {'core' if stage_name == 'Foundation' else 'advanced' if stage_name == 'Advanced' else 'intermediate'} skills",
-                progress=progress,
-                courses=courses
+        for stage_name, description in ROADMAP_STAGES:
+            course_ids = tuple(roadmap_ids.get(stage_name, []))
+            # Advanced courses stay locked until the user starts them
+            default_status = "locked" if stage_name == "Advanced" else "not-started"
+            fragments = []
+            positions: Dict[str, List[int]] = {}
+            hours = []
+            for position, course_id in enumerate(course_ids):
+                course = courses_loader.get_course(course_id)
+                fragments.append(RoadmapService._course_response(course_id, course, None, default_status).model_dump_json())
+                positions.setdefault(course_key(course.get("Course Name", "")), []).append(position)
+                hours.append(_duration_hours(course.get("Duration", "")))
+            stages.append(StageSkeleton(
+                name=stage_name,
+                header=json.dumps({"stage": stage_name, "description": description}, separators=(",", ":"))[:-1],
+                course_ids=course_ids,
+                fragments=tuple(fragments),
+                positions=positions,
+                hours=tuple(hours)
             ))
         
-        # Build milestones
-        milestones = [
-            MilestoneResponse(id=1, title="Frontend Developer Ready", completed=True, target_date="Dec 2025"),
-            MilestoneResponse(id=2, title="Full Stack Capable", completed=False, target_date="Mar 2026"),
-            MilestoneResponse(id=3, title="Senior Engineer Level", completed=False, target_date="Aug 2026")
-        ]
+        skeleton = tuple(stages)
+        with _skeleton_lock:
+            _skeletons[version] = skeleton
+            # Requests still pinned to the previous version may need it
+            while len(_skeletons) > 2:
+                _skeletons.popitem(last=False)
+        return skeleton
+    
+    @staticmethod
+    @profile_cache.memoize("learning_roadmap")
+    def get_learning_roadmap(db: Session, user_id: int, limit: int = 50, offset: int = 0) -> str:
+        """Get learning roadmap for user as JSON, with one page of courses per stage."""
+        skeleton = RoadmapService.get_roadmap_skeleton()
+        progress_by_key = RoadmapService.get_progress_by_key(db, user_id)
         
-        # Calculate stats
-        all_courses = []
-        for stage in stages:
-            all_courses.extend(stage.courses)
+        # Overlay only the courses the user has progress on
+        overlays: List[Dict[int, UserCourseProgress]] = [{} for _ in skeleton]
+        for key, progress in progress_by_key.items():
+            for stage_index, stage in enumerate(skeleton):
+                for position in stage.positions.get(key, ()):
+                    overlays[stage_index][position] = progress
         
-        courses_completed = sum(1 for c in all_courses if c.status == "completed")
-        courses_in_progress = sum(1 for c in all_courses if c.status == "in-progress")
+        stages = []
+        total_courses = courses_completed = courses_in_progress = 0
+        hours_invested = 0.0
+        for stage, overlay in zip(skeleton, overlays):
+            completed = sum(1 for progress in overlay.values() if progress.status == "completed")
+            total_courses += len(stage.course_ids)
+            courses_completed += completed
+            courses_in_progress += sum(1 for progress in overlay.values() if progress.status == "in-progress")
+            hours_invested += sum(stage.hours[position] * (progress.progress or 0) / 100 for position, progress in overlay.items())
+            
+            page = range(offset, min(offset + limit, len(stage.course_ids)))
+            courses = [
+                RoadmapService._course_response(
+                    stage.course_ids[position], courses_loader.get_course(stage.course_ids[position]), overlay[position]
+                ).model_dump_json() if position in overlay else stage.fragments[position]
+                for position in page
+            ]
+            progress = (completed / len(stage.course_ids)) * 100 if stage.course_ids else 0
+            stages.append(
+                f'{stage.header},"progress":{json.dumps(float(progress))},"total":{len(stage.course_ids)},'
+                f'"courses":[{",".join(courses)}]}}'
+            )
         
         stats = {
             "courses_completed": courses_completed,
             "courses_in_progress": courses_in_progress,
-            "hours_invested": 142,
-            "overall_progress": round((courses_completed / len(all_courses)) * 100, 1) if all_courses else 0
+            "hours_invested": round(hours_invested, 1),
+            "overall_progress": round((courses_completed / total_courses) * 100, 1) if total_courses else 0
         }
-        
-        return LearningRoadmapResponse(
-            stages=stages,
-            milestones=milestones,
-            stats=stats
-        )
+        return f'{{"stages":[{",".join(stages)}],"milestones":{MILESTONES_JSON},"stats":{json.dumps(stats, separators=(",", ":"))}}}'
     
     @staticmethod
     def get_course_by_id(course_id: int) -> Optional[CourseResponse]:
         """Get a specific course by ID."""
-        all_courses = courses_loader.get_all_courses()
-        if 0 <= course_id < len(all_courses):
-            course = all_courses[course_id]
-            return CourseResponse(
-                id=course_id,
-                title=course.get("Course Name", ""),
-                duration=course.get("Duration", ""),
-                topics=int(course.get("Topics", 0)),
-                status="not-started",
-                progress=0
+        course = courses_loader.get_course(course_id)
+        if course is None:
+            return None
+        return RoadmapService._course_response(course_id, course, None)
+    
+    @staticmethod
+    def search_courses(query: str, limit: int = 20, offset: int = 0) -> CourseSearchResponse:
+        """Search the course catalog by name, category and topics."""
+        total, hits = courses_loader.search_courses(query, limit=limit, offset=offset)
+        return CourseSearchResponse(
+            query=query,
+            total=total,
+            limit=limit,
+            offset=offset,
+            results=[
+                CourseSearchResult(
+                    id=course_id,
+                    title=course.get("Course Name", ""),
+                    category=course.get("Category"),
+                    difficulty=course.get("Difficulty"),
+                    duration=course.get("Duration", ""),
+                    topics=int(course.get("Topics", 0)),
+                    score=score
+                )
+                for course_id, score, course in hits
+            ]
+        )
+    
+    @staticmethod
+    def save_course_progress(db: Session, user_id: int, updates: List[CourseProgressUpdate]) -> List[CourseResponse]:
+        """Upsert many course progress updates in one transaction."""
+        rows: Dict[str, Dict] = {}
+        courses = []
+        for update in updates:
+            course = courses_loader.get_course(update.course_id)
+            if course is None:
+                raise ValueError(f"Course {update.course_id} not found")
+            key = course_key(course.get("Course Name", ""))
+            # A later update to the same course wins
+            rows[key] = {
+                "user_id": user_id,
+                "course_key": key,
+                "status": update.status,
+                "progress": update.progress,
+                "updated_at": datetime.utcnow()
+            }
+            courses.append((update.course_id, course, key))
+        
+        dialect = db.get_bind().dialect.name
+        if dialect in ("sqlite", "postgresql"):
+            if dialect == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            statement = dialect_insert(UserCourseProgress)
+            db.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[UserCourseProgress.user_id, UserCourseProgress.course_key],
+                    set_={
+                        "status": statement.excluded.status,
+                        "progress": statement.excluded.progress,
+                        "updated_at": statement.excluded.updated_at
+                    }
+                ),
+                list(rows.values())
             )
-        return None
+        else:
+            db.execute(
+                delete(UserCourseProgress)
+                .where(UserCourseProgress.user_id == user_id, UserCourseProgress.course_key.in_(list(rows)))
+            )
+            db.execute(insert(UserCourseProgress), list(rows.values()))
+        db.commit()
+        profile_cache.invalidate(user_id)
+        
+        return [
+            RoadmapService._course_response(course_id, course, UserCourseProgress(**rows[key]))
+            for course_id, course, key in courses
+        ]
     
     @staticmethod
     def update_course_progress(db: Session, user_id: int, course_id: int, progress: float, status: str) -> CourseResponse:
         """Update course progress."""
-        course = RoadmapService.get_course_by_id(course_id)
-        if course:
-            course.progress = progress
-            course.status = status
-        return course
+        update = CourseProgressUpdate(course_id=course_id, progress=progress, status=status)
+        return RoadmapService.save_course_progress(db, user_id, [update])[0]
     
     @staticmethod
-    def get_recommended_courses(db: Session, user_id: int) -> List[Dict]:
-        """Get AI-recommended courses based on user profile."""
-        recommended = [
-            {
-                "title": "TypeScript Advanced",
-                "reason": "Boosts your technical skills score by 8 points",
-                "impact": "High"
-            },
-            {
-                "title": "React State Management",
-                "reason": "Essential for Frontend Developer roles",
-                "impact": "High"
-            },
-            {
-                "title": "System Design Principles",
-                "reason": "Frequently asked in senior developer interviews",
-                "impact": "Medium"
-            }
-        ]
-        return recommended
+    @profile_cache.memoize("recommended_courses")
+    def get_recommended_courses(db: Session, user_id: int, limit: int = 3) -> List[Dict]:
+        """Get the courses that close most of the user's skill gaps, skipping completed ones."""
+        user_skills = db.query(UserSkill).filter(UserSkill.user_id == user_id).all()
+        completed = {
+            key for key, progress in RoadmapService.get_progress_by_key(db, user_id).items()
+            if progress.status == "completed"
+        }
+        
+        precomputed = PrecomputeService.get_current(db, user_id, user_skills)
+        if precomputed is not None:
+            candidates = precomputed.recommended_courses or []
+            recommended = [course for course in candidates if course_key(course["title"]) not in completed]
+            # A full candidate list may have lost too many to completed courses
+            if len(recommended) >= limit or len(candidates) < RECOMMENDATION_CANDIDATES:
+                return recommended[:limit] or DEFAULT_RECOMMENDATIONS
+        
+        exclude = [courses_loader.get_course_id(key) for key in completed]
+        recommended = get_course_recommender().recommend(
+            SkillService._user_levels(user_skills),
+            limit=limit,
+            exclude=[course_id for course_id in exclude if course_id is not None]
+        )
+        return recommended or DEFAULT_RECOMMENDATIONS
 
 
 roadmap_service = RoadmapService()
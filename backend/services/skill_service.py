@@ -1,10 +1,13 @@
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict
 
+from backend.cache import profile_cache
 from backend.models.models import UserSkill
 from backend.data_loaders.skills import skills_loader
 from backend.data_loaders.job_roles import job_roles_loader
+from backend.services.precompute_service import PrecomputeService
 from backend.schemas.skill import (
+    RoleFitResponse,
     SkillGapResponse,
     SkillRadarData,
     SkillAnalysisResponse
@@ -15,13 +18,14 @@ class SkillService:
     """Service for skill analysis operations."""
     
     @staticmethod
+    @profile_cache.memoize("skill_analysis")
     def get_skill_analysis(db: Session, user_id: int) -> SkillAnalysisResponse:
         """Get comprehensive skill analysis for user."""
         # Get user skills
         user_skills = db.query(UserSkill).filter(UserSkill.user_id == user_id).all()
         
         # Get skill gaps
-        skill_gaps = SkillService._calculate_skill_gaps(user_skills)
+        skill_gaps = SkillService._closest_role_gaps(db, user_id, user_skills)
         
         # Get radar data
         radar_data = SkillService._get_radar_data(user_skills)
@@ -48,54 +52,36 @@ class SkillService:
         )
     
     @staticmethod
-    def _calculate_skill_gaps(user_skills: List[UserSkill]) -> List[Dict]:
-        """Calculate skill gaps based on user skills and target roles."""
-        # Get common target skills
-        target_skills = [
-            "Frontend Dev", "Backend", "DevOps", "System Design", "Testing", "Cloud",
-            "TypeScript", "Docker", "Kubernetes", "React", "Node.js", "SQL",
-            "Python", "JavaScript", "Machine Learning", "Data Analysis"
-        ]
-        
-        user_skill_names = [skill.skill_name for skill in user_skills]
-        user_skill_dict = {skill.skill_name: skill.proficiency for skill in user_skills}
-        
-        gaps = []
-        for target in target_skills:
-            current = user_skill_dict.get(target, 0)
-            target_level = 90
-            
-            # Determine priority
-            if target in ["System Design", "DevOps", "Cloud", "TypeScript"]:
-                priority = "High"
-            elif target in ["Frontend Dev", "Backend", "Testing"]:
-                priority = "High"
-            else:
-                priority = "Medium"
-            
-            # Estimate effort
-            effort_map = {
-                "High": "4-6 weeks",
-                "Medium": "2-3 weeks",
-                "Low": "1-2 weeks"
-            }
-            
-            gap_score = target_level - current
-            status = "not-started" if current == 0 else "in-progress"
-            
-            gaps.append({
-                "skill_name": target,
-                "current_level": current,
-                "target_level": target_level,
-                "priority": priority,
-                "estimated_effort": effort_map[priority],
-                "gap_score": gap_score,
-                "status": status
-            })
+    def _user_levels(user_skills: List[UserSkill]) -> Dict[str, float]:
+        return {skill.skill_name: skill.proficiency or 0 for skill in user_skills}
+    
+    @staticmethod
+    def _calculate_skill_gaps(user_skills: List[UserSkill], role: Optional[str] = None) -> List[Dict]:
+        """Calculate skill gaps against a target role, by default the closest one."""
+        return SkillService.gaps_for_levels(SkillService._user_levels(user_skills), role)
+    
+    @staticmethod
+    def gaps_for_levels(user_levels: Dict[str, float], role: Optional[str] = None) -> List[Dict]:
+        """Skill gaps for a skill-to-proficiency mapping against a role, by default the closest one."""
+        if role is not None:
+            role_idx = job_roles_loader.role_index.get(role.lower())
+            if role_idx is None:
+                raise ValueError("Role not found")
+        else:
+            closest = job_roles_loader.get_role_fit(user_levels, limit=1)
+            if not closest:
+                return []
+            role_idx = closest[0]["role_index"]
         
-        # Sort by gap score (highest first)
-        gaps.sort(key=lambda x: x["gap_score"], reverse=True)
-        return gaps
+        return job_roles_loader.get_skill_gaps(user_levels, role_idx)
+    
+    @staticmethod
+    def _closest_role_gaps(db: Session, user_id: int, user_skills: List[UserSkill]) -> List[Dict]:
+        """Gaps against the closest role, read from the precomputed row when it is current."""
+        precomputed = PrecomputeService.get_current(db, user_id, user_skills)
+        if precomputed is not None:
+            return precomputed.skill_gaps
+        return SkillService._calculate_skill_gaps(user_skills)
     
     @staticmethod
     def _get_radar_data(user_skills: List[UserSkill]) -> List[SkillRadarData]:
@@ -120,12 +106,24 @@ class SkillService:
         return radar_data
     
     @staticmethod
-    def get_skill_gaps(db: Session, user_id: int) -> List[SkillGapResponse]:
-        """Get skill gaps for user."""
+    @profile_cache.memoize("skill_gaps")
+    def get_skill_gaps(db: Session, user_id: int, role: Optional[str] = None) -> List[SkillGapResponse]:
+        """Get skill gaps for user against a role, by default the closest one."""
         user_skills = db.query(UserSkill).filter(UserSkill.user_id == user_id).all()
-        gaps = SkillService._calculate_skill_gaps(user_skills)
+        if role is None:
+            gaps = SkillService._closest_role_gaps(db, user_id, user_skills)
+        else:
+            gaps = SkillService._calculate_skill_gaps(user_skills, role)
         return [SkillGapResponse(**gap) for gap in gaps]
     
+    @staticmethod
+    @profile_cache.memoize("role_fit")
+    def get_role_fit(db: Session, user_id: int, limit: int = 5) -> List[RoleFitResponse]:
+        """Score the user against every role and return the closest ones."""
+        user_skills = db.query(UserSkill).filter(UserSkill.user_id == user_id).all()
+        fits = job_roles_loader.get_role_fit(SkillService._user_levels(user_skills), limit=limit)
+        return [RoleFitResponse(**fit) for fit in fits]
+    
     @staticmethod
     def get_priority_skills(db: Session, user_id: int) -> List[Dict]:
         """Get high priority skills for user."""
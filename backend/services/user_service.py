@@ -1,6 +1,8 @@
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import Optional, List
 
+from backend.cache import profile_cache
 from backend.models.models import User, UserSkill, UserPreference, Prediction
 from backend.schemas.user import (
     UserResponse,
@@ -15,6 +17,10 @@ from backend.schemas.user import (
 from backend.schemas.skill import SkillGapResponse, SkillRadarData, SkillAnalysisResponse
 
 
+class DuplicateSkillError(ValueError):
+    """A skill update would give the user two skills with the same name."""
+
+
 class UserService:
     """Service for user profile operations."""
     
@@ -65,6 +71,7 @@ class UserService:
             user.role = user_data.role
         
         db.commit()
+        profile_cache.invalidate(user_id)
         db.refresh(user)
         return user
     
@@ -81,6 +88,7 @@ class UserService:
             # Update existing skill
             existing_skill.proficiency = skill_data.proficiency
             db.commit()
+            profile_cache.invalidate(user_id)
             db.refresh(existing_skill)
             return existing_skill
         
@@ -91,7 +99,20 @@ class UserService:
             proficiency=skill_data.proficiency
         )
         db.add(new_skill)
-        db.commit()
+        try:
+            db.commit()
+        except IntegrityError:
+            # A concurrent request added the same skill first; update that one instead
+            db.rollback()
+            new_skill = db.query(UserSkill).filter(
+                UserSkill.user_id == user_id,
+                UserSkill.skill_name == skill_data.skill_name
+            ).first()
+            if new_skill is None:
+                raise
+            new_skill.proficiency = skill_data.proficiency
+            db.commit()
+        profile_cache.invalidate(user_id)
         db.refresh(new_skill)
         return new_skill
     
@@ -111,7 +132,12 @@ class UserService:
         if skill_data.proficiency is not None:
             skill.proficiency = skill_data.proficiency
         
-        db.commit()
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise DuplicateSkillError("Skill with this name already exists")
+        profile_cache.invalidate(user_id)
         db.refresh(skill)
         return skill
     
@@ -128,6 +154,7 @@ class UserService:
         
         db.delete(skill)
         db.commit()
+        profile_cache.invalidate(user_id)
         return True
     
     @staticmethod
@@ -154,6 +181,7 @@ class UserService:
         )
         db.add(new_pref)
         db.commit()
+        profile_cache.invalidate(user_id)
         db.refresh(new_pref)
         return new_pref
     
@@ -172,8 +200,13 @@ class UserService:
         # Update user education
         user.education = onboarding_data.education
         
-        # Add skills
-        for skill_name in onboarding_data.skills:
+        # Add skills not already on the profile
+        existing_skills = {
+            name for (name,) in db.query(UserSkill.skill_name).filter(UserSkill.user_id == user_id)
+        }
+        for skill_name in dict.fromkeys(onboarding_data.skills):
+            if skill_name in existing_skills:
+                continue
             skill = UserSkill(
                 user_id=user_id,
                 skill_name=skill_name,
@@ -198,6 +231,7 @@ class UserService:
             db.add(pref)
         
         db.commit()
+        profile_cache.invalidate(user_id)
         db.refresh(user)
         return user
     
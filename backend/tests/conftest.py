@@ -0,0 +1,26 @@
+import os
+import tempfile
+
+import pytest
+
+# Settings are read at import time, so point them at a scratch database first
+_scratch = tempfile.mkdtemp(prefix="lakshya-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_scratch}/test.db")
+os.environ.setdefault("DATASET_PATH", os.path.join(_scratch, "datasets"))
+os.environ.setdefault("PASSWORD_HASH_WORKERS", "0")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+from backend.database import Base, SessionLocal, engine  # noqa: E402
+import backend.models.models  # noqa: E402,F401
+
+
+@pytest.fixture
+def db():
+    """A session on freshly created tables."""
+    Base.metadata.create_all(engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(engine)
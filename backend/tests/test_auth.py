@@ -0,0 +1,58 @@
+import pytest
+
+from backend.auth import principal_cache
+from backend.models.models import User
+
+
+@pytest.fixture
+def user(db):
+    principal_cache.clear()
+    user = User(email="auth@example.com", name="Before", password_hash="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def cache_principal(user_id):
+    """Put a principal in the cache and return a check for whether it is still served."""
+    principal_cache.get_or_compute(user_id, "principal:test", lambda: "cached")
+    return lambda: principal_cache.get_or_compute(user_id, "principal:test", lambda: "reloaded") == "cached"
+
+
+def test_committed_change_evicts_the_principal(db, user):
+    still_cached = cache_principal(user.id)
+    user.name = "After"
+    db.flush()
+    # Nothing is committed yet, so a concurrent request may still use the old principal
+    assert still_cached()
+    db.commit()
+    assert not still_cached()
+
+
+def test_rollback_keeps_the_principal(db, user):
+    still_cached = cache_principal(user.id)
+    user.name = "After"
+    db.flush()
+    db.rollback()
+    assert still_cached()
+    db.commit()
+    assert still_cached()
+
+
+def test_deleting_a_user_evicts_the_principal(db, user):
+    still_cached = cache_principal(user.id)
+    db.delete(user)
+    db.commit()
+    assert not still_cached()
+
+
+def test_bulk_update_clears_every_principal(db, user):
+    other = User(email="other@example.com", name="Other", password_hash="x")
+    db.add(other)
+    db.commit()
+    user_cached, other_cached = cache_principal(user.id), cache_principal(other.id)
+
+    db.query(User).filter(User.id == user.id).update({User.name: "Bulk"}, synchronize_session=False)
+    db.commit()
+    assert not user_cached()
+    assert not other_cached()
@@ -0,0 +1,91 @@
+import time
+
+import pytest
+
+from backend import cache as cache_module
+from backend.cache import MemoryCacheBackend, ProfileCache
+from backend.data_loaders.registry import DatasetRegistry
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    assert backend.get("a") == 1
+    backend.set("c", 3)
+    assert (backend.get("a"), backend.get("b"), backend.get("c")) == (1, None, 3)
+    assert backend.stats() == {"size": 2, "evictions": 1}
+
+
+def test_memory_backend_expires_entries():
+    backend = MemoryCacheBackend()
+    backend.set("short", "value", ttl=0.01)
+    backend.set("forever", "value")
+    time.sleep(0.02)
+    assert backend.get("short") is None
+    assert backend.get("forever") == "value"
+
+
+def test_memory_backend_returns_copies_of_mutable_values():
+    backend = MemoryCacheBackend()
+    value = {"skills": ["Python"]}
+    backend.set("key", value)
+    value["skills"].append("changed by the writer")
+    first = backend.get("key")
+    first["skills"].append("changed by a reader")
+    assert backend.get("key") == {"skills": ["Python"]}
+    assert backend.set_if_absent("key", {}) == {"skills": ["Python"]}
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    source = tmp_path / "roles.csv"
+    source.write_text("v1")
+    registry = DatasetRegistry()
+    registry.register("roles", lambda: source.read_text(), sources=lambda: [str(source)])
+    monkeypatch.setattr(cache_module, "dataset_registry", registry)
+    return registry, source
+
+
+def test_invalidate_rotates_the_users_entries(registry):
+    cache = ProfileCache(MemoryCacheBackend())
+    calls = []
+
+    @cache.memoize("matches")
+    def matches(db, user_id, limit=3):
+        calls.append((user_id, limit))
+        return [user_id] * limit
+
+    assert matches(None, 1) == [1, 1, 1]
+    assert matches(None, 1) == [1, 1, 1]
+    assert matches(None, 2) == [2, 2, 2]
+    assert matches(None, 1, limit=1) == [1]
+    assert len(calls) == 3
+
+    cache.invalidate(1)
+    matches(None, 1)
+    matches(None, 2)
+    assert calls[3:] == [(1, 3)]
+    assert (cache.hits, cache.invalidations) == (2, 1)
+
+
+def test_memo_keys_follow_the_dataset_version(registry):
+    registry, source = registry
+    cache = ProfileCache(MemoryCacheBackend())
+
+    @cache.memoize("role")
+    def role(db, user_id):
+        return registry.resolve("roles").loader
+
+    with registry.pinned():
+        assert role(None, 1) == "v1"
+        # The file changes and is reloaded while this request is still running
+        source.write_text("version two")
+        registry.reload("roles")
+        # The request stays on v1, and so does the entry it reads and stores
+        assert role(None, 1) == "v1"
+
+    # New requests see the new version without any cache clearing
+    assert role(None, 1) == "version two"
+    with registry.pinned():
+        assert role(None, 1) == "version two"
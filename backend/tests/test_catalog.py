@@ -0,0 +1,31 @@
+import os
+
+from backend.data_loaders.catalog import MANIFEST_FILE, ColumnarCatalog
+
+
+def build(names):
+    return ColumnarCatalog.from_rows([{"Course Name": name, "Topics": len(name)} for name in names])
+
+
+def test_rebuild_switches_on_manifest_and_keeps_unrelated_files(tmp_path):
+    path = str(tmp_path)
+    (tmp_path / "coursera-courses.csv").write_text("name\n")
+
+    build(["Python", "SQL"]).write(path, source={"size": 1})
+    first = ColumnarCatalog.open(path)
+    first_files = set(os.listdir(path))
+
+    build(["Docker", "Kubernetes", "Go"]).write(path, source={"size": 2})
+    second = ColumnarCatalog.open(path)
+    second_files = set(os.listdir(path))
+
+    # A catalog opened before the rebuild still reads its own build
+    assert [row["Course Name"] for row in first.records()] == ["Python", "SQL"]
+    assert [row["Course Name"] for row in second.records()] == ["Docker", "Kubernetes", "Go"]
+    assert second.value("Topics", 1) == len("Kubernetes")
+
+    assert "coursera-courses.csv" in second_files
+    assert MANIFEST_FILE in second_files
+    # Nothing but the manifest and the unrelated file survives from the first build
+    assert first_files & second_files == {MANIFEST_FILE, "coursera-courses.csv"}
+    assert ColumnarCatalog.read_manifest(path)["source"] == {"size": 2}
@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta
+
+from backend.chat_history import ChatHistoryWriter, RecentContextCache
+from backend.models.models import ChatMessage, User
+from backend.services import chat_service as chat_module
+from backend.services.chat_service import ChatService
+
+
+def test_windows_are_reloaded_after_ttl():
+    loads = []
+
+    def load(window):
+        loads.append(window)
+        return [("user", f"message {len(loads)}")]
+
+    cache = RecentContextCache(window=4, max_users=10, ttl=60)
+    assert cache.get(1, load) == [("user", "message 1")]
+    cache.append(1, "assistant", "reply")
+    assert cache.get(1, load) == [("user", "message 1"), ("assistant", "reply")]
+    assert len(loads) == 1
+
+    expired = RecentContextCache(window=4, max_users=10, ttl=0)
+    expired.get(1, load)
+    assert expired.get(1, load) == [("user", "message 3")]
+
+
+def test_reloaded_window_includes_queued_messages(db, monkeypatch):
+    user = User(email="chat@example.com", name="Test", password_hash="x")
+    db.add(user)
+    db.commit()
+    start = datetime(2024, 1, 1)
+    rows = [
+        {"user_id": user.id, "role": role, "content": content, "timestamp": start + timedelta(seconds=i)}
+        for i, (role, content) in enumerate([("user", "q1"), ("assistant", "a1"), ("user", "q2"), ("assistant", "a2")])
+    ]
+    # The first two are written; the second is also still queued, as if committed mid-read
+    db.add_all(ChatMessage(**row) for row in rows[:2])
+    db.commit()
+
+    writer = ChatHistoryWriter(batch_size=1000, flush_interval=3600, max_queue=100)
+    writer._pending.extend(rows[1:] + [{**rows[0], "user_id": user.id + 1}])
+    monkeypatch.setattr(chat_module, "chat_history_writer", writer)
+    monkeypatch.setattr(chat_module, "recent_context", RecentContextCache(window=3, max_users=10))
+
+    assert ChatService.get_recent_context(db, user.id) == [("assistant", "a1"), ("user", "q2"), ("assistant", "a2")]
@@ -0,0 +1,66 @@
+import pytest
+
+from backend.chat_history import RecentContextCache
+from backend.models.models import User
+from backend.response_cache import response_cache
+from backend.services import chat_service as chat_module
+from backend.services.chat_service import ChatService
+
+
+@pytest.fixture
+def prompts(monkeypatch):
+    """Prompts sent to the model; replies echo the message."""
+    sent = []
+
+    def generate_sync(prompt):
+        sent.append(prompt)
+        return f"reply to {prompt.message}"
+
+    monkeypatch.setattr(chat_module.llm_client, "generate_sync", generate_sync)
+    monkeypatch.setattr(chat_module.chat_history_writer, "enqueue", lambda *args: True)
+    monkeypatch.setattr(chat_module, "recent_context", RecentContextCache(window=10, max_users=100))
+    response_cache.clear()
+    yield sent
+    response_cache.clear()
+
+
+def add_user(db, email):
+    user = User(email=email, name="Test", password_hash="x", role="student", education="Undergraduate")
+    db.add(user)
+    db.commit()
+    return user.id
+
+
+def test_second_message_from_existing_user_hits_cache(db, prompts):
+    first = add_user(db, "first@example.com")
+    second = add_user(db, "second@example.com")
+
+    # Both users already have a conversation going
+    ChatService.process_message(db, first, "What should I focus on this week?")
+    ChatService.process_message(db, second, "Career paths in software engineering")
+    assert len(prompts) == 2
+    hits = response_cache.stats()["hits"]
+
+    response = ChatService.process_message(db, second, "What should I focus on this week")
+    assert response.message == "reply to What should I focus on this week?"
+    assert len(prompts) == 2
+    assert response_cache.stats()["hits"] == hits + 1
+
+
+def test_follow_up_messages_carry_history_and_skip_cache(db, prompts):
+    first = add_user(db, "first@example.com")
+    second = add_user(db, "second@example.com")
+
+    ChatService.process_message(db, first, "Best practices for React development")
+    hits = response_cache.stats()["hits"]
+    ChatService.process_message(db, first, "Tell me more about that")
+    assert prompts[-1].history == (
+        ("user", "Best practices for React development"),
+        ("assistant", "reply to Best practices for React development"),
+    )
+
+    # The other user has no conversation yet, so the first user's reply is not reused
+    ChatService.process_message(db, second, "Tell me more about that")
+    assert len(prompts) == 3
+    assert prompts[-1].history == ()
+    assert response_cache.stats()["hits"] == hits
@@ -0,0 +1,64 @@
+import pytest
+
+from backend.data_loaders.catalog import ColumnarCatalog
+from backend.data_loaders.course_search import MAX_PREFIX_TERMS, CourseSearchIndex
+from backend.data_loaders.courses import CoursesLoader
+
+
+@pytest.fixture(scope="module")
+def courses():
+    # The scratch DATASET_PATH has no CSV, so this is the default catalog
+    return CoursesLoader()
+
+
+def names(courses, query, **kwargs):
+    total, hits = courses.search_courses(query, **kwargs)
+    return total, [course["Course Name"] for _, _, course in hits]
+
+
+def test_prefix_of_the_last_term_matches(courses):
+    assert names(courses, "jav") == (2, ["JavaScript Fundamentals", "ES6+ Modern JavaScript"])
+    assert names(courses, "jav", limit=None)[0] == 2
+    assert courses.search_index.search("jav", prefix=False) == (0, [])
+
+
+def test_synonyms_expand_the_query(courses):
+    total, found = names(courses, "js")
+    assert total == 3
+    assert set(found) == {"Node.js & Express", "JavaScript Fundamentals", "ES6+ Modern JavaScript"}
+    assert names(courses, "docker k8s") == (1, ["Docker & Kubernetes"])
+
+
+def test_bm25_prefers_shorter_documents_and_weights_names(courses):
+    # Both names contain "react"; the shorter one scores higher
+    assert names(courses, "react") == (2, ["React Basics", "React State Management"])
+    # A name match outranks a category-only match
+    _, found = names(courses, "backend api")
+    assert found[0] == "RESTful API Design"
+    _, hits = courses.search_courses("react")
+    assert hits[0][1] > hits[1][1] > 0
+
+
+def test_pagination_keeps_total_and_order(courses):
+    total, everything = names(courses, "js", limit=None)
+    pages = [names(courses, "js", limit=2, offset=offset) for offset in (0, 2, 4)]
+    assert [page_total for page_total, _ in pages] == [total] * 3
+    assert [name for _, page in pages for name in page] == everything
+    assert pages[-1][1] == []
+
+
+def test_no_match_returns_nothing(courses):
+    assert names(courses, "haskell") == (0, [])
+    assert names(courses, "") == (0, [])
+
+
+def test_prefix_expansion_keeps_most_common_terms():
+    # term000 appears in 1 row, term001 in 2, ... so higher numbers are more common
+    rows = [
+        {"Course Name": " ".join(f"term{t:03d}" for t in range(100) if t >= 99 - row)} for row in range(100)
+    ]
+    index = CourseSearchIndex.build(ColumnarCatalog.from_rows(rows))
+    (expanded,) = index._expand("term", prefix=True)
+    assert len(expanded) == MAX_PREFIX_TERMS
+    assert set(expanded) == {f"term{t:03d}" for t in range(100 - MAX_PREFIX_TERMS, 100)}
+    assert index._expand("term05", prefix=True) == [[f"term05{t}" for t in range(10)]]
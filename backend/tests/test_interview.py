@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from backend.config import settings
+from backend.data_loaders.interview import InterviewQuestionsLoader
+
+QUESTIONS = [
+    {"id": 2, "question": "q2", "category": "Technical", "difficulty": "Easy", "tags": ["Python", "SQL"]},
+    {"id": 5, "question": "q5", "category": "Technical", "difficulty": "Hard", "tags": ["Python"]},
+    {"id": 7, "question": "q7", "category": "Behavioral", "difficulty": "Easy", "tags": ["Teamwork"]},
+    {"id": 9, "question": "q9", "category": "Technical", "difficulty": "Easy", "tags": ["python", "sql", "Design"]},
+    {"id": 12, "question": "q12", "category": "Technical", "difficulty": "Medium", "tags": ["SQL"]},
+]
+
+
+@pytest.fixture
+def loader(tmp_path, monkeypatch):
+    (tmp_path / "interview_questions.json").write_text(json.dumps(QUESTIONS))
+    monkeypatch.setattr(settings, "DATASET_PATH", str(tmp_path))
+    return InterviewQuestionsLoader(strict=True)
+
+
+def ids(page):
+    return [question["id"] for question in page]
+
+
+def test_filters_intersect_case_insensitively(loader):
+    questions, cursor = loader.find_questions(category="technical", difficulty="EASY")
+    assert (ids(questions), cursor) == ([2, 9], None)
+    assert ids(loader.find_questions(tags=["PYTHON", "sql"])[0]) == [2, 9]
+    assert ids(loader.find_questions(tags=["python", "sql", "design"])[0]) == [9]
+    assert ids(loader.find_questions()[0]) == [2, 5, 7, 9, 12]
+
+
+def test_unknown_filter_value_matches_nothing(loader):
+    assert loader.find_questions(category="Unknown") == ([], None)
+    assert loader.find_questions(tags=["python", "rust"]) == ([], None)
+
+
+def test_cursor_pages_through_results(loader):
+    questions, cursor = loader.find_questions(tags=["sql"], limit=2)
+    assert (ids(questions), cursor) == ([2, 9], 9)
+    questions, cursor = loader.find_questions(tags=["sql"], after=cursor, limit=2)
+    assert (ids(questions), cursor) == ([12], None)
+
+
+def test_exact_limit_boundary_has_no_next_cursor(loader):
+    questions, cursor = loader.find_questions(category="Technical", limit=4)
+    assert (ids(questions), cursor) == ([2, 5, 9, 12], None)
+    questions, cursor = loader.find_questions(category="Technical", limit=3)
+    assert (ids(questions), cursor) == ([2, 5, 9], 9)
+
+
+def test_cursor_past_the_end(loader):
+    assert loader.find_questions(after=12) == ([], None)
+    assert loader.find_questions(tags=["python", "sql"], after=100, limit=5) == ([], None)
+    # Cursors need not be ids that exist
+    assert ids(loader.find_questions(after=6)[0]) == [7, 9, 12]
@@ -0,0 +1,94 @@
+import asyncio
+import time
+
+import pytest
+
+from backend.llm import ChatPrompt, LLMClient, LLMUnavailableError, LocalLLMBackend
+
+
+class RecordingBackend(LocalLLMBackend):
+    """Local backend that records the size of every batch it completes."""
+    
+    def __init__(self, request_latency: float = 0.0, drop_last: bool = False):
+        super().__init__(lambda prompt: f"re: {prompt.message}", request_latency=request_latency)
+        self.drop_last = drop_last
+        self.batch_sizes = []
+    
+    async def complete_batch(self, prompts):
+        self.batch_sizes.append(len(prompts))
+        replies = await super().complete_batch(prompts)
+        return replies[:-1] if self.drop_last else replies
+
+
+def prompt(message: str) -> ChatPrompt:
+    return ChatPrompt("system", message)
+
+
+def test_prompts_within_batch_wait_share_one_batch():
+    backend = RecordingBackend(request_latency=0.01)
+    client = LLMClient(backend, batch_size=8, batch_wait=0.05)
+    
+    async def run():
+        return await asyncio.gather(*(client.generate(prompt(f"q{i}")) for i in range(3)))
+    
+    assert asyncio.run(run()) == ["re: q0", "re: q1", "re: q2"]
+    assert backend.batch_sizes == [3]
+    assert client.pending == 0
+    assert client.completed == 3
+
+
+def test_full_batch_is_sent_without_waiting():
+    backend = RecordingBackend()
+    client = LLMClient(backend, batch_size=2, batch_wait=10.0)
+    
+    async def run():
+        return await asyncio.wait_for(asyncio.gather(*(client.generate(prompt(f"q{i}")) for i in range(4))), 1.0)
+    
+    assert asyncio.run(run()) == ["re: q0", "re: q1", "re: q2", "re: q3"]
+    assert backend.batch_sizes == [2, 2]
+
+
+def test_max_pending_rejects_and_restores_pending():
+    client = LLMClient(RecordingBackend(request_latency=0.05), max_pending=1, batch_wait=0.0)
+    
+    async def run():
+        first = asyncio.ensure_future(client.generate(prompt("first")))
+        await asyncio.sleep(0)
+        with pytest.raises(LLMUnavailableError):
+            await client.generate(prompt("second"))
+        return await first
+    
+    assert asyncio.run(run()) == "re: first"
+    assert client.rejected == 1
+    assert client.pending == 0
+
+
+def test_timeout_raises_and_restores_pending():
+    client = LLMClient(RecordingBackend(request_latency=1.0), batch_wait=0.0, timeout=0.05)
+    
+    async def run():
+        with pytest.raises(LLMUnavailableError):
+            await client.generate(prompt("slow"))
+    
+    asyncio.run(run())
+    assert client.timeouts == 1
+    assert client.pending == 0
+    assert client.completed == 0
+
+
+def test_missing_replies_fail_leftover_prompts():
+    backend = RecordingBackend(drop_last=True)
+    client = LLMClient(backend, batch_size=8, batch_wait=0.01, timeout=5.0)
+    
+    async def run():
+        return await asyncio.gather(
+            *(client.generate(prompt(f"q{i}")) for i in range(3)), return_exceptions=True
+        )
+    
+    started = time.perf_counter()
+    results = asyncio.run(run())
+    assert time.perf_counter() - started < 1.0
+    assert results[:2] == ["re: q0", "re: q1"]
+    assert isinstance(results[2], LLMUnavailableError)
+    assert client.errors == 1
+    assert client.pending == 0
@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.models.models import Prediction, User, UserSkill
+from backend.services.prediction_service import PredictionService
+
+
+def skills(*pairs):
+    return [UserSkill(skill_name=name, proficiency=proficiency) for name, proficiency in pairs]
+
+
+@pytest.fixture
+def user_ids(db):
+    users = [User(email=f"user{i}@example.com", name="Test", password_hash="x") for i in range(2)]
+    db.add_all(users)
+    db.commit()
+    return [user.id for user in users]
+
+
+def add_snapshot(db, user_id, days_ago, skills_hash="h"):
+    snapshot = Prediction(
+        user_id=user_id,
+        skills_hash=skills_hash,
+        career_matches=[],
+        readiness_score=50.0,
+        created_at=datetime.utcnow() - timedelta(days=days_ago)
+    )
+    db.add(snapshot)
+    db.commit()
+    return snapshot.id
+
+
+def test_skills_hash_ignores_order_case_and_whitespace():
+    a = PredictionService.compute_skills_hash(skills(("Python", 80), ("SQL", 60)), "v1")
+    b = PredictionService.compute_skills_hash(skills(("sql ", 60.0), (" python", 80)), "v1")
+    assert a == b
+
+
+def test_skills_hash_changes_with_skills_and_dataset_version():
+    base = PredictionService.compute_skills_hash(skills(("Python", 80)), "v1")
+    assert PredictionService.compute_skills_hash(skills(("Python", 81)), "v1") != base
+    assert PredictionService.compute_skills_hash(skills(("Python", 80), ("SQL", 0)), "v1") != base
+    assert PredictionService.compute_skills_hash(skills(("Python", 80)), "v2") != base
+
+
+def test_current_snapshot_hits_only_for_the_latest_hash(db, user_ids):
+    user_id = user_ids[0]
+    assert PredictionService.get_current_snapshot(db, user_id, "old") is None
+
+    PredictionService.save_snapshot(db, user_id, "old", [], 40.0)
+    assert PredictionService.get_current_snapshot(db, user_id, "old").readiness_score == 40.0
+    assert PredictionService.get_current_snapshot(db, user_id, "new") is None
+
+    PredictionService.save_snapshot(db, user_id, "new", [], 60.0)
+    # An older snapshot with a matching hash is not current any more
+    assert PredictionService.get_current_snapshot(db, user_id, "old") is None
+    assert PredictionService.get_current_snapshot(db, user_id, "new").readiness_score == 60.0
+    assert PredictionService.get_current_snapshot(db, user_ids[1], "new") is None
+
+
+def test_compaction_keeps_the_newest_rows_per_user(db, user_ids):
+    first, second = user_ids
+    recent = [add_snapshot(db, first, days_ago) for days_ago in (5, 4, 3, 2, 1)]
+    # Only old snapshots; the newest must survive the age cutoff
+    old = [add_snapshot(db, second, days_ago) for days_ago in (400, 300, 200)]
+
+    deleted = PredictionService.compact_snapshots(db, keep_latest=3, max_age_days=90)
+
+    remaining = {
+        (row.user_id, row.id) for row in db.query(Prediction.user_id, Prediction.id).all()
+    }
+    assert deleted == 4
+    assert remaining == {(first, id_) for id_ in recent[2:]} | {(second, old[-1])}
+    assert PredictionService.get_latest_snapshot(db, first).id == recent[-1]
+    assert PredictionService.compact_snapshots(db, keep_latest=3, max_age_days=90) == 0
@@ -0,0 +1,93 @@
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from backend import prerendered as prerendered_module
+from backend.data_loaders.registry import DatasetRegistry
+from backend.prerendered import PrerenderedResponses, choose_encoding, matches_etag, render
+
+PAYLOAD = [{"id": i, "question": "Explain the difference between var, let, and const"} for i in range(50)]
+
+
+def test_each_coding_has_its_own_etag():
+    prerendered = render(PAYLOAD)
+    assert {"identity", "gzip"} <= set(prerendered.bodies)
+    tags = {prerendered.etag(encoding) for encoding in prerendered.bodies}
+    assert len(tags) == len(prerendered.bodies)
+    assert prerendered.etag("identity") == f'"{prerendered.digest}"'
+    assert prerendered.etag("gzip") == f'"{prerendered.digest}-gzip"'
+
+
+def test_tiny_payloads_are_not_compressed():
+    assert set(render({"a": 1}).bodies) == {"identity"}
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("", "identity"),
+    ("gzip", "gzip"),
+    ("gzip;q=0", "identity"),
+    ("identity, gzip;q=0.5", "gzip"),
+    ("*", "gzip"),
+    ("*;q=0", "identity"),
+    ("gzip;q=0, *", "identity"),
+])
+def test_choose_encoding(accept_encoding, expected):
+    prerendered = render(PAYLOAD)
+    prerendered.bodies.pop("br", None)
+    assert choose_encoding(prerendered, accept_encoding) == expected
+
+
+def test_choose_encoding_prefers_brotli_unless_excluded():
+    prerendered = render(PAYLOAD)
+    prerendered.bodies["br"] = b"compressed"
+    assert choose_encoding(prerendered, "gzip, br") == "br"
+    assert choose_encoding(prerendered, "gzip, br;q=0") == "gzip"
+    assert choose_encoding(prerendered, "br;q=0, *") == "gzip"
+
+
+def test_matches_etag():
+    prerendered = render(PAYLOAD)
+    assert matches_etag(prerendered, prerendered.etag("identity"))
+    assert matches_etag(prerendered, prerendered.etag("gzip"))
+    assert matches_etag(prerendered, f'"other", W/{prerendered.etag("gzip")}')
+    assert matches_etag(prerendered, "*")
+    assert not matches_etag(prerendered, '"other", "other-gzip"')
+
+
+@pytest.fixture
+def client(monkeypatch):
+    registry = DatasetRegistry()
+    registry.register("questions", lambda: object())
+    monkeypatch.setattr(prerendered_module, "dataset_registry", registry)
+    responses = PrerenderedResponses(max_entries=4)
+    app = FastAPI()
+
+    @app.get("/questions")
+    def questions(request: Request):
+        return responses.respond(request, "questions", "questions", lambda: PAYLOAD)
+
+    return TestClient(app), responses
+
+
+def test_if_none_match_returns_304(client):
+    client, responses = client
+    first = client.get("/questions", headers={"Accept-Encoding": "gzip"})
+    assert first.status_code == 200
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.headers["vary"] == "Accept-Encoding"
+    assert first.json() == PAYLOAD
+
+    revalidated = client.get("/questions", headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == first.headers["etag"]
+
+    # A tag for another coding of the same payload still matches
+    plain = client.get("/questions", headers={"Accept-Encoding": "identity", "If-None-Match": first.headers["etag"]})
+    assert plain.status_code == 304
+    assert plain.headers["etag"] != first.headers["etag"]
+
+    changed = client.get("/questions", headers={"Accept-Encoding": "identity", "If-None-Match": '"stale"'})
+    assert changed.status_code == 200
+    assert "content-encoding" not in changed.headers
+    assert responses.stats() == {"entries": 1, "hits": 3, "renders": 1, "not_modified": 2}
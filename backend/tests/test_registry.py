@@ -0,0 +1,105 @@
+import pytest
+
+from backend.data_loaders.registry import DatasetRegistry
+
+
+class Loader:
+    def __init__(self, generation):
+        self.generation = generation
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("v1")
+    return path
+
+
+def make_registry(source, factory):
+    registry = DatasetRegistry()
+    dataset = registry.register("data", factory, sources=lambda: [str(source)])
+    return registry, dataset
+
+
+def counting_factory():
+    built = []
+
+    def factory():
+        built.append(len(built) + 1)
+        return Loader(built[-1])
+    
+    return factory, built
+
+
+def test_resolve_keeps_one_version_inside_pinned(source):
+    factory, _ = counting_factory()
+    registry, dataset = make_registry(source, factory)
+
+    with registry.pinned():
+        assert dataset.generation == 1
+        registry.reload("data")
+        assert dataset.generation == 1
+        assert registry.resolve("data") is registry.resolve("data")
+    assert dataset.generation == 2
+
+
+def test_reload_swaps_versions_and_fires_hooks(source):
+    factory, _ = counting_factory()
+    registry, _ = make_registry(source, factory)
+    reloaded = []
+    registry.on_reload(reloaded.append)
+
+    first = registry.current("data")
+    source.write_text("version two")
+    registry.reload("data")
+    second = registry.current("data")
+
+    assert (first.loader.generation, second.loader.generation) == (1, 2)
+    assert first.version != second.version
+    assert reloaded == ["data"]
+    assert registry.stats()["data"]["reloads"] == 1
+
+
+def test_check_for_changes_waits_for_two_stable_polls(source):
+    factory, _ = counting_factory()
+    registry, dataset = make_registry(source, factory)
+    registry.current("data")
+
+    assert registry.check_for_changes() == []
+    source.write_text("version two")
+    assert registry.check_for_changes() == []
+    # Still being written: the fingerprint moved again, so the wait restarts
+    source.write_text("version two, complete")
+    assert registry.check_for_changes() == []
+    assert registry.check_for_changes() == ["data"]
+    assert dataset.generation == 2
+    assert registry.check_for_changes() == []
+
+
+def test_check_for_changes_does_not_retry_a_failed_version(source, capsys):
+    calls = []
+
+    def reload_factory():
+        calls.append(1)
+        raise ValueError("bad file")
+
+    registry = DatasetRegistry()
+    dataset = registry.register(
+        "data", lambda: Loader(1), sources=lambda: [str(source)], reload_factory=reload_factory
+    )
+    registry.current("data")
+
+    source.write_text("broken")
+    registry.check_for_changes()
+    assert registry.check_for_changes() == []
+    assert registry.check_for_changes() == []
+    assert registry.check_for_changes() == []
+    assert len(calls) == 1
+    assert dataset.generation == 1
+    assert "Error reloading dataset data" in capsys.readouterr().out
+
+    # A later change is tried again
+    source.write_text("fixed, but still failing")
+    registry.check_for_changes()
+    registry.check_for_changes()
+    assert len(calls) == 2
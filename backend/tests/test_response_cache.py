@@ -0,0 +1,44 @@
+from backend.response_cache import SemanticResponseCache, normalize_message
+
+
+def make_cache():
+    return SemanticResponseCache(max_entries=8, ttl=60, threshold=0.8)
+
+
+def test_near_duplicate_messages_hit():
+    cache = make_cache()
+    cache.store("p", "how do I improve my readiness score", "reply")
+    assert cache.lookup("p", "improve score?") == "reply"
+    assert cache.lookup("p", "How do I improve my readiness scores") == "reply"
+
+
+def test_contractions_normalize_to_not():
+    assert normalize_message("Don't learn Python") == ["learn", "not", "python"]
+    assert normalize_message("I can't learn Python") == normalize_message("I cannot learn Python")
+
+
+def test_negated_message_misses_positive_entry():
+    cache = make_cache()
+    cache.store("p", "Should I learn Python for data science", "learn it")
+    assert cache.lookup("p", "Should I learn Python for data science?") == "learn it"
+    for message in (
+        "Should I not learn Python for data science",
+        "Should I never learn Python for data science",
+        "Should I avoid learning Python for data science",
+        "I don't want to learn Python for data science",
+    ):
+        assert cache.lookup("p", message) is None, message
+
+
+def test_positive_message_misses_negated_entry():
+    cache = make_cache()
+    cache.store("p", "Should I not learn Python for data science", "skip it")
+    assert cache.lookup("p", "Should I learn Python for data science") is None
+    assert cache.lookup("p", "should i NOT learn python for data science") == "skip it"
+
+
+def test_partitions_are_isolated():
+    cache = make_cache()
+    cache.store("a", "how do I improve my readiness score", "reply")
+    assert cache.lookup("b", "how do I improve my readiness score") is None
+    assert cache.stats()["hits"] == 0
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from backend.database import engine
+from backend.models.models import User, UserCourseProgress
+from backend.schemas.roadmap import CourseProgressBulkUpdate, CourseProgressUpdate
+from backend.services.roadmap_service import RoadmapService
+
+
+@pytest.fixture
+def user_id(db):
+    user = User(email="roadmap@example.com", name="Test", password_hash="x")
+    db.add(user)
+    db.commit()
+    return user.id
+
+
+def roadmap_courses(db, user_id):
+    roadmap = json.loads(RoadmapService.get_learning_roadmap(db, user_id))
+    return {course["id"]: course for stage in roadmap["stages"] for course in stage["courses"]}, roadmap["stats"]
+
+
+@pytest.fixture(params=["native", "delete-insert"])
+def upsert_path(request, monkeypatch):
+    """Run with the dialect's ON CONFLICT upsert and with the portable fallback."""
+    if request.param == "delete-insert":
+        monkeypatch.setattr(engine.dialect, "name", "generic")
+    return request.param
+
+
+def test_save_course_progress_is_an_idempotent_upsert(db, user_id, upsert_path):
+    first, second = RoadmapService.get_roadmap_skeleton()[0].course_ids[:2]
+    updates = [
+        CourseProgressUpdate(course_id=first, progress=30, status="in-progress"),
+        CourseProgressUpdate(course_id=second, progress=50, status="in-progress"),
+        # A later update to the same course wins
+        CourseProgressUpdate(course_id=first, progress=100, status="completed"),
+    ]
+
+    for _ in range(2):
+        saved = RoadmapService.save_course_progress(db, user_id, updates)
+        assert [(course.id, course.status) for course in saved] == [
+            (first, "completed"), (second, "in-progress"), (first, "completed")
+        ]
+        rows = db.query(UserCourseProgress).filter(UserCourseProgress.user_id == user_id).all()
+        assert sorted((row.status, row.progress) for row in rows) == [("completed", 100), ("in-progress", 50)]
+
+    courses, stats = roadmap_courses(db, user_id)
+    assert (courses[first]["status"], courses[first]["progress"]) == ("completed", 100)
+    assert (courses[second]["status"], courses[second]["progress"]) == ("in-progress", 50)
+    assert (stats["courses_completed"], stats["courses_in_progress"]) == (1, 1)
+
+    # Saving again replaces the values and the cached roadmap
+    RoadmapService.save_course_progress(db, user_id, [CourseProgressUpdate(course_id=first, progress=10, status="in-progress")])
+    courses, stats = roadmap_courses(db, user_id)
+    assert (courses[first]["status"], courses[first]["progress"]) == ("in-progress", 10)
+    assert db.query(UserCourseProgress).filter(UserCourseProgress.user_id == user_id).count() == 2
+
+
+def test_unknown_course_saves_nothing(db, user_id):
+    first = RoadmapService.get_roadmap_skeleton()[0].course_ids[0]
+    with pytest.raises(ValueError, match="Course 999999 not found"):
+        RoadmapService.save_course_progress(db, user_id, [
+            CourseProgressUpdate(course_id=first, progress=30, status="in-progress"),
+            CourseProgressUpdate(course_id=999999, progress=30, status="in-progress"),
+        ])
+    assert db.query(UserCourseProgress).count() == 0
+
+
+def test_bulk_update_accepts_1_to_500_items():
+    update = {"course_id": 0, "progress": 10, "status": "in-progress"}
+    assert len(CourseProgressBulkUpdate(updates=[update] * 500).updates) == 500
+    for size in (0, 501):
+        with pytest.raises(ValidationError):
+            CourseProgressBulkUpdate(updates=[update] * size)
@@ -0,0 +1,38 @@
+import pytest
+from sqlalchemy import event, insert
+
+from backend.database import engine
+from backend.models.models import User, UserSkill
+from backend.schemas.user import UserSkillCreate, UserSkillUpdate
+from backend.services.user_service import DuplicateSkillError, UserService
+
+
+@pytest.fixture
+def user_id(db):
+    user = User(email="skills@example.com", name="Test", password_hash="x")
+    db.add(user)
+    db.commit()
+    return user.id
+
+
+def test_add_skill_updates_a_skill_added_concurrently(db, user_id):
+    @event.listens_for(db, "before_flush", once=True)
+    def add_competing_skill(session, flush_context, instances):
+        # Another request inserts the same skill after our existence check
+        with engine.begin() as connection:
+            connection.execute(insert(UserSkill), {"user_id": user_id, "skill_name": "Python", "proficiency": 40})
+
+    skill = UserService.add_skill(db, user_id, UserSkillCreate(skill_name="Python", proficiency=80))
+
+    skills = db.query(UserSkill).filter(UserSkill.user_id == user_id).all()
+    assert [(s.id, s.skill_name, s.proficiency) for s in skills] == [(skill.id, "Python", 80)]
+
+
+def test_renaming_onto_an_existing_skill_is_a_duplicate(db, user_id):
+    UserService.add_skill(db, user_id, UserSkillCreate(skill_name="Python", proficiency=50))
+    sql = UserService.add_skill(db, user_id, UserSkillCreate(skill_name="SQL", proficiency=50))
+
+    with pytest.raises(DuplicateSkillError):
+        UserService.update_skill(db, user_id, sql.id, UserSkillUpdate(skill_name="Python"))
+    with pytest.raises(ValueError, match="Skill not found"):
+        UserService.update_skill(db, user_id, sql.id + 100, UserSkillUpdate(proficiency=10))